@@ -0,0 +1,84 @@
+"""
+Character creation benchmarks
+
+Printer - October 2026
+
+Times input handling in the chargen menu and the name checks behind it with a populated character table. The number of
+existing characters can be set with `BENCHMARK_CHARACTERS`.
+"""
+
+import os
+from itertools import cycle
+from math import ceil
+from unittest.mock import patch
+
+from django.conf import settings
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from benchmarks.harness import BenchmarkMixin
+from server.conf.settings import CHARGEN_MENU
+from systems.login import name_checks
+from systems.login.chargen_menu import ChargenEvMenu, name_validator
+from systems.login.reservations import reserve_name
+from world.population import generate_world
+
+EXISTING_CHARACTERS = int(os.environ.get("BENCHMARK_CHARACTERS", 100))
+
+_CHARGEN_INPUTS = (
+    "first Clark",
+    "last Kent",
+    "email clark@dailyplanet.com",
+    "pronouns he him his",
+    "race metahuman",
+    "tier 4",
+    "birthday 1985 06 18",
+    "feet 6",
+    "hair black",
+    "intro A mild-mannered reporter",
+)
+
+
+class ChargenBenchmarks(BenchmarkMixin, EvenniaTest):
+    """Benchmarks for the chargen menu with `EXISTING_CHARACTERS` characters already made"""
+
+    benchmark_rounds = 50
+
+    def setUp(self):
+        super().setUp()
+        generate_world(rooms=10, accounts=ceil(EXISTING_CHARACTERS / settings.MAX_NR_CHARACTERS),
+                       characters=EXISTING_CHARACTERS, seed=0)
+
+        self.new_char = create.create_object(self.character_typeclass, key="NewCharacter", nohome=True)
+        self.new_char.db.chargen_step = "node_chargen"
+        self.session.new_char = self.new_char
+
+        # Name checks are debounced with the reactor, which doesn't run during tests
+        patcher = patch.object(name_checks.reactor, "callLater")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_node_chargen_input(self):
+        """Changing a field on the chargen sheet and redrawing it"""
+        ChargenEvMenu(self.session, CHARGEN_MENU, startnode="node_chargen")
+        menu = self.session.ndb._evmenu
+        inputs = cycle(_CHARGEN_INPUTS)
+        self.benchmark.pedantic(lambda: menu.parse_input(next(inputs)), rounds=self.benchmark_rounds,
+                                iterations=len(_CHARGEN_INPUTS))
+        self.assertEqual(menu.nodename, "node_chargen")
+        # Inputs chargen refuses would time its error path instead of the edit
+        data = menu.node_kwargs["data"]
+        self.assertEqual((data.birth_year, data.birth_month, data.birth_day), (1985, 6, 18))
+        self.assertEqual((data.first_name, data.tier, data.intro), ("Clark", 4, "A mild-mannered reporter"))
+
+    def test_name_validator(self):
+        """Checking a name's format and whether it's taken"""
+        available = self.benchmark(name_validator, self.session, "Clark", "Kent")
+        self.assertTrue(available)
+
+    def test_reserve_name(self):
+        """Leasing a name for the character being created"""
+        names = cycle((("Clark", "Kent"), ("Bruce", "Wayne")))
+        holder = self.benchmark.pedantic(lambda: reserve_name(self.new_char.id, *next(names)),
+                                         rounds=self.benchmark_rounds)
+        self.assertEqual(holder, self.new_char.id)
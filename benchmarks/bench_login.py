@@ -0,0 +1,96 @@
+"""
+Login benchmarks
+
+Printer - October 2026
+
+Times the `MenuLoginEvMenu` login flow and the account info shown on character selection.
+"""
+
+from functools import partial
+from unittest.mock import patch
+
+import evennia
+from evennia.server.serversession import ServerSession
+from evennia.utils.test_resources import EvenniaTest
+
+from benchmarks.harness import BenchmarkMixin
+from containers.RosterCharacterData import RosterCharacterData
+from systems.login.login import CmdUnloggedinLook
+
+# Session ids for benchmark sessions start here so they don't collide with the test session
+_FIRST_SESSID = 1000
+
+
+class LoginBenchmarks(BenchmarkMixin, EvenniaTest):
+    """Benchmarks for logging in through the login menu"""
+
+    benchmark_rounds = 5
+
+    def setUp(self):
+        super().setUp()
+        entry = RosterCharacterData()
+        entry.name = self.char1.key
+        self.account.db.roster = {self.char1.key.lower(): entry}
+        self.account.characters.add(self.char1)
+        self.sessids = []
+
+        # The login node would otherwise tell the portal about the login over AMP
+        handler = evennia.SESSION_HANDLER
+        patcher = patch.object(handler, "login", partial(type(handler).login, handler, testmode=True))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        # Drop the benchmark sessions first, or deleting the account tries to disconnect them from the portal
+        for sessid in self.sessids:
+            evennia.SESSION_HANDLER.pop(sessid, None)
+        super().tearDown()
+
+    def _new_session(self):
+        """Connects a fresh, unlogged-in session."""
+        session = ServerSession()
+        session.init_session("telnet", ("localhost", "benchmark"), evennia.SESSION_HANDLER)
+        session.sessid = _FIRST_SESSID + len(self.sessids)
+        evennia.SESSION_HANDLER[session.sessid] = session
+        self.sessids.append(session.sessid)
+        return (session,), {}
+
+    def _login(self, session):
+        """Goes through the whole login menu, from the connection screen to playing a character."""
+        look = CmdUnloggedinLook()
+        look.caller = session
+        look.func()
+        menu = session.ndb._evmenu
+        menu.parse_input(self.account.username)
+        menu.parse_input("testpassword")
+        menu.parse_input(self.char1.key)
+        return session
+
+    def test_login_flow(self):
+        """Connecting, entering an account name and password, and picking a character"""
+        session = self.benchmark.pedantic(self._login, setup=self._new_session, rounds=self.benchmark_rounds)
+        self.assertTrue(session.logged_in)
+        self.assertEqual(session.puppet, self.char1)
+
+
+class ShowLoginInfoBenchmarks(BenchmarkMixin, EvenniaTest):
+    """Benchmarks for the account info shown after logging in"""
+
+    benchmark_rounds = 50
+
+    def setUp(self):
+        super().setUp()
+        roster = {}
+        for num in range(10):
+            entry = RosterCharacterData()
+            entry.name = f"Character {num}"
+            entry.tier = num % 5 + 1
+            entry.archetype = "`cBystander"
+            entry.modifier = "Gifted" if num % 2 else None
+            roster[f"character{num}"] = entry
+        self.account.db.roster = roster
+
+    def test_show_login_info(self):
+        """Listing an account's roster"""
+        text = self.benchmark(self.account.show_login_info)
+        self.assertIn("Character 9", text)
@@ -0,0 +1,63 @@
+"""
+Rendering benchmarks
+
+Printer - October 2026
+
+Times tick color translation of the enum strings and connection screen, and the `utils.string` helpers.
+"""
+
+import unittest
+
+from evennia.utils.ansi import parse_ansi
+
+from benchmarks.harness import BenchmarkMixin
+from constants.character import Eyes, Hair, Race
+from server.conf.connection_screens import CONNECTION_SCREEN
+from utils import string
+from utils.tick_colors import tick_to_ansi
+
+_ENUM_STRINGS = [member.value for enum in (Eyes, Hair, Race) for member in enum]
+
+
+class TickColorBenchmarks(BenchmarkMixin, unittest.TestCase):
+    """Benchmarks for translating tick color markup to ANSI"""
+
+    benchmark_rounds = 200
+
+    def test_parse_ansi_enum_strings(self):
+        """Evennia's parser on every eye, hair and race string"""
+        self.benchmark(lambda: [parse_ansi(text, xterm256=True) for text in _ENUM_STRINGS])
+
+    def test_tick_to_ansi_enum_strings(self):
+        """Our direct translation on every eye, hair and race string"""
+        self.benchmark(lambda: [tick_to_ansi(text) for text in _ENUM_STRINGS])
+
+    def test_parse_ansi_connection_screen(self):
+        """Evennia's parser on the connection screen"""
+        self.benchmark(parse_ansi, CONNECTION_SCREEN, xterm256=True)
+
+    def test_tick_to_ansi_connection_screen(self):
+        """Our direct translation of the connection screen"""
+        self.benchmark(tick_to_ansi, CONNECTION_SCREEN)
+
+
+class StringHelperBenchmarks(BenchmarkMixin, unittest.TestCase):
+    """Benchmarks for the `utils.string` helpers"""
+
+    benchmark_rounds = 200
+
+    def test_title_case(self):
+        self.benchmark(string.title_case, "the return of the man of steel")
+
+    def test_listify(self):
+        self.benchmark(string.listify, ["red", "green", "blue", "yellow"])
+
+    def test_dollar_int(self):
+        self.benchmark(string.dollar_int, 123456789)
+
+    def test_number_argument(self):
+        self.benchmark(string.number_argument, "2.sword 'old chest'")
+
+    def test_inflect_helpers(self):
+        self.benchmark(lambda: (string.pluralize("hero"), string.get_article("alien"), string.ordinal(23),
+                                string.literal_num(1985)))
@@ -0,0 +1,94 @@
+"""
+Character constants microbenchmarks
+
+Printer - October 2026
+
+Compares the lookup tables in `constants.character` against the per-call implementations they replaced. Run from the
+game directory with:
+
+    python -m benchmarks.character_constants
+"""
+
+from timeit import repeat
+
+from constants.character import Eyes, Hair, Race
+
+
+def legacy_race_tier_range(race: Race) -> tuple[int, int]:
+    """The `match` based `Race.race_tier_range` that rebuilt the range on every call."""
+    match race:
+        case Race.HUMAN:
+            return 1, 5
+        case Race.METAHUMAN | Race.MAGICKER | Race.ALIEN | Race.SYNTHETIC:
+            return 2, 5
+        case Race.AVALONIAN | Race.DIVER:
+            return 3, 5
+
+
+def legacy_valid_race_tier(race: Race, tier: int) -> bool:
+    """The old `Race.valid_race_tier`, which looked the range up twice."""
+    return legacy_race_tier_range(race)[0] <= tier <= legacy_race_tier_range(race)[1]
+
+
+def legacy_archetype(race: Race, tier: int, use_color: bool = True) -> str:
+    """The old `Race.archetype`, which built a new tier list on every call."""
+    if not legacy_valid_race_tier(race, tier):
+        raise ValueError(f"Invalid tier {tier} for race {race.name.capitalize()}.")
+    match race:
+        case Race.HUMAN:
+            tiers = ["", "Bystander", "Regular Person", "Important Person", "Dedicated Human", "'Super'Human"]
+            color = "`c"
+        case Race.METAHUMAN:
+            tiers = ["", "", "Rookie Metahuman", "Metahuman", "Veteran Metahuman", "S-Class Metahuman"]
+            color = "`W"
+        case Race.MAGICKER:
+            tiers = ["", "", "Dabbler", "Practitioner", "Magician", "Supreme"]
+            color = "`R"
+        case Race.ALIEN:
+            tiers = ["", "", "Rookie Alien", "Alien", "Veteran Alien", "Higher Lifeform"]
+            color = "`G"
+        case Race.SYNTHETIC:
+            tiers = ["", "", "Prototype Synthetic", "Synthetic", "Advanced Synthetic", "Perfect Synthetic"]
+            color = "`D"
+        case Race.AVALONIAN:
+            tiers = ["", "", "", "Avalonian", "Avalonian Knight", "Avalonian Noble"]
+            color = "`C"
+        case Race.DIVER:
+            tiers = ["", "", "", "Diver", "Veteran Diver", "Elder Diver"]
+            color = "`Y"
+    color = color if use_color else "`x"
+    return f"{color}{tiers[tier]}`x"
+
+
+def legacy_is_valid(enum, color: str) -> bool:
+    """The old `Eyes.is_valid`/`Hair.is_valid`, which scanned every member."""
+    return color.upper() in (member.name for member in enum.__members__.values())
+
+
+CASES = {
+    "archetype": (lambda: legacy_archetype(Race.DIVER, 5), lambda: Race.DIVER.archetype(5)),
+    "valid_race_tier": (lambda: legacy_valid_race_tier(Race.DIVER, 4), lambda: Race.DIVER.valid_race_tier(4)),
+    "Eyes.is_valid": (lambda: legacy_is_valid(Eyes, "white"), lambda: Eyes.is_valid("white")),
+    "Hair.is_valid": (lambda: legacy_is_valid(Hair, "gray"), lambda: Hair.is_valid("gray")),
+}
+
+
+def run(number: int = 100_000, rounds: int = 5) -> dict[str, tuple[float, float]]:
+    """
+    Times each case with the legacy and current implementation.
+    :param number: Calls per round
+    :param rounds: Rounds per implementation; the fastest round is kept
+    :return: A dict mapping each case to its legacy and current time per call in nanoseconds
+    """
+    results = {}
+    for name, (legacy, current) in CASES.items():
+        legacy_time = min(repeat(legacy, number=number, repeat=rounds)) / number * 1e9
+        current_time = min(repeat(current, number=number, repeat=rounds)) / number * 1e9
+        results[name] = legacy_time, current_time
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'case':<18}{'legacy ns':>12}{'table ns':>12}{'speedup':>10}")
+    for name, (legacy_time, current_time) in run().items():
+        print(f"{name:<18}{legacy_time:>12.1f}{current_time:>12.1f}{legacy_time / current_time:>9.1f}x")
@@ -0,0 +1,180 @@
+"""
+Benchmark harness
+
+Printer - October 2026
+
+A small pytest-benchmark style harness for timing hot paths inside Evennia's test runner, so benchmarks run offline
+against the same throwaway SQLite database as the unit tests. Benchmark modules are named `bench_*.py` so they don't
+run with the regular tests. Run them from the game directory with:
+
+    evennia test --settings settings.py benchmarks --pattern "bench_*.py"
+
+Results are written as JSON to `BENCHMARK_OUTPUT` (default `benchmarks/results.json`) along with a comparison against
+the stored baseline at `BENCHMARK_BASELINE` (default `benchmarks/baseline.json`). Benchmarks that need a populated
+database build it with `world.population.generate_world`.
+
+Environment variables:
+    BENCHMARK_SAVE_BASELINE=1 - Also save this run as the new baseline.
+    BENCHMARK_FAIL_THRESHOLD=N - Fail a benchmark whose median is more than N percent slower than the baseline.
+"""
+
+import atexit
+import json
+import os
+import platform
+import statistics
+from datetime import datetime, timezone
+from time import perf_counter
+
+_BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.environ.get("BENCHMARK_OUTPUT", os.path.join(_BENCHMARK_DIR, "results.json"))
+BASELINE_PATH = os.environ.get("BENCHMARK_BASELINE", os.path.join(_BENCHMARK_DIR, "baseline.json"))
+FAIL_THRESHOLD = float(os.environ["BENCHMARK_FAIL_THRESHOLD"]) if os.environ.get("BENCHMARK_FAIL_THRESHOLD") else None
+
+# Maps each benchmark's full name to its stats for this run
+_RESULTS: dict[str, dict] = {}
+
+
+def _load_baseline() -> dict[str, dict]:
+    """Returns the stats of each benchmark in the stored baseline, or an empty dict if there isn't one."""
+    try:
+        with open(BASELINE_PATH) as baseline_file:
+            return {bench["fullname"]: bench["stats"] for bench in json.load(baseline_file)["benchmarks"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+_BASELINE = _load_baseline()
+
+
+def compare(stats: dict, baseline: dict | None) -> float | None:
+    """
+    Compares a benchmark's median against its baseline.
+    :param stats: Stats from this run
+    :param baseline: Stats from the baseline, if the benchmark was in it
+    :return: The percent change in the median, where positive is slower, or `None` if there's no baseline
+    """
+    if not baseline or not baseline.get("median"):
+        return None
+    return (stats["median"] - baseline["median"]) / baseline["median"] * 100
+
+
+def _report():
+    """Writes the results of this run and prints the comparison with the baseline."""
+    if not _RESULTS:
+        return
+
+    benchmarks = []
+    for fullname, stats in sorted(_RESULTS.items()):
+        change = compare(stats, _BASELINE.get(fullname))
+        benchmarks.append({
+            "name": fullname.rsplit(".", 1)[-1],
+            "fullname": fullname,
+            "stats": stats,
+            "baseline": _BASELINE.get(fullname),
+            "change_percent": change,
+        })
+    output = {
+        "machine_info": {
+            "node": platform.node(),
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+    }
+    with open(OUTPUT_PATH, "w") as output_file:
+        json.dump(output, output_file, indent=2)
+    if os.environ.get("BENCHMARK_SAVE_BASELINE"):
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(output, baseline_file, indent=2)
+
+    print(f"\n{'benchmark':<72}{'median us':>12}{'baseline us':>14}{'change':>10}")
+    for bench in benchmarks:
+        baseline = f"{bench['baseline']['median'] * 1e6:.1f}" if bench["baseline"] else "-"
+        change = f"{bench['change_percent']:+.1f}%" if bench["change_percent"] is not None else "-"
+        print(f"{bench['fullname'].removeprefix('benchmarks.'):<72}{bench['stats']['median'] * 1e6:>12.1f}{baseline:>14}{change:>10}")
+    print(f"Results written to {OUTPUT_PATH}")
+
+
+atexit.register(_report)
+
+
+class Benchmark:
+    """
+    Times a callable over several rounds, in the style of pytest-benchmark's `benchmark` fixture. Each benchmark test
+    gets one of these as `self.benchmark`.
+    """
+
+    def __init__(self, fullname: str, rounds: int = 20, warmup_rounds: int = 1):
+        self.fullname = fullname
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.stats = None
+
+    def __call__(self, func, *args, **kwargs):
+        """Times `func(*args, **kwargs)` with the default rounds and returns its result."""
+        return self.pedantic(func, args=args, kwargs=kwargs)
+
+    def pedantic(self, func, args=(), kwargs=None, setup=None, rounds=None, iterations=1, warmup_rounds=None):
+        """
+        Times `func` with full control over how it's run.
+        :param func: The callable to time
+        :param args: Positional arguments for `func`
+        :param kwargs: Keyword arguments for `func`
+        :param setup: Called untimed before every round. If it returns a tuple of (args, kwargs), those are used for
+            that round instead.
+        :param rounds: How many timed rounds to run
+        :param iterations: How many times `func` is called per round
+        :param warmup_rounds: How many untimed rounds to run first
+        :return: The result of the last call to `func`
+        """
+        kwargs = kwargs or {}
+        rounds = rounds or self.rounds
+        warmup_rounds = self.warmup_rounds if warmup_rounds is None else warmup_rounds
+        result = None
+        timings = []
+        for round_num in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs
+            if setup and (prepared := setup()):
+                round_args, round_kwargs = prepared
+            start = perf_counter()
+            for _ in range(iterations):
+                result = func(*round_args, **round_kwargs)
+            elapsed = (perf_counter() - start) / iterations
+            if round_num >= warmup_rounds:
+                timings.append(elapsed)
+
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": rounds,
+            "iterations": iterations,
+        }
+        _RESULTS[self.fullname] = self.stats
+        return result
+
+
+class BenchmarkMixin:
+    """
+    Mixin for test cases made of benchmarks. Every test gets its own `self.benchmark`, and a benchmark that regresses
+    past `BENCHMARK_FAIL_THRESHOLD` fails its test.
+    """
+
+    benchmark_rounds = 20
+
+    def setUp(self):
+        super().setUp()
+        self.benchmark = Benchmark(self.id(), rounds=self.benchmark_rounds)
+
+    def tearDown(self):
+        stats = self.benchmark.stats
+        super().tearDown()
+        if stats and FAIL_THRESHOLD is not None:
+            change = compare(stats, _BASELINE.get(self.benchmark.fullname))
+            if change is not None and change > FAIL_THRESHOLD:
+                self.fail(f"{self.benchmark.fullname} is {change:.1f}% slower than the baseline.")
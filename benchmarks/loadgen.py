@@ -0,0 +1,442 @@
+"""
+Login and chargen load generator
+
+Printer - October 2026
+
+Opens waves of concurrent telnet and websocket connections against a running server. Each client is scripted through the
+login menu and character creation: a new account and password, or an existing account followed by `create`, then every
+chargen field, `done`, and finally being put in control of the new character. The latency of each step is recorded,
+along with the server's reactor lag from the `reactor_lag` input function, and the throughput of each wave is reported as
+concurrency increases.
+
+Run it from the game directory against a local server:
+
+    python -m benchmarks.loadgen --concurrency 10,50,100,200 --protocol mixed
+
+The `existing` flow logs into accounts made by `evennia generate_world`, which must have a free character slot.
+
+The server throttles connections and account creation per IP, which caps load from one machine long before the server
+itself degrades. Raise `MAX_CONNECTION_RATE`, `MAX_CONNECTIONS_PER_IP`, `CREATION_THROTTLE_LIMIT` and
+`LOGIN_THROTTLE_LIMIT` in the server's `secret_settings.py` before load testing.
+"""
+
+import argparse
+import json
+import random
+import re
+import string
+import sys
+from html import unescape
+from time import monotonic
+
+from autobahn.twisted.websocket import WebSocketClientFactory, WebSocketClientProtocol
+from twisted.conch.telnet import TelnetProtocol, TelnetTransport
+from twisted.internet import defer, reactor, task
+from twisted.internet.endpoints import TCP4ClientEndpoint
+from twisted.internet.protocol import Factory
+
+# These match the defaults in `world.population`, so the existing flow can log into a generated world
+DEFAULT_PREFIX = "loadtest"
+DEFAULT_PASSWORD = "loadtestpassword"
+
+_ANSI_REGEX = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_HTML_TAG_REGEX = re.compile(r"<[^>]+>")
+
+# The chargen fields each client fills in, as (step name, input, expected output) triples. The name is filled in per
+# client. Edits whose result can be told apart from the default wait for it on the redrawn sheet.
+_CHARGEN_SHEET = r"In Character Creation"
+_CHARGEN_EDITS = (
+    ("first name", "first {first_name}", _CHARGEN_SHEET),
+    ("last name", "last Loadtest", _CHARGEN_SHEET),
+    ("email", "email {first_name}@example.com", _CHARGEN_SHEET),
+    ("pronouns", "pronouns they them their", _CHARGEN_SHEET),
+    ("race", "race human", _CHARGEN_SHEET),
+    ("tier", "tier 1", _CHARGEN_SHEET),
+    ("birthday", "birthday 1990 01 01", r"Birthday: 1990 1 1 \("),
+    ("hair", "hair black", _CHARGEN_SHEET),
+    ("eyes", "eyes brown", _CHARGEN_SHEET),
+    ("intro", "intro A load test character", _CHARGEN_SHEET),
+)
+# What chargen says when it turns an edit down, which fails the step instead of counting the redrawn sheet as a pass
+_CHARGEN_ERROR = r"Invalid |must be at least|Valid \w+ colors"
+
+
+class Step:
+    """A line a client sends, and the output that means the server has finished responding to it."""
+
+    def __init__(self, name: str, send: str | None, expect: str, reject: str | None = None):
+        self.name = name
+        # `None` waits for more output from the previous input without sending anything
+        self.send = send
+        self.expect = re.compile(expect)
+        # Output that means the input was refused
+        self.reject = re.compile(reject) if reject else None
+
+
+def login_steps(flow: str, username: str, password: str, first_name: str) -> list[Step]:
+    """
+    Builds the steps a client takes from connecting until it's playing its new character.
+    :param flow: "new" to create an account, or "existing" to log into one and use `create`
+    :param username: The account name
+    :param password: The account password
+    :param first_name: A unique first name for the character
+    :return: The steps in order
+    """
+    steps = [Step("connect", None, r"What is your account name\?")]
+    if flow == "new":
+        steps += [
+            Step("username", username, r"Create a new account"),
+            Step("confirm", "y", r"new password for"),
+            # New accounts are sent to character creation on their first login
+            Step("password", password, _CHARGEN_SHEET),
+        ]
+    else:
+        steps += [
+            Step("username", username, r"Enter password"),
+            Step("password", password, r"'create'"),
+            Step("create", "create", _CHARGEN_SHEET),
+        ]
+    steps += [Step(name, line.format(first_name=first_name), expect, _CHARGEN_ERROR)
+              for name, line, expect in _CHARGEN_EDITS]
+    steps += [
+        # The sheet is redrawn once the name check started by the name edits finishes
+        Step("name check", None, r"is ready to be created"),
+        Step("done", "done", r"You become"),
+    ]
+    return steps
+
+
+def clean_text(text: str) -> str:
+    """Strips ANSI sequences and HTML from server output."""
+    return unescape(_HTML_TAG_REGEX.sub("", _ANSI_REGEX.sub("", text)))
+
+
+class FlowClient:
+    """Output matching shared by the telnet and websocket clients."""
+
+    # Output since the last line was sent
+    received = ""
+    # The (pattern, reject pattern, Deferred) waiting for output, if any
+    waiting = None
+
+    def receive_text(self, text: str):
+        self.received += clean_text(text)
+        self._check_waiting()
+
+    def _check_waiting(self):
+        if not self.waiting:
+            return
+        pattern, reject, waiter = self.waiting
+        if reject and (refused := reject.search(self.received)):
+            self.waiting = None
+            line = self.received[self.received.rfind("\n", 0, refused.start()) + 1:].split("\n", 1)[0]
+            waiter.errback(ValueError(f"Input refused: {line.strip()}"))
+        elif pattern.search(self.received):
+            self.waiting = None
+            waiter.callback(None)
+
+    def expect(self, pattern: re.Pattern, timeout: float, reject: re.Pattern | None = None) -> defer.Deferred:
+        """
+        Returns a Deferred that fires once output since the last input matches `pattern`, or fails if it matches
+        `reject` first.
+        """
+        waiter = defer.Deferred(canceller=lambda _: setattr(self, "waiting", None))
+        waiter.addTimeout(timeout, reactor)
+        self.waiting = (pattern, reject, waiter)
+        self._check_waiting()
+        return waiter
+
+    def send_line(self, line: str):
+        self.received = ""
+        self.write_line(line)
+
+    def write_line(self, line: str):
+        raise NotImplementedError
+
+    def disconnect(self):
+        raise NotImplementedError
+
+    def flow_lost(self, reason):
+        if self.waiting:
+            _, _, waiter = self.waiting
+            self.waiting = None
+            waiter.errback(reason)
+
+
+class TelnetFlowClient(FlowClient, TelnetProtocol):
+    """A telnet client. `TelnetTransport` refuses every option the server offers."""
+
+    def dataReceived(self, data: bytes):
+        self.receive_text(data.decode("utf-8", errors="replace"))
+
+    def connectionLost(self, reason):
+        self.flow_lost(reason)
+
+    def write_line(self, line: str):
+        # A bare line feed, since the server can read the CR and LF of CRLF as two lines when they arrive separately
+        self.transport.write(line.encode("utf-8") + b"\n")
+
+    def disconnect(self):
+        self.transport.loseConnection()
+
+
+class WebsocketFlowClient(FlowClient, WebSocketClientProtocol):
+    """A client speaking the webclient's JSON protocol."""
+
+    def onMessage(self, payload, isBinary):
+        cmdname, args, kwargs = json.loads(payload.decode("utf-8"))
+        if cmdname in ("text", "prompt") and args:
+            self.receive_text(args[0])
+
+    def onClose(self, wasClean, code, reason):
+        self.flow_lost(ConnectionError(f"Websocket closed: {reason}"))
+
+    def write_line(self, line: str):
+        self.sendMessage(json.dumps(["text", [line], {}]).encode("utf-8"))
+
+    def disconnect(self):
+        self.sendClose()
+
+
+class LagMonitorClient(WebSocketClientProtocol):
+    """A websocket connection that polls the server's reactor lag."""
+
+    def onOpen(self):
+        self.samples = []
+        self.poller = task.LoopingCall(self.poll)
+        self.poller.start(self.factory.poll_interval)
+
+    def poll(self):
+        message = ["reactor_lag", [], {"window": self.factory.poll_interval}]
+        self.sendMessage(json.dumps(message).encode("utf-8"))
+
+    def onMessage(self, payload, isBinary):
+        cmdname, args, kwargs = json.loads(payload.decode("utf-8"))
+        if cmdname == "reactor_lag":
+            self.samples.append((monotonic(), kwargs))
+
+    def onClose(self, wasClean, code, reason):
+        if getattr(self, "poller", None) and self.poller.running:
+            self.poller.stop()
+
+    def lag_between(self, start: float, end: float) -> dict:
+        """Summarizes the lag samples received between two times."""
+        stats = [sample for sampled, sample in self.samples if start <= sampled <= end and sample.get("samples")]
+        if not stats:
+            return {"mean": None, "max": None}
+        return {"mean": sum(sample["mean"] for sample in stats) / len(stats),
+                "max": max(sample["max"] for sample in stats)}
+
+
+def connect_client(protocol: str, host: str, telnet_port: int, websocket_port: int,
+                   timeout: float) -> defer.Deferred:
+    """
+    Opens one client connection.
+    :param protocol: "telnet" or "websocket"
+    :param host: The server's host
+    :param telnet_port: The server's telnet port
+    :param websocket_port: The server's webclient websocket port
+    :param timeout: Seconds to wait for the connection
+    :return: A Deferred that fires with the connected `FlowClient`
+    """
+    if protocol == "telnet":
+        endpoint = TCP4ClientEndpoint(reactor, host, telnet_port, timeout=timeout)
+        factory = Factory.forProtocol(lambda: TelnetTransport(TelnetFlowClient))
+        return endpoint.connect(factory).addCallback(lambda transport: transport.protocol)
+    factory = WebSocketClientFactory(f"ws://{host}:{websocket_port}")
+    factory.protocol = WebsocketFlowClient
+    endpoint = TCP4ClientEndpoint(reactor, host, websocket_port, timeout=timeout)
+    return endpoint.connect(factory)
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Returns the value at a fraction of the way through the sorted values."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class LoadGenerator:
+    """Runs waves of scripted clients and collects their timings."""
+
+    def __init__(self, options):
+        self.options = options
+        self.run_id = "".join(random.choices(string.ascii_lowercase, k=4))
+        self.client_count = 0
+
+    def _connect(self, protocol: str) -> defer.Deferred:
+        options = self.options
+        return connect_client(protocol, options.host, options.telnet_port, options.websocket_port, options.timeout)
+
+    def _next_identity(self) -> tuple[str, str]:
+        """Returns the account name and character first name for the next client."""
+        num = self.client_count
+        self.client_count += 1
+        if self.options.flow == "new":
+            return f"lg{self.run_id}{num}", f"Lg{self.run_id}{num}"
+        return f"{self.options.prefix}{self.options.account_offset + num}", f"Lg{self.run_id}{num}"
+
+    @defer.inlineCallbacks
+    def run_client(self, protocol: str, delay: float) -> defer.Deferred:
+        """Runs one client through the whole flow and returns its step timings and the step it failed on, if any."""
+        yield task.deferLater(reactor, delay, lambda: None)
+        username, first_name = self._next_identity()
+        steps = login_steps(self.options.flow, username, self.options.password, first_name)
+        timings, failed = {}, None
+        client = None
+        flow_start = start = monotonic()
+        try:
+            client = yield self._connect(protocol)
+            for step in steps:
+                start = monotonic()
+                if step.send is not None:
+                    client.send_line(step.send)
+                yield client.expect(step.expect, self.options.timeout, step.reject)
+                timings[step.name] = monotonic() - start
+            timings["total"] = monotonic() - flow_start
+        except Exception as err:
+            failed = (steps[len(timings)].name if len(timings) < len(steps) else "total", repr(err))
+        finally:
+            if client:
+                client.disconnect()
+        return timings, failed
+
+    @defer.inlineCallbacks
+    def run_wave(self, concurrency: int, monitor) -> defer.Deferred:
+        """Starts `concurrency` clients at once, or spread over the ramp time, and summarizes the wave."""
+        options = self.options
+        protocols = ["telnet", "websocket"] if options.protocol == "mixed" else [options.protocol]
+        start = monotonic()
+        clients = [
+            self.run_client(protocols[num % len(protocols)], options.ramp * num / concurrency)
+            for num in range(concurrency)
+        ]
+        results = yield defer.gatherResults(clients)
+        duration = monotonic() - start
+
+        steps = {}
+        failures, errors = {}, {}
+        for timings, failed in results:
+            for name, elapsed in timings.items():
+                steps.setdefault(name, []).append(elapsed)
+            if failed:
+                failures[failed[0]] = failures.get(failed[0], 0) + 1
+                errors.setdefault(failed[0], failed[1])
+        completed = len(steps.get("total", []))
+        return {
+            "concurrency": concurrency,
+            "duration": duration,
+            "completed": completed,
+            "failed": concurrency - completed,
+            "failures": failures,
+            # The first error seen at each failing step
+            "errors": errors,
+            "throughput": completed / duration if duration else 0.0,
+            "steps": {
+                name: {"count": len(values), "p50": percentile(values, 0.5), "p95": percentile(values, 0.95),
+                       "p99": percentile(values, 0.99), "max": max(values)}
+                for name, values in steps.items()
+            },
+            "reactor_lag": monitor.lag_between(start, monotonic()) if monitor else {"mean": None, "max": None},
+        }
+
+    @defer.inlineCallbacks
+    def start_monitor(self) -> defer.Deferred:
+        """Connects the lag monitor, or returns `None` if it's disabled or can't connect."""
+        if self.options.no_lag_monitor:
+            return None
+        factory = WebSocketClientFactory(f"ws://{self.options.host}:{self.options.websocket_port}")
+        factory.protocol = LagMonitorClient
+        factory.poll_interval = 1.0
+        endpoint = TCP4ClientEndpoint(reactor, self.options.host, self.options.websocket_port)
+        try:
+            monitor = yield endpoint.connect(factory)
+        except Exception as err:
+            print(f"Couldn't connect the reactor lag monitor: {err!r}")
+            return None
+        # Give the monitor time to open and take its first sample
+        yield task.deferLater(reactor, 2, lambda: None)
+        return monitor
+
+    @defer.inlineCallbacks
+    def run(self) -> defer.Deferred:
+        """Runs every wave in order and returns the report."""
+        monitor = yield self.start_monitor()
+        waves = []
+        for concurrency in self.options.concurrency:
+            wave = yield self.run_wave(concurrency, monitor)
+            waves.append(wave)
+            print_wave(wave)
+            yield task.deferLater(reactor, self.options.pause, lambda: None)
+        if monitor:
+            monitor.sendClose()
+
+        degraded_at = next((wave["concurrency"] for wave in waves if is_degraded(wave, self.options.degrade_p95)),
+                           None)
+        return {"run_id": self.run_id, "protocol": self.options.protocol, "flow": self.options.flow,
+                "degrade_p95": self.options.degrade_p95, "degraded_at": degraded_at, "waves": waves}
+
+
+def is_degraded(wave: dict, degrade_p95: float) -> bool:
+    """Returns whether a wave had failures or its 95th percentile flow time went over the limit."""
+    total = wave["steps"].get("total")
+    return bool(wave["failed"]) or not total or total["p95"] > degrade_p95
+
+
+def format_ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+def print_wave(wave: dict):
+    """Prints a summary of one wave."""
+    lag = wave["reactor_lag"]
+    print(f"\n{wave['concurrency']} clients: {wave['completed']} completed, {wave['failed']} failed in "
+          f"{wave['duration']:.1f}s ({wave['throughput']:.2f} flows/s), reactor lag mean {format_ms(lag['mean'])}ms "
+          f"max {format_ms(lag['max'])}ms")
+    if wave["failures"]:
+        print("  failed at: " + ", ".join(f"{name} x{count}" for name, count in wave["failures"].items()))
+    print(f"  {'step':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in wave["steps"].items():
+        print(f"  {name:<12}{format_ms(stats['p50']):>10}{format_ms(stats['p95']):>10}{format_ms(stats['p99']):>10}"
+              f"{format_ms(stats['max']):>10}")
+
+
+def parse_args(argv: list[str]):
+    parser = argparse.ArgumentParser(description="Drives concurrent clients through login and character creation.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--telnet-port", type=int, default=4000)
+    parser.add_argument("--websocket-port", type=int, default=4002)
+    parser.add_argument("--protocol", choices=("telnet", "websocket", "mixed"), default="telnet")
+    parser.add_argument("--flow", choices=("new", "existing"), default="new",
+                        help="Create new accounts, or log into generated ones and use 'create'")
+    parser.add_argument("--concurrency", type=lambda value: [int(num) for num in value.split(",")],
+                        default=[10, 25, 50, 100], help="Comma separated client counts, one wave each")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds to spread each wave's connections over")
+    parser.add_argument("--pause", type=float, default=5.0, help="Seconds to wait between waves")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each step")
+    parser.add_argument("--degrade-p95", type=float, default=10.0,
+                        help="Seconds a wave's 95th percentile flow can take before login counts as degraded")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="Account name prefix for the existing flow")
+    parser.add_argument("--account-offset", type=int, default=0, help="First account number for the existing flow")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--no-lag-monitor", action="store_true", help="Don't poll the server's reactor lag")
+    parser.add_argument("--output", default="benchmarks/loadgen_results.json", help="Where to write the JSON report")
+    return parser.parse_args(argv)
+
+
+@defer.inlineCallbacks
+def main(_reactor, *argv):
+    options = parse_args(list(argv))
+    report = yield LoadGenerator(options).run()
+    with open(options.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    if report["degraded_at"] is None:
+        print(f"\nLogin didn't degrade up to {options.concurrency[-1]} clients.")
+    else:
+        print(f"\nLogin degraded at {report['degraded_at']} clients.")
+    print(f"Report written to {options.output}")
+
+
+if __name__ == "__main__":
+    task.react(main, sys.argv[1:])
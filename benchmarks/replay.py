@@ -0,0 +1,241 @@
+"""
+Session trace replay
+
+Printer - October 2026
+
+Re-drives a trace recorded with `SESSION_TRACE_FILE` against a running server. Every traced session connects with the
+protocol it used and sends its text input on the trace's schedule, in real time, sped up, or as fast as the server
+answers. The time from sending each input to the first output is compared with how long the recording server spent on
+it, grouped by the command's first word.
+
+    python -m benchmarks.replay server/logs/sessions.trace --speed 1
+    python -m benchmarks.replay server/logs/sessions.trace --speed 10
+    python -m benchmarks.replay server/logs/sessions.trace --speed max
+
+Only text input is replayed; the client housekeeping the webclient sends through other input functions is left out.
+Recorded passwords are anonymized, so they're all replaced with `--password`. Replay against a copy of the recording
+server's database with its account passwords reset to that, and with the throttles raised as described in
+`benchmarks.loadgen`.
+"""
+
+import argparse
+import json
+import re
+import sys
+from time import monotonic
+
+from twisted.internet import defer, reactor, task
+
+from benchmarks.loadgen import DEFAULT_PASSWORD, connect_client, format_ms, percentile
+from systems.monitoring.session_traces import read_trace
+
+# Any output at all counts as the server responding
+_ANY_OUTPUT = re.compile(r"\S")
+# Protocol keys that are replayed over the webclient's websocket. Everything else is replayed over telnet.
+_WEBSOCKET_PROTOCOLS = ("websocket", "webclient/websocket", "ajax/comet", "webclient/ajax")
+# The server sends this for every new session itself, so it isn't replayed
+_LOGIN_START = "__unloggedin_look_command"
+# Command key used for anonymized passwords
+PASSWORD_KEY = "<password>"
+
+
+class TracedSession:
+    """One connection in a trace, from connecting to disconnecting."""
+
+    def __init__(self, sessid: int, protocol_key: str, start: float):
+        self.sessid = sessid
+        self.protocol = "websocket" if protocol_key in _WEBSOCKET_PROTOCOLS else "telnet"
+        self.start = start
+        self.end = None
+        # (time received, line, command key, seconds the recording server spent on it)
+        self.inputs = []
+
+
+def command_key(line: str) -> str:
+    """Returns the lowercase first word of an input line, which groups timings by command."""
+    words = line.split(None, 1)
+    return words[0].lower() if words else "<empty>"
+
+
+def load_sessions(records, password: str) -> list[TracedSession]:
+    """
+    Splits trace records into the sessions that sent them.
+    :param records: Trace records from `read_trace`
+    :param password: The text to send in place of anonymized passwords
+    :return: The sessions in the order they connected
+    """
+    sessions, active = [], {}
+    for record in records:
+        received, sessid, kind = record[:3]
+        session = active.get(sessid)
+        if kind == "connect":
+            # Sessions are resynced with a connect after a server reload, which doesn't start a new one
+            if session is None:
+                session = active[sessid] = TracedSession(sessid, record[3], received)
+                sessions.append(session)
+        elif session is None:
+            # Input from sessions connected before recording started can't be replayed
+            continue
+        elif kind == "input":
+            cmdname, args, kwargs, duration = record[3:7]
+            if cmdname == "text" and args and args[0] != _LOGIN_START:
+                session.inputs.append((received, args[0], command_key(args[0]), duration))
+        elif kind == "password":
+            session.inputs.append((received, password, PASSWORD_KEY, record[3]))
+        elif kind == "disconnect":
+            session.end = received
+            del active[sessid]
+    return sessions
+
+
+class Replayer:
+    """Replays traced sessions and collects their response times."""
+
+    def __init__(self, options, sessions: list[TracedSession]):
+        self.options = options
+        self.sessions = sessions
+        self.origin = min((session.start for session in sessions), default=0.0)
+        self.started = None
+        # Command key to recorded durations and replayed response times
+        self.recorded = {}
+        self.replayed = {}
+        self.unanswered = {}
+        # Seconds inputs were sent behind schedule
+        self.behind = []
+        self.failures = []
+
+    def _wait_until(self, traced_time: float) -> defer.Deferred:
+        """Waits until a time in the trace comes up, scaled by the replay speed."""
+        if self.options.speed is None:
+            return defer.succeed(None)
+        due = (traced_time - self.origin) / self.options.speed
+        return task.deferLater(reactor, max(0.0, due - (monotonic() - self.started)), lambda: None)
+
+    def _behind_schedule(self, traced_time: float) -> float:
+        if self.options.speed is None:
+            return 0.0
+        return max(0.0, monotonic() - self.started - (traced_time - self.origin) / self.options.speed)
+
+    @defer.inlineCallbacks
+    def _response(self, client) -> defer.Deferred:
+        """Waits for the next output, returning how long it took or `None` if none came in time."""
+        start = monotonic()
+        try:
+            yield client.expect(_ANY_OUTPUT, self.options.timeout)
+        except defer.TimeoutError:
+            return None
+        return monotonic() - start
+
+    @defer.inlineCallbacks
+    def replay_session(self, session: TracedSession) -> defer.Deferred:
+        """Connects one traced session and sends its input on schedule."""
+        yield self._wait_until(session.start)
+        options = self.options
+        client = None
+        try:
+            client = yield connect_client(session.protocol, options.host, options.telnet_port,
+                                          options.websocket_port, options.timeout)
+            # The connection screen
+            yield self._response(client)
+            for received, line, key, duration in session.inputs:
+                yield self._wait_until(received)
+                self.behind.append(self._behind_schedule(received))
+                client.send_line(line)
+                elapsed = yield self._response(client)
+                self.recorded.setdefault(key, []).append(duration)
+                if elapsed is None:
+                    self.unanswered[key] = self.unanswered.get(key, 0) + 1
+                else:
+                    self.replayed.setdefault(key, []).append(elapsed)
+            if session.end is not None:
+                yield self._wait_until(session.end)
+        except Exception as err:
+            self.failures.append((session.sessid, repr(err)))
+        finally:
+            if client:
+                client.disconnect()
+
+    @defer.inlineCallbacks
+    def run(self) -> defer.Deferred:
+        """Replays every session and returns the report."""
+        self.started = monotonic()
+        yield defer.gatherResults([self.replay_session(session) for session in self.sessions])
+        duration = monotonic() - self.started
+
+        commands = {}
+        for key, durations in self.recorded.items():
+            replayed = self.replayed.get(key, [])
+            commands[key] = {
+                "count": len(durations),
+                "unanswered": self.unanswered.get(key, 0),
+                "recorded_p50": percentile(durations, 0.5),
+                "recorded_p95": percentile(durations, 0.95),
+                "replayed_p50": percentile(replayed, 0.5),
+                "replayed_p95": percentile(replayed, 0.95),
+                "replayed_max": max(replayed, default=None),
+            }
+        traced_span = max((received for session in self.sessions for received, *_ in session.inputs),
+                          default=self.origin) - self.origin
+        return {
+            "speed": self.options.speed,
+            "sessions": len(self.sessions),
+            "failed_sessions": len(self.failures),
+            "failures": self.failures[:20],
+            "inputs": sum(len(durations) for durations in self.recorded.values()),
+            "traced_span": traced_span,
+            "duration": duration,
+            "behind_schedule": {"p95": percentile(self.behind, 0.95), "max": max(self.behind, default=None)},
+            "commands": commands,
+        }
+
+
+def print_report(report: dict, top: int):
+    """Prints the replay summary and the busiest commands."""
+    behind = report["behind_schedule"]
+    speed = "max" if report["speed"] is None else f"{report['speed']:g}x"
+    print(f"\nReplayed {report['inputs']} inputs from {report['sessions']} sessions at {speed} speed in "
+          f"{report['duration']:.1f}s (traced over {report['traced_span']:.1f}s), "
+          f"{report['failed_sessions']} sessions failed")
+    print(f"Sending fell behind schedule by {format_ms(behind['p95'])}ms at p95, {format_ms(behind['max'])}ms at most")
+    print(f"  {'command':<16}{'count':>8}{'no reply':>10}{'rec p50':>10}{'rec p95':>10}{'rep p50':>10}"
+          f"{'rep p95':>10}{'rep max':>10}")
+    commands = sorted(report["commands"].items(), key=lambda item: item[1]["count"], reverse=True)
+    for key, stats in commands[:top]:
+        print(f"  {key[:15]:<16}{stats['count']:>8}{stats['unanswered']:>10}{format_ms(stats['recorded_p50']):>10}"
+              f"{format_ms(stats['recorded_p95']):>10}{format_ms(stats['replayed_p50']):>10}{format_ms(stats['replayed_p95']):>10}"
+              f"{format_ms(stats['replayed_max']):>10}")
+
+
+def _speed(value: str) -> float | None:
+    return None if value == "max" else float(value)
+
+
+def parse_args(argv: list[str]):
+    parser = argparse.ArgumentParser(description="Replays a recorded session trace against a server.")
+    parser.add_argument("trace", help="Trace file written by SESSION_TRACE_FILE")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--telnet-port", type=int, default=4000)
+    parser.add_argument("--websocket-port", type=int, default=4002)
+    parser.add_argument("--speed", type=_speed, default=1.0,
+                        help="How many times faster than recorded to send input, or 'max' to send each input as soon "
+                             "as the last one is answered")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for a response to each input")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Sent in place of anonymized passwords")
+    parser.add_argument("--top", type=int, default=25, help="How many commands to print")
+    parser.add_argument("--output", default="benchmarks/replay_results.json", help="Where to write the JSON report")
+    return parser.parse_args(argv)
+
+
+@defer.inlineCallbacks
+def main(_reactor, *argv):
+    options = parse_args(list(argv))
+    sessions = load_sessions(read_trace(options.trace), options.password)
+    report = yield Replayer(options, sessions).run()
+    print_report(report, options.top)
+    with open(options.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Report written to {options.output}")
+
+
+if __name__ == "__main__":
+    task.react(main, sys.argv[1:])
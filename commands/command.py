@@ -7,6 +7,8 @@ Commands describe the input the account can do to the game.
 
 from evennia.commands.command import Command as BaseCommand
 
+from systems.throttling.command_queue import COMMAND_SCHEDULER
+
 # from evennia import default_cmds
 
 
@@ -30,7 +32,15 @@ class Command(BaseCommand):
     #     - at_post_cmd(): Extra actions, often things done after
     #         every command, like prompts.
     #
-    pass
+
+    def set_wait(self, seconds: float):
+        """
+        Holds back the caller's next commands for a while, like ROM's `WAIT_STATE`. Commands run without a session,
+        such as by NPCs, aren't held back.
+        :param seconds: How long the caller has to wait
+        """
+        if self.session:
+            COMMAND_SCHEDULER.set_wait(self.session, seconds)
 
 
 # -------------------------------------------------------------
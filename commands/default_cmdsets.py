@@ -16,7 +16,10 @@ own cmdsets by inheriting from them or directly from `evennia.CmdSet`.
 
 from evennia import default_cmds
 
+from systems.directory.commands import CmdDirectory
+from systems.karma.commands import CmdKarma
 from systems.login.character_creator import ContribChargenCmdSet
+from systems.recognition.commands import CmdIntroduce
 
 
 class CharacterCmdSet(default_cmds.CharacterCmdSet):
@@ -36,6 +39,8 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         #
         # any commands you add below will overload the default ones.
         #
+        self.add(CmdDirectory)
+        self.add(CmdIntroduce)
 
 
 class AccountCmdSet(default_cmds.AccountCmdSet):
@@ -57,6 +62,7 @@ class AccountCmdSet(default_cmds.AccountCmdSet):
         # any commands you add below will overload the default ones.
         #
         self.add(ContribChargenCmdSet)
+        self.add(CmdKarma)
 
 
 class UnloggedinCmdSet(default_cmds.UnloggedinCmdSet):
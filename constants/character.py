@@ -5,6 +5,9 @@ This file contains all the constants for a character.
 """
 
 from enum import Enum
+from types import MappingProxyType
+
+from utils.tick_colors import tick_to_ansi
 
 MIN_FEET: int = 5
 MAX_FEET: int = 6
@@ -12,7 +15,16 @@ MIN_INCHES: int = 0
 MAX_INCHES: int = 11
 
 
-class Eyes(Enum):
+class TickEnum(Enum):
+    """Base for enums whose values are tick color markup."""
+
+    @property
+    def ansi(self) -> str:
+        """Returns the value of this member with its tick codes already translated to ANSI."""
+        return _ANSI_VALUES[self]
+
+
+class Eyes(TickEnum):
     """This enum is used to represent the available colors of a character's eyes."""
     GOLDEN: str = "`Yg`yo`Yld`ye`Yn`x"
     AMBER: str = "`172am`166b`172er`x"
@@ -32,10 +44,10 @@ class Eyes(Enum):
     @classmethod
     def is_valid(cls, color: str) -> bool:
         """Returns `True` if the given eye color is valid, `False` otherwise."""
-        return color.upper() in (member.name for member in Eyes.__members__.values())
+        return color.upper() in _EYES_BY_NAME
 
 
-class Hair(Enum):
+class Hair(TickEnum):
     """This enum is used to represent the available colors of a character's natural hair."""
     BLUE: str = "`cb`Clu`ce`x"
     BALD: str = "`wno`x"
@@ -54,10 +66,10 @@ class Hair(Enum):
     @classmethod
     def is_valid(cls, color: str) -> bool:
         """Returns `True` if the given hair color is valid, `False` otherwise."""
-        return color.upper() in (member.name for member in Hair.__members__.values())
+        return color.upper() in _HAIR_BY_NAME
 
 
-class Race(Enum):
+class Race(TickEnum):
     """This enum is used to represent the available races of a character."""
     HUMAN: str = "`cHuman`x"
     METAHUMAN: str = "`WMetahuman`x"
@@ -70,66 +82,58 @@ class Race(Enum):
     @classmethod
     def validate(cls, race: str):
         """Returns True if the given race is valid, False otherwise. Case insensitive."""
-        special_names = {"META": Race.METAHUMAN, "SYNTH": Race.SYNTHETIC}
-        race = race.upper()
-        if race in (member.name for member in Race.__members__.values()):
-            return Race[race.upper()]
-        if race in special_names:
-            return special_names[race]
-        return None
-
+        return _RACES_BY_NAME.get(race.upper())
 
     def race_tier_range(self) -> tuple[int, int]:
         """Returns a tuple containing the minimum and maximum tiers possible for this race."""
-        match self:
-            case Race.HUMAN:
-                return 1, 5
-            case Race.METAHUMAN:
-                return 2, 5
-            case Race.MAGICKER:
-                return 2, 5
-            case Race.ALIEN:
-                return 2, 5
-            case Race.SYNTHETIC:
-                return 2, 5
-            case Race.AVALONIAN:
-                return 3, 5
-            case Race.DIVER:
-                return 3, 5
-            case _:
-                raise ValueError("Invalid race.")
+        return _RACE_TIER_RANGES[self]
 
     def valid_race_tier(self, tier: int) -> bool:
         """Returns `True` if the given tier is valid for this race, `False` otherwise."""
-        return self.race_tier_range()[0] <= tier <= self.race_tier_range()[1]
+        min_tier, max_tier = _RACE_TIER_RANGES[self]
+        return min_tier <= tier <= max_tier
 
     def archetype(self, tier: int, use_color: bool = True) -> str:
         """Returns a string representation of the race's tier archetype."""
-        if not self.valid_race_tier(tier):
-            raise ValueError(f"Invalid tier {tier} for race {self.name.capitalize()}.")
-        match self:
-            case Race.HUMAN:
-                tiers = ["", "Bystander", "Regular Person", "Important Person", "Dedicated Human", "'Super'Human"]
-                color = "`c"
-            case Race.METAHUMAN:
-                tiers = ["", "", "Rookie Metahuman", "Metahuman", "Veteran Metahuman", "S-Class Metahuman"]
-                color = "`W"
-            case Race.MAGICKER:
-                tiers = ["", "", "Dabbler", "Practitioner", "Magician", "Supreme"]
-                color = "`R"
-            case Race.ALIEN:
-                tiers = ["", "", "Rookie Alien", "Alien", "Veteran Alien", "Higher Lifeform"]
-                color = "`G"
-            case Race.SYNTHETIC:
-                tiers = ["", "", "Prototype Synthetic", "Synthetic", "Advanced Synthetic", "Perfect Synthetic"]
-                color = "`D"
-            case Race.AVALONIAN:
-                tiers = ["", "", "", "Avalonian", "Avalonian Knight", "Avalonian Noble"]
-                color = "`C"
-            case Race.DIVER:
-                tiers = ["", "", "", "Diver", "Veteran Diver", "Elder Diver"]
-                color = "`Y"
-            case _:
-                raise ValueError("Invalid race.")
-        color = color if use_color else "`x"
-        return f"{color}{tiers[tier]}`x"
+        try:
+            return _ARCHETYPES[self, tier, bool(use_color)]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid tier {tier} for race {self.name.capitalize()}.") from None
+
+
+# Lookup tables built once at import. Everything below is read-only so it can be shared freely.
+
+_EYES_BY_NAME = MappingProxyType(dict(Eyes.__members__))
+_HAIR_BY_NAME = MappingProxyType(dict(Hair.__members__))
+_RACES_BY_NAME = MappingProxyType({**Race.__members__, "META": Race.METAHUMAN, "SYNTH": Race.SYNTHETIC})
+
+_RACE_TIER_RANGES = MappingProxyType({
+    Race.HUMAN: (1, 5),
+    Race.METAHUMAN: (2, 5),
+    Race.MAGICKER: (2, 5),
+    Race.ALIEN: (2, 5),
+    Race.SYNTHETIC: (2, 5),
+    Race.AVALONIAN: (3, 5),
+    Race.DIVER: (3, 5),
+})
+
+# The color of each race's archetypes and the archetype names indexed by tier
+_RACE_ARCHETYPE_NAMES = {
+    Race.HUMAN: ("`c", ["", "Bystander", "Regular Person", "Important Person", "Dedicated Human", "'Super'Human"]),
+    Race.METAHUMAN: ("`W", ["", "", "Rookie Metahuman", "Metahuman", "Veteran Metahuman", "S-Class Metahuman"]),
+    Race.MAGICKER: ("`R", ["", "", "Dabbler", "Practitioner", "Magician", "Supreme"]),
+    Race.ALIEN: ("`G", ["", "", "Rookie Alien", "Alien", "Veteran Alien", "Higher Lifeform"]),
+    Race.SYNTHETIC: ("`D", ["", "", "Prototype Synthetic", "Synthetic", "Advanced Synthetic", "Perfect Synthetic"]),
+    Race.AVALONIAN: ("`C", ["", "", "", "Avalonian", "Avalonian Knight", "Avalonian Noble"]),
+    Race.DIVER: ("`Y", ["", "", "", "Diver", "Veteran Diver", "Elder Diver"]),
+}
+
+# Maps (race, tier, use_color) to the rendered archetype
+_ARCHETYPES = MappingProxyType({
+    (race, tier, use_color): f"{color if use_color else '`x'}{names[tier]}`x"
+    for race, (color, names) in _RACE_ARCHETYPE_NAMES.items()
+    for tier in range(_RACE_TIER_RANGES[race][0], _RACE_TIER_RANGES[race][1] + 1)
+    for use_color in (True, False)
+})
+
+_ANSI_VALUES = MappingProxyType({member: tick_to_ansi(member.value) for enum in (Eyes, Hair, Race) for member in enum})
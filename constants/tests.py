@@ -0,0 +1,41 @@
+import unittest
+
+from constants.character import Eyes, Hair, Race
+
+
+class RaceTests(unittest.TestCase):
+    """This tests the precomputed race lookups"""
+
+    def test_archetype(self):
+        """Tests a colored and a plain archetype"""
+        self.assertEqual(Race.METAHUMAN.archetype(5), "`WS-Class Metahuman`x")
+        self.assertEqual(Race.METAHUMAN.archetype(5, use_color=False), "`xS-Class Metahuman`x")
+    def test_invalid_archetype_tier(self):
+        """Tests that a tier outside the race's range is rejected"""
+        with self.assertRaises(ValueError):
+            Race.DIVER.archetype(2)
+    def test_valid_race_tier(self):
+        """Tests both ends of a race's tier range"""
+        self.assertTrue(Race.AVALONIAN.valid_race_tier(3))
+        self.assertTrue(Race.AVALONIAN.valid_race_tier(5))
+        self.assertFalse(Race.AVALONIAN.valid_race_tier(2))
+    def test_validate_aliases(self):
+        """Tests that race names and their aliases are case insensitive"""
+        self.assertIs(Race.validate("alien"), Race.ALIEN)
+        self.assertIs(Race.validate("Meta"), Race.METAHUMAN)
+        self.assertIs(Race.validate("synth"), Race.SYNTHETIC)
+        self.assertIsNone(Race.validate("dragon"))
+
+
+class ColorTests(unittest.TestCase):
+    """This tests the precomputed eye and hair lookups"""
+
+    def test_is_valid(self):
+        """Tests valid and invalid colors"""
+        self.assertTrue(Eyes.is_valid("amber"))
+        self.assertFalse(Eyes.is_valid("bald"))
+        self.assertTrue(Hair.is_valid("Bald"))
+    def test_ansi(self):
+        """Tests that enum values are translated to ANSI ahead of time"""
+        self.assertEqual(Hair.PINK.ansi, "\033[1m\033[35mpink\033[0m")
+        self.assertEqual(Race.HUMAN.ansi, "\033[22m\033[36mHuman\033[0m")
@@ -11,11 +11,16 @@ class RosterCharacterData:
 
 
     def __str__(self):
+        return " ".join(self.columns())
+
+    def columns(self) -> list[str]:
+        """Returns the parts of this entry's roster line, to be lined up with the other entries'."""
         tier_colors = ["", "`c", "`C", "`Y", "`p", "`M"]
 
         if self.archetype and self.modifier:
-            return f"`W{self.name.strip()}`Y: `xTier {tier_colors[self.tier]}{self.tier}`x {self.archetype} `Y(`x{self.modifier}`Y)`x"
+            return [f"`W{self.name.strip()}`Y:", f"`xTier {tier_colors[self.tier]}{self.tier}`x",
+                    f"{self.archetype} `Y(`x{self.modifier}`Y)`x"]
         elif self.archetype:
-            return f"`W{self.name.strip()}`Y: `xTier {tier_colors[self.tier]}{self.tier}`x {self.archetype}`x"
+            return [f"`W{self.name.strip()}`Y:", f"`xTier {tier_colors[self.tier]}{self.tier}`x", f"{self.archetype}`x"]
         else:
-            return f"`W{self.name}`x"
+            return [f"`W{self.name}`x"]
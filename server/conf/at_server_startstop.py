@@ -17,6 +17,9 @@ at_server_cold_stop()
 
 """
 
+from systems.login.reservations import backfill_name_reservations
+from systems.navigation.room_graph import ROOM_GRAPH
+
 
 def at_server_init():
     """
@@ -30,7 +33,8 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    backfill_name_reservations()
+    ROOM_GRAPH.load()
 
 
 def at_server_stop():
@@ -26,6 +26,71 @@ as argument.
 
 """
 
+from math import isfinite
+
+from systems.login.resume import resume_session
+from systems.monitoring.reactor_lag import LAG_MONITOR, SAMPLE_HISTORY, SAMPLE_INTERVAL
+from systems.throttling.command_queue import COMMAND_SCHEDULER
+
+# Seconds of reactor lag samples summarized when the client doesn't ask for a window
+DEFAULT_LAG_WINDOW = 5.0
+# Who can see server-wide stats
+STAFF_PERMISSION = "Admin"
+
+
+def reactor_lag(session, *args, **kwargs):
+    """
+    Reports the server's recent reactor lag, for load testing tools. Only logged-in sessions are answered.
+
+    Args:
+        session (Session): The Session asking.
+        kwargs (dict, optional): `window` is how many seconds of samples to summarize, up to the monitor's history.
+            Anything that isn't a number uses the default.
+
+    """
+    if not session.logged_in:
+        return
+    try:
+        window = float(kwargs.get("window", DEFAULT_LAG_WINDOW))
+    except (TypeError, ValueError):
+        window = DEFAULT_LAG_WINDOW
+    if not isfinite(window):
+        window = DEFAULT_LAG_WINDOW
+    window = min(max(window, SAMPLE_INTERVAL), SAMPLE_HISTORY)
+    session.msg(reactor_lag=((), LAG_MONITOR.stats(window)))
+
+
+def resume(session, *args, **kwargs):
+    """
+    Logs an unlogged-in session back in with a resume token it was sent earlier, skipping the login menu.
+
+    Args:
+        session (Session): The Session reconnecting.
+        args (tuple): The first argument is the token, unless it's given as `token` in kwargs.
+
+    """
+    token = kwargs.get("token") or (args[0] if args else None)
+    if isinstance(token, str):
+        resume_session(session, token)
+
+
+def command_queue(session, *args, **kwargs):
+    """
+    Reports how many commands are queued and dropped for the session asking. Staff also get the counts across the
+    server. Only logged-in sessions are answered.
+
+    Args:
+        session (Session): The Session asking.
+
+    """
+    if not session.logged_in:
+        return
+    stats = {"session": COMMAND_SCHEDULER.session_stats(session)}
+    if session.account and session.account.check_permstring(STAFF_PERMISSION):
+        stats.update(COMMAND_SCHEDULER.stats())
+    session.msg(command_queue=((), stats))
+
+
 # def oob_echo(session, *args, **kwargs):
 #     """
 #     Example echo function. Echoes args, kwargs sent to it.
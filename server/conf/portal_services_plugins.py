@@ -14,6 +14,8 @@ process.
 
 """
 
+from systems.throttling.portal_guard import PORTAL_GUARD
+
 
 def start_plugin_services(portal):
     """
@@ -21,4 +23,4 @@ def start_plugin_services(portal):
 
     portal - a reference to the main portal application.
     """
-    pass
+    PORTAL_GUARD.setServiceParent(portal)
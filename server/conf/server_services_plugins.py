@@ -14,6 +14,8 @@ services are started last in the Server startup process.
 
 """
 
+from systems.monitoring.reactor_lag import LAG_MONITOR
+
 
 def start_plugin_services(server):
     """
@@ -21,4 +23,4 @@ def start_plugin_services(server):
 
     server - a reference to the main server application.
     """
-    pass
+    LAG_MONITOR.setServiceParent(server)
@@ -21,7 +21,78 @@ settings file:
 
 """
 
+from time import monotonic, perf_counter, time
+
+from django.conf import settings
 from evennia.server.serversession import ServerSession as BaseServerSession
+from twisted.internet import reactor
+
+from systems.monitoring.session_traces import is_entering_password, trace_recorder
+from systems.throttling.command_queue import COMMAND_SCHEDULER
+from utils.tick_colors import downsample_to_ansi
+
+# Characters of text joined into one message before starting another
+_MAX_JOINED_TEXT = 32 * 1024
+
+
+class _PendingOutput:
+    """
+    Output waiting to be sent to the portal. Plain text messages sent one after another with the same options are joined
+    into one, and anything else is kept as it was sent.
+    """
+
+    def __init__(self, kwargs: dict):
+        self.kwargs = kwargs
+        self.parts = None
+        text, self.text_kwargs = kwargs.get("text"), {}
+        if isinstance(text, (tuple, list)) and len(text) == 2 and isinstance(text[1], dict):
+            text, self.text_kwargs = text
+        self.options = kwargs.get("options") or {}
+        if isinstance(text, str) and not set(kwargs) - {"text", "options"} and not self.options.get("send_prompt"):
+            self.parts = [text]
+            self.length = len(text)
+
+    def join(self, other: "_PendingOutput") -> bool:
+        """
+        Adds another message's text to this one's if they can be sent as one.
+        :param other: Output sent after this
+        :return: Whether it was joined
+        """
+        if (self.parts is None or other.parts is None or self.length + other.length > _MAX_JOINED_TEXT
+                or other.text_kwargs != self.text_kwargs or other.options != self.options):
+            return False
+        self.parts += other.parts
+        self.length += other.length
+        return True
+
+    def to_kwargs(self) -> dict:
+        if self.parts is None or len(self.parts) == 1:
+            return self.kwargs
+        if self.options.get("raw"):
+            text = "\n".join(self.parts)
+        else:
+            # Protocols reset the color at the end of every message, so each joined message is ended the same way
+            text = "\n".join(part + ("||n" if part.endswith("|") else "|n") for part in self.parts[:-1])
+            text += "\n" + self.parts[-1]
+        kwargs = {"text": (text, self.text_kwargs) if self.text_kwargs else text}
+        if "options" in self.kwargs:
+            kwargs["options"] = self.kwargs["options"]
+        return kwargs
+
+
+def _downsampled(kwargs: dict) -> dict:
+    """Returns output with the XTERM256 colors in its text and prompt swapped for the closest ANSI colors."""
+    options = kwargs.get("options") or {}
+    if options.get("raw") or options.get("xterm256"):
+        return kwargs
+    kwargs = dict(kwargs)
+    for key in ("text", "prompt"):
+        value = kwargs.get(key)
+        if isinstance(value, str):
+            kwargs[key] = downsample_to_ansi(value)
+        elif isinstance(value, (tuple, list)) and value and isinstance(value[0], str):
+            kwargs[key] = (downsample_to_ansi(value[0]), *value[1:])
+    return kwargs
 
 
 class ServerSession(BaseServerSession):
@@ -32,6 +103,93 @@ class ServerSession(BaseServerSession):
     Each account gets one or more sessions assigned to them whenever they connect
     to the game server. All communication between game and account goes
     through their session(s).
+
+    Output is held back until the input being handled or the current reactor tick is finished, or for at most
+    `SESSION_OUTPUT_MAX_DELAY` seconds, so the messages sent in the meantime reach the portal together and in order.
+    Clients that show ANSI colors but not XTERM256 ones get XTERM256 colors swapped for the closest ANSI colors.
+    Text input goes through `COMMAND_SCHEDULER`, which holds it back if the session sends commands too fast.
+    When `SESSION_TRACE_FILE` is set, everything the session sends is recorded there for replaying later.
     """
 
-    pass
+    def __init__(self):
+        super().__init__()
+        self._pending_output = []
+        self._output_held_since = None
+        self._flush_call = None
+
+    def at_sync(self):
+        super().at_sync()
+        recorder = trace_recorder()
+        if recorder:
+            recorder.record_connect(self, time())
+
+    def data_in(self, **kwargs):
+        if "text" in kwargs:
+            COMMAND_SCHEDULER.submit(self, kwargs, time())
+        else:
+            self.run_input(kwargs, time())
+
+    def run_input(self, inputs: dict, received: float):
+        """
+        Calls the input functions for input from the client, once the command scheduler lets it run.
+        :param inputs: The input in `data_in` form
+        :param received: When it was received, as a Unix time
+        """
+        recorder = trace_recorder()
+        if not recorder:
+            super().data_in(**inputs)
+        else:
+            redact = settings.SESSION_TRACE_ANONYMIZE and is_entering_password(self)
+            start = perf_counter()
+            super().data_in(**inputs)
+            recorder.record_input(self, received, inputs, perf_counter() - start, redact)
+        self.flush_output()
+
+    def data_out(self, **kwargs):
+        """
+        Holds output to be sent with any more that follows it. See `flush_output`.
+        """
+        output = _PendingOutput(kwargs)
+        if not (self._pending_output and self._pending_output[-1].join(output)):
+            self._pending_output.append(output)
+
+        now = monotonic()
+        if self._output_held_since is None:
+            self._output_held_since = now
+        if now - self._output_held_since >= settings.SESSION_OUTPUT_MAX_DELAY:
+            self.flush_output()
+        elif self._flush_call is None:
+            self._flush_call = reactor.callLater(0, self.flush_output)
+
+    def flush_output(self):
+        """
+        Sends all held output to the portal.
+        """
+        if self._flush_call is not None:
+            if self._flush_call.active():
+                self._flush_call.cancel()
+            self._flush_call = None
+        pending, self._pending_output = self._pending_output, []
+        self._output_held_since = None
+        downsample = self.needs_ansi_colors()
+        for output in pending:
+            kwargs = output.to_kwargs()
+            self.sessionhandler.data_out(self, **(_downsampled(kwargs) if downsample else kwargs))
+
+    def needs_ansi_colors(self) -> bool:
+        """
+        Checks whether the client shows ANSI colors but not XTERM256 ones, the same way the portal decides for telnet.
+        Clients that never said what they support are sent XTERM256 colors.
+        """
+        flags = self.protocol_flags
+        if not flags.get("TTYPE") or flags.get("NOCOLOR"):
+            return False
+        return bool(flags.get("ANSI")) and not flags.get("XTERM256")
+
+    def at_disconnect(self, reason=None):
+        COMMAND_SCHEDULER.forget(self)
+        self.flush_output()
+        recorder = trace_recorder()
+        if recorder:
+            recorder.record_disconnect(self, time())
+        super().at_disconnect(reason)
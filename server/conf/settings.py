@@ -36,12 +36,18 @@ from utils import tick_colors
 # This is the name of your game. Make it catchy!
 SERVERNAME = "SuperMUD"
 CMDSET_UNLOGGEDIN = "systems.login.login.UnloggedinCmdSet"
+SERVER_SESSION_CLASS = "server.conf.serversession.ServerSession"
+PORTAL_SESSION_HANDLER_CLASS = "systems.throttling.portal_guard.GuardedPortalSessionHandler"
 
 AUTO_CREATE_CHARACTER_WITH_ACCOUNT = False
 AUTO_PUPPET_ON_LOGIN = False
 CHARGEN_MENU = "systems.login.chargen_menu"
 MAX_NR_CHARACTERS = 10
 
+# Name checks write to the database from worker threads. SQLite transactions take the write lock as they begin, so they
+# wait their turn instead of failing with "database is locked" when a read has to be upgraded to a write.
+DATABASES["default"]["OPTIONS"] = {"transaction_mode": "IMMEDIATE", "timeout": 20}
+
 # Assign the settings variables
 COLOR_ANSI_EXTRA_MAP = tick_colors.TICK_COLOR_ANSI_EXTRA_MAP
 COLOR_XTERM256_EXTRA_FG = tick_colors.TICK_COLOR_XTERM256_EXTRA_FG
@@ -59,6 +65,62 @@ GAME_TIMEZONE = "America/Los_Angeles"
 # Minimum age for characters
 MINIMUM_CHARACTER_AGE = 18
 
+# How many seconds a name entered in chargen stays reserved before someone else can claim it
+NAME_RESERVATION_LEASE = 30 * 60
+
+# How many seconds a reconnecting client can use its resume token to skip logging in
+RESUME_TOKEN_LIFETIME = 30 * 60
+
+# File to record every session's input to for replaying with `benchmarks.replay`, or None to not record
+SESSION_TRACE_FILE = None
+# Whether passwords entered at login are left out of session traces
+SESSION_TRACE_ANONYMIZE = True
+# Most seconds a session's output is held back to be sent together with the output that follows it
+SESSION_OUTPUT_MAX_DELAY = 0.05
+
+# Commands a session can send at once before it's rate limited
+COMMAND_BURST = 12
+# Commands a second a session can keep sending
+COMMAND_RATE = 4
+# Commands a session can have waiting to run before more are ignored
+COMMAND_QUEUE_LIMIT = 50
+
+# Connections the portal allows from one address at a time
+MAX_CONNECTIONS_PER_IP = 20
+# Seconds a connection can stay at the login screen before the portal disconnects it
+UNLOGGEDIN_TIMEOUT = 5 * 60
+
+######################################################################
+# Game apps and global scripts
+######################################################################
+
+INSTALLED_APPS += [
+    "systems.karma",
+    "systems.login",
+    "world",
+]
+
+# Template filters for showing tick color markup on the website
+TEMPLATES[0]["OPTIONS"]["libraries"] = {"tick_colors": "web.website.templatetags.tick_colors"}
+
+# Seconds the game API's responses are cached for
+API_CACHE_TTL = 15
+
+GLOBAL_SCRIPTS = {
+    "name_reservation_reaper": {
+        "typeclass": "systems.login.reservations.NameReservationReaper",
+        "repeats": -1,
+        "interval": 5 * 60,
+        "desc": "Reaps expired character name leases",
+    },
+    "game_calendar": {
+        "typeclass": "systems.timekeeping.game_calendar.GameCalendarScript",
+        "repeats": -1,
+        "interval": 60,
+        "desc": "Ticks the game clock and celebrates birthdays when the day rolls over",
+    },
+}
+
 ######################################################################
 # Settings given in secret_settings.py override those in this file.
 ######################################################################
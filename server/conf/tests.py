@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from server.conf import inputfuncs, serversession
+from server.conf.serversession import ServerSession
+
+
+class ServerSessionOutputTests(EvenniaTest):
+    """This tests holding and joining output in `ServerSession`"""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(serversession.reactor, "callLater")
+        self.call_later = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.held = ServerSession()
+        self.held.init_session("telnet", ("localhost", "test"), MagicMock())
+        self.data_out = self.held.sessionhandler.data_out
+
+    def _sent(self):
+        return [call.kwargs for call in self.data_out.call_args_list]
+
+    def test_output_held_until_flushed(self):
+        """Tests that output waits for the next reactor tick"""
+        self.held.msg("Hello")
+        self.data_out.assert_not_called()
+        self.call_later.assert_called_once_with(0, self.held.flush_output)
+        self.held.flush_output()
+        self.assertEqual(self._sent(), [{"text": "Hello"}])
+
+    def test_text_joined(self):
+        """Tests that plain text messages are sent as one, with the color reset between them"""
+        self.held.msg("First")
+        self.held.msg("Second|")
+        self.held.msg("Third")
+        self.held.flush_output()
+        self.assertEqual(self._sent(), [{"text": "First|n\nSecond|||n\nThird"}])
+
+    def test_order_kept(self):
+        """Tests that text isn't joined across other output or different options"""
+        self.held.msg("First")
+        self.held.msg(prompt="> ")
+        self.held.msg("Second")
+        self.held.msg(("Menu", {"type": "menu"}))
+        self.held.msg("Raw", options={"raw": True})
+        self.held.flush_output()
+        self.assertEqual(self._sent(), [
+            {"text": "First"},
+            {"prompt": "> "},
+            {"text": "Second"},
+            {"text": ("Menu", {"type": "menu"})},
+            {"text": "Raw", "options": {"raw": True}},
+        ])
+
+    def test_max_delay(self):
+        """Tests that output held for too long is sent right away"""
+        with patch.object(serversession, "monotonic", side_effect=[0.0, 1.0]):
+            self.held.msg("First")
+            self.held.msg("Second")
+        self.assertEqual(self._sent(), [{"text": "First|n\nSecond"}])
+
+    def test_flushed_after_input(self):
+        """Tests that output from handling an input is sent once the input has been handled"""
+        self.held.sessionhandler.call_inputfuncs.side_effect = lambda session, **kwargs: session.msg("Done")
+        self.held.data_in(text=(["look"], {}))
+        self.assertEqual(self._sent(), [{"text": "Done"}])
+
+    def test_ansi_only_client(self):
+        """Tests that clients without XTERM256 get the closest ANSI colors"""
+        self.held.protocol_flags.update({"TTYPE": True, "ANSI": True, "XTERM256": False})
+        self.held.msg("`500Red and `[005blue")
+        self.held.msg(prompt="`=z> ")
+        self.held.msg("`500Raw", options={"raw": True})
+        self.held.flush_output()
+        self.assertEqual(self._sent(), [
+            {"text": "`RRed and `[Bblue"},
+            {"prompt": "`W> "},
+            {"text": "`500Raw", "options": {"raw": True}},
+        ])
+
+
+class ReactorLagInputFuncTests(EvenniaTest):
+    """This tests the `reactor_lag` input function"""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(inputfuncs.LAG_MONITOR, "stats", return_value={})
+        self.stats = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_window(self):
+        """Tests that the window is bounded and bad windows fall back to the default"""
+        for window, expected in ((10, 10.0), ("junk", 5.0), (None, 5.0), ("nan", 5.0), (-1, 0.1), (1e9, 300.0)):
+            self.stats.reset_mock()
+            inputfuncs.reactor_lag(self.session, window=window)
+            self.stats.assert_called_once_with(expected)
+
+    def test_logged_out(self):
+        """Tests that sessions that haven't logged in aren't answered"""
+        session = MagicMock(logged_in=False)
+        inputfuncs.reactor_lag(session, window=5)
+        session.msg.assert_not_called()
+
+
+class CommandQueueInputFuncTests(EvenniaTest):
+    """This tests the `command_queue` input function"""
+
+    def _sent(self):
+        return self.session.msg.call_args.kwargs["command_queue"][1]
+
+    def test_player(self):
+        """Tests that players only see their own queue"""
+        self.account.permissions.remove("Developer")
+        with patch.object(self.session, "msg"):
+            inputfuncs.command_queue(self.session)
+            self.assertEqual(list(self._sent()), ["session"])
+
+    def test_staff(self):
+        """Tests that staff also see the server's queues"""
+        with patch.object(self.session, "msg"):
+            inputfuncs.command_queue(self.session)
+            self.assertIn("dropped", self._sent())
+            self.assertIn("session", self._sent())
+
+    def test_logged_out(self):
+        """Tests that sessions that haven't logged in aren't answered"""
+        session = MagicMock(logged_in=False)
+        inputfuncs.command_queue(session)
+        session.msg.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Directory commands
+
+Printer - October 2026
+"""
+
+import calendar
+
+from commands.command import Command
+from constants.character import Race
+from systems.directory.directory import search_directory
+from systems.recognition.recognition import display_names
+from utils.tick_text import table
+
+# The most characters listed at once
+MAX_RESULTS = 60
+_COLUMNS = 3
+_USAGE = "Usage: directory [<race>] [tier <number>] [born <month>] [age <age>[-<age>]]"
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+
+
+class CmdDirectory(Command):
+    """
+    search the character directory
+
+    Usage:
+      directory [<race>] [tier <number>] [born <month>] [age <age>[-<age>]]
+
+    Lists the characters matching everything you give. Characters you haven't
+    been introduced to are listed by their intro.
+
+    Examples:
+      directory metahuman tier 4
+      directory born march
+      directory human age 20-29
+    """
+
+    key = "directory"
+    aliases = ["dir"]
+    locks = "cmd:all()"
+    help_category = "General"
+
+    def parse(self):
+        self.criteria, self.error = {}, None
+        words = self.args.lower().split()
+        while words and not self.error:
+            word = words.pop(0)
+            value = words.pop(0) if word in ("tier", "born", "age") and words else None
+            if word == "tier" and value and value.isdigit():
+                self.criteria["tier"] = int(value)
+            elif word == "born" and value in _MONTHS:
+                self.criteria["birth_month"] = _MONTHS[value]
+            elif word == "born" and value and value.isdigit() and 1 <= int(value) <= 12:
+                self.criteria["birth_month"] = int(value)
+            elif word == "age" and value:
+                low, _, high = value.partition("-")
+                if not low.isdigit() or not (high or low).isdigit():
+                    self.error = f"'{value}' isn't an age or a range of ages like 20-29."
+                else:
+                    self.criteria["min_age"], self.criteria["max_age"] = int(low), int(high or low)
+            elif race := Race.validate(word):
+                self.criteria["race"] = race
+            else:
+                self.error = f"'{word}{' ' + value if value else ''}' isn't something the directory can search by."
+
+    def func(self):
+        if self.error or not self.criteria:
+            self.msg("\n".join(filter(None, (self.error, _USAGE))))
+            return
+        found = list(search_directory(**self.criteria)[:MAX_RESULTS + 1])
+        if not found:
+            self.msg("No characters match that.")
+            return
+        names = display_names(self.caller, found[:MAX_RESULTS])
+        rows = [names[start:start + _COLUMNS] for start in range(0, len(names), _COLUMNS)]
+        more = f" (showing the first {MAX_RESULTS})" if len(found) > MAX_RESULTS else ""
+        plural = "" if len(names) == 1 else "s"
+        self.msg(f"`W{len(names)} character{plural} found{more}:`x\n{table(rows, gap=3, indent=2)}")
@@ -0,0 +1,211 @@
+"""
+Character directory
+
+Printer - October 2026
+
+Race, tier and birth date are pickled Attributes, so they can't be filtered in the database. The directory mirrors them
+into Tags, which are indexed by key and category, so a search like "Tier 4 Metahumans born in March" is one query:
+
+    directory_race         "metahuman"
+    directory_tier         "4"
+    directory_birth_month  "3"
+    directory_birthday     "1990-03-07", which sorts by date so ages are a range of keys
+
+A character is listed when chargen finishes, and from then on its Tags are updated whenever one of the mirrored
+Attributes is set, by `DirectoryAttributeHandler`. Characters made some other way, like by `generate_world` or
+`import_characters`, are listed by running `evennia backfill_directory`.
+
+    search_directory(race=Race.METAHUMAN, tier=4)
+    search_directory(birth_month=3, min_age=20, max_age=29)
+"""
+
+from django.conf import settings
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute, AttributeHandler
+from evennia.utils.dbserialize import from_pickle
+
+from systems.timekeeping.game_clock import GAME_CLOCK
+
+# Marks characters that are in the directory
+LISTED_TAG = "listed"
+LISTED_CATEGORY = "directory"
+RACE_CATEGORY = "directory_race"
+TIER_CATEGORY = "directory_tier"
+BIRTH_MONTH_CATEGORY = "directory_birth_month"
+BIRTHDAY_CATEGORY = "directory_birthday"
+CATEGORIES = (LISTED_CATEGORY, RACE_CATEGORY, TIER_CATEGORY, BIRTH_MONTH_CATEGORY, BIRTHDAY_CATEGORY)
+# The Tags that have to be updated when each mirrored Attribute changes
+MIRRORED_ATTRIBUTES = {
+    "race": (RACE_CATEGORY,),
+    "tier": (TIER_CATEGORY,),
+    "birth_year": (BIRTHDAY_CATEGORY,),
+    "birth_month": (BIRTH_MONTH_CATEGORY, BIRTHDAY_CATEGORY),
+    "birth_day": (BIRTHDAY_CATEGORY,),
+}
+BATCH_SIZE = 500
+
+
+def _tag_keys(values: dict) -> dict:
+    """
+    Works out the directory Tags for a character's Attributes.
+    :param values: The character's mirrored Attributes by key
+    :return: A dict of each Tag category to its key, or `None` if the character shouldn't have one
+    """
+    race, tier = values.get("race"), values.get("tier")
+    year, month, day = values.get("birth_year"), values.get("birth_month"), values.get("birth_day")
+    return {
+        RACE_CATEGORY: race.name.lower() if race else None,
+        TIER_CATEGORY: str(tier) if tier is not None else None,
+        BIRTH_MONTH_CATEGORY: str(month) if month else None,
+        BIRTHDAY_CATEGORY: f"{year:04d}-{month:02d}-{day:02d}" if year and month and day else None,
+    }
+
+
+def _set_tags(character, tag_keys: dict):
+    for category, key in tag_keys.items():
+        character.tags.remove(category=category)
+        if key is not None:
+            character.tags.add(key, category=category)
+
+
+def _mirrored_values(character) -> dict:
+    attributes = character.attributes.get(list(MIRRORED_ATTRIBUTES), return_obj=True, return_list=True)
+    return {key: attribute.value for key, attribute in zip(MIRRORED_ATTRIBUTES, attributes) if attribute}
+
+
+def is_listed(character) -> bool:
+    return character.tags.has(LISTED_TAG, category=LISTED_CATEGORY)
+
+
+def list_character(character):
+    """
+    Adds a character to the directory, or brings its listing up to date.
+    :param character: A finished character
+    """
+    _set_tags(character, _tag_keys(_mirrored_values(character)))
+    character.tags.add(LISTED_TAG, category=LISTED_CATEGORY)
+
+
+def unlist_character(character):
+    """Takes a character out of the directory."""
+    for category in CATEGORIES:
+        character.tags.remove(category=category)
+
+
+def update_listing(character, key: str):
+    """
+    Updates a listed character's Tags after one of its Attributes changed. Characters that aren't listed are left
+    alone, so characters still in chargen don't show up.
+    :param character: The character
+    :param key: The Attribute that changed
+    """
+    categories = MIRRORED_ATTRIBUTES.get(key)
+    if categories and is_listed(character):
+        tag_keys = _tag_keys(_mirrored_values(character))
+        _set_tags(character, {category: tag_keys[category] for category in categories})
+
+
+class DirectoryAttributeHandler(AttributeHandler):
+    """An `AttributeHandler` that keeps a character's directory listing in step with its Attributes."""
+
+    def add(self, key, value, category=None, *args, **kwargs):
+        super().add(key, value, category, *args, **kwargs)
+        if category is None:
+            update_listing(self.obj, key)
+
+    def batch_add(self, *args, **kwargs):
+        super().batch_add(*args, **kwargs)
+        for key, _, *rest in args:
+            if not rest or rest[0] is None:
+                update_listing(self.obj, key)
+
+    def remove(self, key=None, category=None, *args, **kwargs):
+        super().remove(key, category, *args, **kwargs)
+        if category is None:
+            for removed in key if isinstance(key, (list, tuple)) else [key]:
+                update_listing(self.obj, removed)
+
+
+def _birthday_range(min_age: int | None, max_age: int | None, today) -> tuple[str | None, str | None]:
+    """Returns the earliest and latest birthdays, as Tag keys, of characters within a range of game ages."""
+    # Birthdays are real dates, and the game's ages count the years it's ahead
+    future = settings.YEARS_IN_THE_FUTURE
+    earliest = today.subtract(years=max_age - future + 1).add(days=1).to_date_string() if max_age is not None else None
+    latest = today.subtract(years=min_age - future).to_date_string() if min_age is not None else None
+    return earliest, latest
+
+
+def search_directory(race=None, tier: int | None = None, birth_month: int | None = None, min_age: int | None = None,
+                     max_age: int | None = None, today=None):
+    """
+    Finds listed characters matching everything given, in one query.
+    :param race: A `Race`
+    :param tier: The tier they're at
+    :param birth_month: The month they were born in, from 1 to 12
+    :param min_age: The youngest they can be in the game
+    :param max_age: The oldest they can be in the game
+    :param today: The real date to work out ages on, defaulting to the game clock's
+    :return: A queryset of the characters, ordered by key
+    """
+    from typeclasses.characters import Character
+
+    characters = Character.objects.all_family()
+    criteria = [(RACE_CATEGORY, race.name.lower() if race else None),
+                (TIER_CATEGORY, str(tier) if tier is not None else None),
+                (BIRTH_MONTH_CATEGORY, str(birth_month) if birth_month else None)]
+    filtered = False
+    for category, key in criteria:
+        if key is not None:
+            characters = characters.filter(db_tags__db_key=key, db_tags__db_category=category)
+            filtered = True
+    if min_age is not None or max_age is not None:
+        earliest, latest = _birthday_range(min_age, max_age, today or GAME_CLOCK.today())
+        bounds = {"db_tags__db_key__gte": earliest, "db_tags__db_key__lte": latest}
+        characters = characters.filter(db_tags__db_category=BIRTHDAY_CATEGORY,
+                                       **{lookup: bound for lookup, bound in bounds.items() if bound})
+        filtered = True
+    if not filtered:
+        characters = characters.filter(db_tags__db_key=LISTED_TAG, db_tags__db_category=LISTED_CATEGORY)
+    return characters.order_by("db_key")
+
+
+def backfill_directory(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Lists every finished character, a batch at a time, with one query for each batch's Attributes and bulk inserts for
+    its Tags.
+    :param batch_size: How many characters to list at a time
+    :return: How many characters were listed
+    """
+    from typeclasses.characters import Character
+
+    finished = Character.objects.all_family().exclude(db_attributes__db_key="chargen_step").values_list("id", flat=True)
+    tag_ids, through = {}, ObjectDB.db_tags.through
+    listed, last_id = 0, 0
+    while ids := list(finished.filter(id__gt=last_id).order_by("id")[:batch_size]):
+        last_id = ids[-1]
+        values = {character_id: {} for character_id in ids}
+        rows = Attribute.objects.filter(
+            objectdb__id__in=ids, db_key__in=MIRRORED_ATTRIBUTES, db_category__isnull=True
+        ).values_list("objectdb__id", "db_key", "db_value")
+        for character_id, key, value in rows:
+            values[character_id][key] = from_pickle(value)
+
+        links = []
+        for character_id in ids:
+            tag_keys = _tag_keys(values[character_id])
+            tag_keys[LISTED_CATEGORY] = LISTED_TAG
+            for category, key in tag_keys.items():
+                if key is None:
+                    continue
+                if (key, category) not in tag_ids:
+                    tag_ids[key, category] = ObjectDB.objects.create_tag(key=key, category=category).id
+                links.append(through(objectdb_id=character_id, tag_id=tag_ids[key, category]))
+        through.objects.filter(objectdb_id__in=ids, tag__db_category__in=CATEGORIES).delete()
+        through.objects.bulk_create(links, batch_size=batch_size)
+
+        # Characters already in memory would otherwise keep their old Tags cached
+        for character_id in ids:
+            if cached := ObjectDB.get_cached_instance(character_id):
+                cached.tags.reset_cache()
+        listed += len(ids)
+    return listed
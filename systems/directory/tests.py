@@ -0,0 +1,74 @@
+import pendulum
+from django.test import override_settings
+from evennia.utils.test_resources import EvenniaCommandTest, EvenniaTest
+
+from constants.character import Race
+from systems.directory.commands import CmdDirectory
+from systems.directory.directory import backfill_directory, is_listed, list_character, search_directory
+from typeclasses.characters import Character
+from world.population import generate_world
+
+
+class DirectoryTests(EvenniaTest):
+    """This tests listing characters in the directory and searching it"""
+
+    character_typeclass = Character
+
+    def setUp(self):
+        super().setUp()
+        self.char1.attributes.batch_add(("race", Race.METAHUMAN), ("tier", 4), ("birth_year", 2000), ("birth_month", 3),
+                                        ("birth_day", 10))
+        list_character(self.char1)
+
+    def test_edits_update_listing(self):
+        """Tests that changing a listed character's Attributes updates its Tags"""
+        self.assertEqual(list(search_directory(race=Race.METAHUMAN, tier=4)), [self.char1])
+        self.char1.db.tier = 5
+        self.assertEqual(list(search_directory(tier=4)), [])
+        self.assertEqual(list(search_directory(race=Race.METAHUMAN, tier=5)), [self.char1])
+        self.char1.attributes.remove("race")
+        self.assertEqual(list(search_directory(race=Race.METAHUMAN)), [])
+
+    def test_unlisted_characters(self):
+        """Tests that characters that haven't been listed aren't found"""
+        self.char2.attributes.batch_add(("race", Race.METAHUMAN), ("tier", 4), ("birth_year", 2000), ("birth_month", 3),
+                                        ("birth_day", 10))
+        self.assertFalse(is_listed(self.char2))
+        self.assertEqual(list(search_directory(race=Race.METAHUMAN)), [self.char1])
+        self.assertEqual(list(search_directory()), [self.char1])
+
+    @override_settings(YEARS_IN_THE_FUTURE=2)
+    def test_birthdays(self):
+        """Tests searching by birth month and by age as of a day"""
+        day_before_birthday = pendulum.datetime(2026, 3, 9)
+        self.assertEqual(list(search_directory(birth_month=3)), [self.char1])
+        # Ages are in the game's years, two ahead of the real ones
+        self.assertEqual(list(search_directory(min_age=27, max_age=27, today=day_before_birthday)), [self.char1])
+        self.assertEqual(list(search_directory(min_age=28, today=day_before_birthday)), [])
+        self.assertEqual(list(search_directory(max_age=28, today=pendulum.datetime(2026, 3, 10))), [self.char1])
+        self.assertEqual(list(search_directory(max_age=27, today=pendulum.datetime(2026, 3, 10))), [])
+
+    def test_backfill(self):
+        """Tests that the backfill lists characters made without chargen"""
+        summary = generate_world(rooms=1, accounts=1, characters=3, seed=3)
+        self.assertEqual(list(search_directory(tier=summary.characters[0].db.tier)), [])
+        self.assertEqual(backfill_directory(batch_size=2), 5)
+        char = summary.characters[0]
+        self.assertIn(char, search_directory(race=char.db.race, tier=char.db.tier, birth_month=char.db.birth_month))
+        self.assertEqual(search_directory().count(), 5)
+
+
+class CmdDirectoryTests(EvenniaCommandTest):
+    """This tests the `directory` command"""
+
+    character_typeclass = Character
+
+    def test_search(self):
+        """Tests that matches are listed and bad searches are explained"""
+        self.char2.attributes.batch_add(("race", Race.HUMAN), ("tier", 2), ("birth_year", 1990), ("birth_month", 7),
+                                        ("birth_day", 1), ("intro", "A quiet onlooker"))
+        list_character(self.char2)
+        self.call(CmdDirectory(), "human tier 2 born july", "1 character found:\n  A quiet onlooker")
+        self.call(CmdDirectory(), "human born june", "No characters match that.")
+        self.call(CmdDirectory(), "age old", "'old' isn't an age")
+        self.call(CmdDirectory(), "", "Usage: directory")
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class KarmaConfig(AppConfig):
+    name = "systems.karma"
+    label = "karma"
+    verbose_name = "Karma"
@@ -0,0 +1,84 @@
+"""
+Karma commands
+
+Printer - October 2026
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from evennia.accounts.models import AccountDB
+
+from commands.command import Command
+from systems.karma.karma import award_many, balance, history, leaderboard
+from utils.tick_text import table
+
+# The most accounts shown on the leaderboard
+LEADERBOARD_SIZE = 10
+_USAGE = "Usage: karma [top] | karma award <account>[, <account>...] = <amount> [<reason>]"
+
+
+class CmdKarma(Command):
+    """
+    check your karma
+
+    Usage:
+      karma
+      karma top
+      karma award <account>[, <account>...] = <amount> [<reason>]
+
+    Shows how much karma you have and where your latest karma came from, or
+    with 'top', the accounts with the most karma. Builders can award karma to
+    one or more accounts at once. Negative amounts take karma away.
+
+    Examples:
+      karma award jane, john = 3 End of the bank heist scene
+    """
+
+    key = "karma"
+    locks = "cmd:all()"
+    help_category = "General"
+
+    def func(self):
+        account = self.account or self.caller
+        action, _, rest = self.args.strip().partition(" ")
+        if not action:
+            lines = [f"You have `c{balance(account)}`x karma."]
+            if entries := history(account):
+                rows = [[f"{entry.db_amount:+d}", entry.db_date_created.strftime("%Y-%m-%d"), entry.db_reason]
+                        for entry in entries]
+                lines.append(table(rows, aligns="r", gap=2, indent=2))
+            self.msg("\n".join(lines))
+        elif action.lower() == "top":
+            ranks = leaderboard(LEADERBOARD_SIZE)
+            if not ranks:
+                self.msg("Nobody has any karma yet.")
+                return
+            rows = [[f"{rank}.", username, str(karma)] for rank, (username, karma) in enumerate(ranks, 1)]
+            self.msg(f"`WMost karma:`x\n{table(rows, aligns='rlr', gap=2, indent=2)}")
+        elif action.lower() == "award" and account.check_permstring("Builder"):
+            self.award(rest)
+        else:
+            self.msg(_USAGE)
+
+    def award(self, args: str):
+        names, _, amount = args.partition("=")
+        amount, _, reason = amount.strip().partition(" ")
+        names = [name.strip() for name in names.split(",") if name.strip()]
+        try:
+            amount = int(amount)
+        except ValueError:
+            self.msg(_USAGE)
+            return
+        if not names:
+            self.msg(_USAGE)
+            return
+        matches = reduce(or_, (Q(username__iexact=name) for name in names))
+        found = dict(AccountDB.objects.filter(matches).values_list("username", "id"))
+        missing = sorted({name.lower() for name in names} - {username.lower() for username in found})
+        if missing:
+            self.msg(f"No accounts named {', '.join(missing)}.")
+            return
+        award_many({account_id: amount for account_id in found.values()}, reason.strip())
+        self.msg(f"Awarded {amount} karma to {', '.join(sorted(found))}.")
@@ -0,0 +1,148 @@
+"""
+Karma ledger
+
+Printer - October 2026
+
+Karma is kept in an append-only ledger with one `KarmaEntry` per award or spend, so every account's karma can be
+audited. Each account's running total is cached in a `KarmaBalance` row that's updated in the same transaction as its
+entries, so balances and leaderboards are single indexed reads.
+
+    balance(account)
+    award(account, 5, "Ran a scene")
+    award_many({jane: 3, john: 3, june: 1}, "End of scene")
+    spend(account, 10, "Made Clark Kent")
+    leaderboard(10)
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Sum
+
+from systems.karma.models import KarmaBalance, KarmaEntry
+
+BATCH_SIZE = 500
+# The longest a reason can be, matching `KarmaEntry.db_reason`
+MAX_REASON_LENGTH = 255
+
+
+def _account_id(account) -> int:
+    return account if isinstance(account, int) else account.id
+
+
+def balance(account) -> int:
+    """
+    Reads an account's karma.
+    :param account: An account or account id
+    :return: The account's karma, which is 0 if it has never had any
+    """
+    balances = KarmaBalance.objects.filter(db_account_id=_account_id(account))
+    return balances.values_list("db_balance", flat=True).first() or 0
+
+
+def award_many(awards: dict, reason: str = "", batch_size: int = BATCH_SIZE) -> int:
+    """
+    Awards karma to many accounts at once, in one transaction. Every award gets a ledger entry, and balances are updated
+    with one query for each distinct amount.
+    :param awards: A dict of accounts or account ids to the karma they get. Negative amounts take karma away.
+    :param reason: Why it was awarded
+    :param batch_size: How many rows to insert per query
+    :return: How many accounts were awarded karma
+    """
+    amounts = defaultdict(int)
+    for account, amount in awards.items():
+        amounts[_account_id(account)] += amount
+    amounts = {account_id: amount for account_id, amount in amounts.items() if amount}
+    if not amounts:
+        return 0
+    reason = reason[:MAX_REASON_LENGTH]
+
+    by_amount = defaultdict(list)
+    for account_id, amount in amounts.items():
+        by_amount[amount].append(account_id)
+    with transaction.atomic():
+        KarmaEntry.objects.bulk_create(
+            [KarmaEntry(db_account_id=account_id, db_amount=amount, db_reason=reason)
+             for account_id, amount in amounts.items()],
+            batch_size=batch_size,
+        )
+        KarmaBalance.objects.bulk_create([KarmaBalance(db_account_id=account_id) for account_id in amounts],
+                                         batch_size=batch_size, ignore_conflicts=True)
+        for amount, account_ids in by_amount.items():
+            for start in range(0, len(account_ids), batch_size):
+                KarmaBalance.objects.filter(db_account_id__in=account_ids[start:start + batch_size]).update(
+                    db_balance=F("db_balance") + amount
+                )
+    return len(amounts)
+
+
+def award(account, amount: int, reason: str = ""):
+    """
+    Awards karma to an account.
+    :param account: An account or account id
+    :param amount: How much karma it gets. Negative amounts take karma away, even below 0.
+    :param reason: Why it was awarded
+    """
+    award_many({account: amount}, reason)
+
+
+def spend(account, amount: int, reason: str = "") -> bool:
+    """
+    Spends an account's karma if it has enough. The balance is checked and taken in one update, so two spends at once
+    can't both use the same karma.
+    :param account: An account or account id
+    :param amount: How much karma to spend
+    :param reason: What it was spent on
+    :return: Whether the account could afford it
+    """
+    if amount <= 0:
+        return True
+    account_id = _account_id(account)
+    with transaction.atomic():
+        spent = KarmaBalance.objects.filter(db_account_id=account_id, db_balance__gte=amount).update(
+            db_balance=F("db_balance") - amount
+        )
+        if spent:
+            KarmaEntry.objects.create(db_account_id=account_id, db_amount=-amount, db_reason=reason[:MAX_REASON_LENGTH])
+    return bool(spent)
+
+
+def history(account, count: int = 10) -> list:
+    """
+    Reads an account's latest ledger entries.
+    :param account: An account or account id
+    :param count: How many entries to read
+    :return: A list of `KarmaEntry`s, newest first
+    """
+    entries = KarmaEntry.objects.filter(db_account_id=_account_id(account))
+    return list(entries.order_by("-db_date_created", "-id")[:count])
+
+
+def leaderboard(count: int = 10) -> list[tuple[str, int]]:
+    """
+    Ranks the accounts with the most karma.
+    :param count: How many accounts to rank
+    :return: A list of (username, karma) tuples, highest first
+    """
+    return list(
+        KarmaBalance.objects.filter(db_balance__gt=0)
+        .order_by("-db_balance", "db_account_id")
+        .values_list("db_account__username", "db_balance")[:count]
+    )
+
+
+def rebuild_balances(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Recalculates every cached balance by adding up the ledger, such as after entries were changed by hand.
+    :param batch_size: How many rows to write per query
+    :return: How many balances were rebuilt
+    """
+    totals = dict(KarmaEntry.objects.values("db_account_id").annotate(total=Sum("db_amount"))
+                  .values_list("db_account_id", "total"))
+    with transaction.atomic():
+        KarmaBalance.objects.exclude(db_account_id__in=totals).delete()
+        KarmaBalance.objects.bulk_create(
+            [KarmaBalance(db_account_id=account_id, db_balance=total) for account_id, total in totals.items()],
+            batch_size=batch_size, update_conflicts=True, update_fields=["db_balance"], unique_fields=["db_account"],
+        )
+    return len(totals)
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("accounts", "0012_defaultaccount_alter_accountdb_id_account_bot_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KarmaBalance",
+            fields=[
+                (
+                    "db_account",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="karma_balance",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="account",
+                    ),
+                ),
+                (
+                    "db_balance",
+                    models.IntegerField(
+                        db_index=True, default=0, verbose_name="balance"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Karma Balance",
+            },
+        ),
+        migrations.CreateModel(
+            name="KarmaEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("db_amount", models.IntegerField(verbose_name="amount")),
+                (
+                    "db_reason",
+                    models.CharField(blank=True, max_length=255, verbose_name="reason"),
+                ),
+                (
+                    "db_date_created",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="date created"
+                    ),
+                ),
+                (
+                    "db_account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="karma_entries",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="account",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Karma Entry",
+                "verbose_name_plural": "Karma Entries",
+                "indexes": [
+                    models.Index(
+                        fields=["db_account", "-db_date_created"],
+                        name="karma_entry_history",
+                    )
+                ],
+            },
+        ),
+    ]
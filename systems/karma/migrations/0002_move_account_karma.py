@@ -0,0 +1,54 @@
+from django.db import migrations
+
+
+def move_account_karma(apps, schema_editor):
+    """Moves each account's `karma` Attribute into the ledger as an opening balance."""
+    Attribute = apps.get_model("typeclasses", "Attribute")
+    KarmaEntry = apps.get_model("karma", "KarmaEntry")
+    KarmaBalance = apps.get_model("karma", "KarmaBalance")
+
+    attributes = Attribute.objects.filter(db_key="karma", db_category__isnull=True, accountdb__isnull=False)
+    entries, balances = [], []
+    for account_id, value in attributes.values_list("accountdb__id", "db_value"):
+        if value:
+            entries.append(KarmaEntry(db_account_id=account_id, db_amount=value, db_reason="Opening balance"))
+            balances.append(KarmaBalance(db_account_id=account_id, db_balance=value))
+    KarmaEntry.objects.bulk_create(entries, batch_size=500)
+    KarmaBalance.objects.bulk_create(balances, batch_size=500)
+    attributes.delete()
+
+
+def restore_account_karma(apps, schema_editor):
+    """Puts each account's balance back in a `karma` Attribute. The ledger's history can't be kept."""
+    AccountDB = apps.get_model("accounts", "AccountDB")
+    Attribute = apps.get_model("typeclasses", "Attribute")
+    KarmaEntry = apps.get_model("karma", "KarmaEntry")
+    KarmaBalance = apps.get_model("karma", "KarmaBalance")
+
+    balances = dict(KarmaBalance.objects.values_list("db_account_id", "db_balance"))
+    account_ids = list(AccountDB.objects.values_list("id", flat=True))
+    attributes = Attribute.objects.bulk_create(
+        [Attribute(db_key="karma", db_value=balances.get(account_id, 0)) for account_id in account_ids],
+        batch_size=500,
+    )
+    through = AccountDB.db_attributes.through
+    through.objects.bulk_create(
+        [through(accountdb_id=account_id, attribute_id=attribute.id)
+         for account_id, attribute in zip(account_ids, attributes)],
+        batch_size=500,
+    )
+    KarmaEntry.objects.all().delete()
+    KarmaBalance.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("karma", "0001_initial"),
+        ("accounts", "0012_defaultaccount_alter_accountdb_id_account_bot_and_more"),
+        ("typeclasses", "0017_use_index_instead_of_index_together_in_tags"),
+    ]
+
+    operations = [
+        migrations.RunPython(move_account_karma, restore_account_karma),
+    ]
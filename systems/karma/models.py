@@ -0,0 +1,55 @@
+"""
+Karma models
+
+Printer - October 2026
+"""
+
+from django.db import models
+
+
+class KarmaEntry(models.Model):
+    """
+    One award or spend of karma. Entries are only ever added, so the ledger is a full history of where an account's
+    karma came from and went.
+    """
+
+    db_account = models.ForeignKey(
+        "accounts.AccountDB",
+        on_delete=models.CASCADE,
+        related_name="karma_entries",
+        verbose_name="account",
+    )
+    # Positive for awards and negative for spends
+    db_amount = models.IntegerField("amount")
+    db_reason = models.CharField("reason", max_length=255, blank=True)
+    db_date_created = models.DateTimeField("date created", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Karma Entry"
+        verbose_name_plural = "Karma Entries"
+        indexes = [models.Index(fields=["db_account", "-db_date_created"], name="karma_entry_history")]
+
+    def __str__(self):
+        return f"{self.db_amount:+d} for {self.db_account_id}: {self.db_reason}"
+
+
+class KarmaBalance(models.Model):
+    """
+    An account's running karma total, the sum of its ledger entries. It's updated in the same transaction as every
+    entry, so reading or ranking balances never has to add up the ledger.
+    """
+
+    db_account = models.OneToOneField(
+        "accounts.AccountDB",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="karma_balance",
+        verbose_name="account",
+    )
+    db_balance = models.IntegerField("balance", default=0, db_index=True)
+
+    class Meta:
+        verbose_name = "Karma Balance"
+
+    def __str__(self):
+        return f"{self.db_account_id}: {self.db_balance}"
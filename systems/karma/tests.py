@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from evennia.utils.test_resources import EvenniaCommandTest, EvenniaTest
+
+from systems.karma.commands import CmdKarma
+from systems.karma.karma import award, award_many, balance, history, leaderboard, rebuild_balances, spend
+from systems.karma.models import KarmaBalance, KarmaEntry
+
+
+class KarmaLedgerTests(EvenniaTest):
+    """This tests keeping karma in the ledger and its cached balances"""
+
+    def test_award(self):
+        """Tests that awards are recorded in the ledger and added to the balance"""
+        self.assertEqual(balance(self.account), 0)
+        award(self.account, 5, "Ran a scene")
+        award(self.account.id, -2, "Spam")
+        self.assertEqual(balance(self.account), 3)
+        self.assertEqual([(entry.db_amount, entry.db_reason) for entry in history(self.account)],
+                         [(-2, "Spam"), (5, "Ran a scene")])
+
+    def test_award_many(self):
+        """Tests that bulk awards take the same few queries however many accounts there are"""
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(award_many({self.account: 3, self.account2: 3}, "End of scene"), 2)
+        with CaptureQueriesContext(connection) as more_queries:
+            award_many({self.account: 3, self.account2: 3}, "End of scene")
+        self.assertEqual(len(queries), len(more_queries))
+        self.assertEqual((balance(self.account), balance(self.account2)), (6, 6))
+        self.assertEqual(KarmaEntry.objects.count(), 4)
+
+    def test_spend(self):
+        """Tests that karma can only be spent if there's enough of it"""
+        self.assertFalse(spend(self.account, 1, "Nothing to spend"))
+        award(self.account, 4)
+        self.assertFalse(spend(self.account, 5, "Too much"))
+        self.assertTrue(spend(self.account, 4, "Made a character"))
+        self.assertEqual(balance(self.account), 0)
+        self.assertEqual(KarmaEntry.objects.filter(db_amount__lt=0).count(), 1)
+
+    def test_leaderboard(self):
+        """Tests that accounts are ranked by their balance"""
+        award_many({self.account: 2, self.account2: 7})
+        self.assertEqual(leaderboard(), [(self.account2.username, 7), (self.account.username, 2)])
+        self.assertEqual(leaderboard(1), [(self.account2.username, 7)])
+
+    def test_rebuild_balances(self):
+        """Tests that balances can be rebuilt from the ledger"""
+        award_many({self.account: 2, self.account2: 7})
+        KarmaBalance.objects.filter(db_account=self.account).update(db_balance=100)
+        KarmaEntry.objects.filter(db_account=self.account2).delete()
+        self.assertEqual(rebuild_balances(), 1)
+        self.assertEqual((balance(self.account), balance(self.account2)), (2, 0))
+
+
+class CmdKarmaTests(EvenniaCommandTest):
+    """This tests the `karma` command"""
+
+    def test_karma(self):
+        """Tests that accounts can see their karma and the leaderboard"""
+        award(self.account, 5, "Ran a scene")
+        self.call(CmdKarma(), "", "You have 5 karma.", caller=self.account)
+        self.call(CmdKarma(), "top", "Most karma:\n  1.  TestAccount  5", caller=self.account)
+
+    def test_award(self):
+        """Tests that Builders can award karma to many accounts at once"""
+        self.call(CmdKarma(), f"award {self.account.key}, {self.account2.key} = 3 Good scene",
+                  f"Awarded 3 karma to {self.account.key}, {self.account2.key}.", caller=self.account)
+        self.assertEqual(balance(self.account2), 3)
+        self.call(CmdKarma(), "award nobody = 3", "No accounts named nobody.", caller=self.account)
+        self.call(CmdKarma(), "award nobody = lots", "Usage: karma", caller=self.account)
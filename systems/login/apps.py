@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class LoginConfig(AppConfig):
+    name = "systems.login"
+    label = "login"
+    verbose_name = "Login and Character Creation"
@@ -19,7 +19,9 @@ from evennia.utils.utils import string_partial_matching
 
 from containers.RosterCharacterData import RosterCharacterData
 from server.conf.settings import CHARGEN_MENU
+from systems.karma.karma import balance
 from systems.login.chargen_menu import ChargenEvMenu
+from utils.tick_text import table
 
 _MAX_NR_CHARACTERS = settings.MAX_NR_CHARACTERS
 
@@ -136,7 +138,6 @@ class ContribChargenAccount(DefaultAccount):
     def at_account_creation(self):
         # Roster list mapping playable character names to their RosterCharacterData objects
         self.db.roster = {}
-        self.db.karma = 0
         self.db.email = ""
 
 
@@ -147,10 +148,10 @@ class ContribChargenAccount(DefaultAccount):
     def show_login_info(self) -> str:
         """Displays the login info for the account for when logging in or in OOC mode."""
         roster = self.db.roster
-        text = f"Karma: {self.db.karma}\n"
+        text = f"Karma: {balance(self)}\n"
         if roster:
-            text += "Characters:\n  "
-            text += "\n  ".join(str(roster[character]) for character in roster)
+            text += "Characters:\n"
+            text += table((roster[character].columns() for character in roster), indent=2)
             text += "\nPlease choose a character to play or '`ccreate`x' a new one."
         else:
             text = "You don't have any characters yet. You can '`ccreate`x' one now to start playing."
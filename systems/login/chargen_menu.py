@@ -7,11 +7,16 @@ Printer - February 2025
 import pendulum
 from re import match as regex_match
 
+from evennia.utils import logger
 from evennia.utils.evmenu import EvMenu
 
-from server.conf.settings import YEARS_IN_THE_FUTURE, GAME_TIMEZONE, MINIMUM_CHARACTER_AGE
+from server.conf.settings import YEARS_IN_THE_FUTURE, MINIMUM_CHARACTER_AGE
+from systems.directory.directory import list_character
+from systems.karma.karma import balance
+from systems.login.name_checks import name_is_taken, normalize_name, schedule_name_check
+from systems.login.reservations import confirm_name
+from systems.timekeeping.game_clock import GAME_CLOCK
 from utils.string import listify
-from typeclasses.characters import Character
 from constants.character import (
     MIN_FEET, MAX_FEET,
     MIN_INCHES, MAX_INCHES,
@@ -26,13 +31,17 @@ DEFAULT_TIER = 1
 DEFAULT_FEET, DEFAULT_INCHES = 5, 7
 DEFAULT_BIRTH_YEAR, DEFAULT_BIRTH_MONTH, DEFAULT_BIRTH_DAY = 1980, 1, 1
 
+_NAME_TAKEN_MSG = ("Your first and last name can't match the first and last name of someone else. Also, your first "
+                   "name can't match one of someone else's codenames.")
+
 
 class ChargenData:
     """Stores the data for the character creation menu."""
 
     def __init__(self):
-        self.today = pendulum.today(tz=GAME_TIMEZONE)
         self.first_name, self.last_name = "NewCharacter", ""
+        # `None` while a uniqueness check for the current name is pending
+        self.name_available = None
         self.email = ""
         self.they, self.them, self.their = DEFAULT_THEY, DEFAULT_THEM, DEFAULT_THEIR
         self.race, self.tier, self.modifier = DEFAULT_RACE, DEFAULT_TIER, None
@@ -75,32 +84,30 @@ def node_chargen(caller, raw_string, **kwargs):
     """Manages the character creation menu and displays the text for the menu."""
 
     def _validate_and_update_name(caller, field: str, name: str, **kwargs):
-        """Validates and updates the first or last name entered by the user."""
+        """Validates the format of the first or last name entered by the user and updates it. Uniqueness is checked in
+        the background and the sheet is redrawn once the check completes."""
         if field == "first_name":
             if len(name) < 2:
                 caller.msg("First names must be at least two characters long.")
                 return None, {"data": data}
-            valid = name_validator(caller, name, data.last_name)
+            valid = name_format_validator(caller, name, data.last_name)
         elif field == "last_name":
             if not name:
                 data.last_name = ""
+                start_name_check(caller, data)
                 return None, {"data": data}
             elif len(name) < 2:
                 caller.msg("Last names must be at least two characters long if you're using one.")
                 return None, {"data": data}
-            valid = name_validator(caller, data.first_name, name)
+            valid = name_format_validator(caller, data.first_name, name)
         else:
             raise ValueError(f"Invalid field name: {field}")
 
         if not valid:
-            caller.msg("Your first and last name can't match the first and last name of someone else. Also, your first name can't match one of someone else's codenames.")
+            caller.msg("Names must be alphanumeric and at least two characters long.")
             return None, {"data": data}
-        if field == "first_name":
-            data.first_name = name
-        elif field == "last_name":
-            data.last_name = name
-        else:
-            raise ValueError(f"Invalid field name: {field}")
+        setattr(data, field, name)
+        start_name_check(caller, data)
         return None, {"data": data}
 
     def _validate_and_update_email(caller, email: str, **kwargs):
@@ -160,8 +167,7 @@ def node_chargen(caller, raw_string, **kwargs):
             caller.msg("Invalid birthday. Please enter a date in the format `cYYYY MM DD`x.")
             return None, {"data": data}
 
-        difference = data.today - date
-        if difference.in_years() < MINIMUM_CHARACTER_AGE + YEARS_IN_THE_FUTURE:
+        if GAME_CLOCK.years_since(date.year, date.month, date.day) < MINIMUM_CHARACTER_AGE + YEARS_IN_THE_FUTURE:
             caller.msg(f"Your character must be at least {MINIMUM_CHARACTER_AGE} years old.")
             return None, {"data": data}
         data.birth_month, data.birth_day, data.birth_year = date.month, date.day, date.year
@@ -220,8 +226,10 @@ def node_chargen(caller, raw_string, **kwargs):
         """Handles the `done` command."""
         data = kwargs["data"]
         if not is_ready(caller, data):
-            if not name_validator(caller, data.first_name, data.last_name):
-                caller.msg("Your first and last name can't match the first and last name of someone else. Also, your first name can't match one of someone else's codenames.")
+            if data.name_available is None and name_format_validator(caller, data.first_name, data.last_name):
+                caller.msg("Your name is still being checked. Please try again in a moment.")
+            elif not data.name_available or not name_format_validator(caller, data.first_name, data.last_name):
+                caller.msg(_NAME_TAKEN_MSG)
             if not email_validator(data.email):
                 caller.msg("Invalid email address.")
             if not pronoun_validator(f"{data.they} {data.them} {data.their}"):
@@ -301,6 +309,12 @@ def node_chargen(caller, raw_string, **kwargs):
 
 def node_chargen_end(caller, raw_string, **kwargs):
     data = kwargs["data"]
+    if not confirm_name(caller.new_char.id, data.first_name, data.last_name):
+        # The lease ran out and someone else claimed the name before the character was finished
+        data.name_available = False
+        caller.msg(_NAME_TAKEN_MSG)
+        return "Please choose a new name.", ({"key": "_default", "goto": ("node_chargen", {"data": data})},)
+
     caller.new_char.key = f"{data.first_name}{data.last_name}"
     char_db = caller.new_char.db
     char_db.first_name, char_db.last_name = data.first_name, data.last_name
@@ -318,6 +332,7 @@ def node_chargen_end(caller, raw_string, **kwargs):
     char_db.intro = data.intro
 
     caller.new_char.attributes.remove("chargen_step")
+    list_character(caller.new_char)
 
     text = "Dust settles and your vision clears. With one `cLOOK`x, you know something has gone wrong."
     return text, None
@@ -330,11 +345,23 @@ def node_quit(caller, raw_string, **kwargs):
 
 
 def name_validator(caller, first_name: str, last_name: str) -> bool:
-    """Validates the first or name entered by the user. The first name must be at least one character long.
+    """Validates the first or name entered by the user. The first name must be at least one character long. This blocks
+    on the database to check reservations, so the menu should use `start_name_check` while the user is typing.
     :param caller: The character object.
     :param first_name: The character's first name.
     :param last_name: The character's last name.'
     :return: `True` if the first and last names are both valid, `False` otherwise"""
+    new_char = getattr(caller, "new_char", None)
+    return (name_format_validator(caller, first_name, last_name)
+            and not name_is_taken(first_name, last_name, new_char.id if new_char else None))
+
+
+def name_format_validator(caller, first_name: str, last_name: str) -> bool:
+    """Validates the format of the first and last name without checking if they're already in use.
+    :param caller: The character object.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: `True` if the first and last names are both formatted correctly, `False` otherwise"""
     first_name = caller.account.normalize_username(first_name)
     last_name = caller.account.normalize_username(last_name)
 
@@ -348,13 +375,42 @@ def name_validator(caller, first_name: str, last_name: str) -> bool:
     # If last name is given, it must be at least 2 letters and be alphanumeric
     if last_name and (not last_name.isalnum() or len(last_name) < 2):
         return False
+    return True
+
+
+def start_name_check(caller, data: ChargenData):
+    """Marks the current name as being checked and schedules a deferred reservation of it for the new character. The
+    menu is redrawn when the check completes if the user is still on the chargen sheet.
+    :param caller: The session in character creation.
+    :param data: The data for the character creation menu."""
+    data.name_available = None
+
+    def _on_checked(available: bool, name: tuple[str, str]):
+        if normalize_name(data.first_name, data.last_name) != name:
+            # The name was changed again while this one was being checked
+            return
+        data.name_available = available
+        if not available:
+            caller.msg(_NAME_TAKEN_MSG)
+        redraw_chargen(caller, data)
+
+    def _on_failed(failure, name: tuple[str, str]):
+        logger.log_err(f"Name check for {name} failed: {failure.getTraceback()}")
+        if normalize_name(data.first_name, data.last_name) != name:
+            return
+        data.name_available = False
+        caller.msg("Your name couldn't be checked right now. Please try entering it again.")
+        redraw_chargen(caller, data)
+
+    schedule_name_check(caller, caller.new_char.id, data.first_name, data.last_name, _on_checked, _on_failed)
+
+
+def redraw_chargen(caller, data: ChargenData):
+    """Redisplays the chargen sheet if the caller's menu is still showing `data` on the chargen node."""
+    menu = caller.ndb._evmenu
+    if menu and menu.nodename == "node_chargen" and menu.node_kwargs.get("data") is data:
+        menu.goto("node_chargen", "", data=data)
 
-    duplicate_names = [char for char in Character.objects.all()
-        if char.db.first_name.lower() == first_name.lower() and char.db.last_name.lower() == last_name.lower()]
-    duplicate_codenames = [char for char in Character.objects.all()
-        if (char.db.codename1 and char.db.codename1.lower() == first_name.lower())
-            or (char.db.codename2 and char.db.codename2.lower() == first_name.lower())]
-    return not (duplicate_names or duplicate_codenames)
 
 def email_validator(email: str) -> bool:
     """Validates the email entered by the user. The email must be a valid email address.
@@ -394,8 +450,13 @@ def intro_validator(intro: str) -> bool:
 
 def show_name_lines(caller, data: ChargenData) -> str:
     """Returns the lines with the first and last name of the character."""
-    color = "" if name_validator(caller, data.first_name, data.last_name) else "`R"
-    return f"{color}First name`Y:`c {data.first_name}`x\n{color}Last name`Y:`c {data.last_name}`x"
+    if not name_format_validator(caller, data.first_name, data.last_name):
+        color, marker = "`R", ""
+    elif data.name_available is None:
+        color, marker = "", " `Y(`xchecking…`Y)`x"
+    else:
+        color, marker = ("", "") if data.name_available else ("`R", "")
+    return f"{color}First name`Y:`c {data.first_name}`x{marker}\n{color}Last name`Y:`c {data.last_name}`x"
 
 
 def show_birthday_line(data: ChargenData) -> str:
@@ -429,12 +490,7 @@ def calculate_age(data: ChargenData) -> int:
     """Calculates the age of the character based on their birthday.
     :param data: The data for the character creation menu.
     :return: The age of the character in years."""
-    month = data.birth_month
-    day = data.birth_day
-    year = data.birth_year
-    birthday = pendulum.datetime(year, month, day)
-    difference = data.today - birthday
-    return difference.in_years() + YEARS_IN_THE_FUTURE
+    return GAME_CLOCK.age(data.birth_year, data.birth_month, data.birth_day)
 
 
 def karma_line(caller, data: ChargenData) -> str:
@@ -445,7 +501,7 @@ def karma_line(caller, data: ChargenData) -> str:
     :param data: The data for the character creation menu.
     :return: A line with the character's karma."""
     race, tier = data.race, data.tier
-    karma = caller.account.db.karma
+    karma = balance(caller.account)
     cost = 0
     cost_color = "`R" if cost > 0 else "`G"
     return f"This character would cost {cost_color}{cost}`x karma to create, and you have `c{karma}`x karma."
@@ -462,11 +518,12 @@ def ready_line(caller, data: ChargenData) -> str:
 def is_ready(caller, data: ChargenData) -> bool:
     """Returns whether the character is ready to be created."""
     cost = 0
-    can_afford = cost <= caller.account.db.karma
+    can_afford = cost <= balance(caller.account)
 
     return (
         can_afford
-        and name_validator(caller, data.first_name, data.last_name)
+        and data.name_available
+        and name_format_validator(caller, data.first_name, data.last_name)
         and email_validator(data.email)
         and pronoun_validator(f"{data.they} {data.them} {data.their}")
         and race_tier_modifier_validator(data)
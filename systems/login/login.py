@@ -19,6 +19,7 @@ from evennia.utils.evmenu import EvMenu
 from evennia.utils.utils import class_from_module
 
 from server.conf.connection_screens import CONNECTION_SCREEN
+from systems.login.resume import send_resume_token
 
 _ACCOUNT = class_from_module(settings.BASE_ACCOUNT_TYPECLASS)
 
@@ -204,6 +205,7 @@ def node_quit_or_login(caller, raw_text, **kwargs):
         name = kwargs.get("name")
         if not name:
             session.sessionhandler.login(session, account)
+            send_resume_token(session, account)
             new_user = kwargs.get("new_user")
             if not new_user:
                 account.execute_cmd("create", session=session)
@@ -211,6 +213,7 @@ def node_quit_or_login(caller, raw_text, **kwargs):
 
         session.msg("`YLogging in ...`x")
         session.sessionhandler.login(session, account)
+        send_resume_token(session, account)
         account.execute_cmd(f"ic {name}", session=session)
     else:
         session.sessionhandler.disconnect(session, "Logging off. We hope to see you soon!")
@@ -233,6 +236,32 @@ class MenuLoginEvMenu(EvMenu):
         return ""
 
 
+def start_login_menu(session, startnode: str = "node_enter_username", **kwargs):
+    """
+    Runs the login menu for a session.
+    :param session: The session logging in
+    :param startnode: The node to start at
+    :param kwargs: Passed to the start node, such as the `account` for `node_character_selection`
+    """
+    menu_nodes = {
+        "node_enter_username": node_enter_username,
+        "node_confirm_new_username": node_confirm_new_username,
+        "node_enter_password": node_enter_password,
+        "node_character_selection": node_character_selection,
+        "node_quit_or_login": node_quit_or_login
+    }
+
+    MenuLoginEvMenu(
+        session,
+        menu_nodes,
+        startnode=startnode,
+        startnode_input=("", kwargs),
+        auto_look=False,
+        auto_quit=False,
+        cmd_on_exit=None,
+    )
+
+
 # Commands and CmdSets
 
 
@@ -259,21 +288,4 @@ class CmdUnloggedinLook(Command):
 
     def func(self):
         self.caller.msg(CONNECTION_SCREEN)
-
-        # Run the menu using the nodes in this module.
-        menu_nodes = {
-            "node_enter_username": node_enter_username,
-            "node_confirm_new_username": node_confirm_new_username,
-            "node_enter_password": node_enter_password,
-            "node_character_selection": node_character_selection,
-            "node_quit_or_login": node_quit_or_login
-        }
-
-        MenuLoginEvMenu(
-            self.caller,
-            menu_nodes,
-            startnode="node_enter_username",
-            auto_look=False,
-            auto_quit=False,
-            cmd_on_exit=None,
-        )
+        start_login_menu(self.caller)
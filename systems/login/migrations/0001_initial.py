@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("objects", "0013_defaultobject_alter_objectdb_id_defaultcharacter_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NameReservation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "db_key",
+                    models.CharField(max_length=255, unique=True, verbose_name="key"),
+                ),
+                (
+                    "db_expires",
+                    models.DateTimeField(
+                        blank=True, db_index=True, null=True, verbose_name="expires"
+                    ),
+                ),
+                (
+                    "db_object",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="name_reservations",
+                        to="objects.objectdb",
+                        verbose_name="character",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Name Reservation",
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+"""
+Login and character creation models
+
+Printer - October 2026
+"""
+
+from django.db import models
+
+
+class NameReservation(models.Model):
+    """
+    A claim on a normalized character name. Names entered in chargen are held with a short lease that expires unless
+    it's confirmed when the character is finished. Confirmed reservations never expire and are removed along with the
+    character.
+
+    The unique key means two characters racing for the same name are settled by a single indexed insert.
+    """
+
+    # Normalized name, such as "name:clark kent" or "codename:superman"
+    db_key = models.CharField("key", max_length=255, unique=True)
+    db_object = models.ForeignKey(
+        "objects.ObjectDB",
+        on_delete=models.CASCADE,
+        related_name="name_reservations",
+        verbose_name="character",
+    )
+    # When the lease runs out. This is `None` once the reservation is confirmed.
+    db_expires = models.DateTimeField("expires", null=True, blank=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Name Reservation"
+
+    def __str__(self):
+        return f"{self.db_key} ({'confirmed' if self.db_expires is None else f'until {self.db_expires}'})"
@@ -0,0 +1,104 @@
+"""
+Deferred name uniqueness checks for character creation
+
+Printer - October 2026
+
+Claiming a name means writing to the name reservation table, which we don't want to do on the reactor thread every
+time someone types a name into the chargen menu. The claims here are run with `deferToThread`, debounced per session,
+and concurrent checks for the same normalized name share a single query.
+"""
+
+from twisted.internet import reactor, threads
+from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
+
+from systems.login.reservations import name_holder, reserve_name
+
+# Seconds to wait after the last name change before the query is started
+NAME_CHECK_DEBOUNCE = 0.5
+
+# Maps normalized (first, last) names to the (character id, Deferred) pairs waiting on the query for that name
+_IN_FLIGHT: dict[tuple[str, str], list[tuple[int, Deferred]]] = {}
+
+
+def normalize_name(first_name: str, last_name: str) -> tuple[str, str]:
+    """
+    Normalizes a first and last name so names that only differ by case or padding are treated as the same name.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: A tuple of the normalized first and last name
+    """
+    return first_name.strip().lower(), last_name.strip().lower()
+
+
+def name_is_taken(first_name: str, last_name: str, obj_id: int | None = None) -> bool:
+    """
+    Checks if a first and last name pair belongs to someone else, or if the first name matches someone else's codename.
+    This blocks on the database, so it should be called from a thread or only when a blocking check is required.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :param obj_id: The id of the character asking, whose own reservations don't count.
+    :return: `True` if the name is already in use, `False` otherwise
+    """
+    holder = name_holder(first_name, last_name)
+    return holder is not None and holder != obj_id
+
+
+def check_name_available(obj_id: int, first_name: str, last_name: str) -> Deferred:
+    """
+    Starts a threaded attempt to reserve a name for a character. If a check for the same normalized name is already
+    running, the caller waits on that query instead of starting a new one. Whoever started the query gets the lease, so
+    everyone else waiting on it is told the name is taken.
+    :param obj_id: The id of the character claiming the name.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: A Deferred that fires with `True` if the character holds the name, `False` otherwise
+    """
+    name = normalize_name(first_name, last_name)
+    waiter = Deferred()
+    if name in _IN_FLIGHT:
+        _IN_FLIGHT[name].append((obj_id, waiter))
+    else:
+        _IN_FLIGHT[name] = [(obj_id, waiter)]
+        threads.deferToThread(reserve_name, obj_id, *name).addBoth(_resolve_waiters, name)
+    return waiter
+
+
+def _resolve_waiters(result, name: tuple[str, str]):
+    """Fires every Deferred waiting on the query for `name` with whether its character holds the name."""
+    for obj_id, waiter in _IN_FLIGHT.pop(name, []):
+        if isinstance(result, Failure):
+            waiter.errback(result)
+        else:
+            waiter.callback(result == obj_id)
+
+
+def schedule_name_check(session, obj_id: int, first_name: str, last_name: str, callback, errback):
+    """
+    Schedules a name reservation for the session once it stops changing its name. Any check the session has waiting
+    for the debounce is cancelled and replaced.
+    :param session: The session in character creation.
+    :param obj_id: The id of the character being created.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :param callback: Called with whether the name is available and the normalized name that was checked.
+    :param errback: Called with the Failure and the normalized name if the check fails.
+    """
+    cancel_name_check(session)
+
+    def _start_check():
+        session.ndb._name_check_call = None
+        name = normalize_name(first_name, last_name)
+        check_name_available(obj_id, first_name, last_name).addCallbacks(
+            callback, errback, callbackArgs=(name,), errbackArgs=(name,)
+        )
+
+    session.ndb._name_check_call = reactor.callLater(NAME_CHECK_DEBOUNCE, _start_check)
+
+
+def cancel_name_check(session):
+    """Cancels the session's pending name check if it hasn't started yet."""
+    pending = session.ndb._name_check_call
+    if pending and pending.active():
+        pending.cancel()
+    session.ndb._name_check_call = None
@@ -0,0 +1,154 @@
+"""
+Character name reservations
+
+Printer - October 2026
+
+Names are reserved in an indexed table so a name can be claimed with one insert instead of comparing it against every
+character. A name entered in chargen gets a short lease, which is confirmed once the character is finished. Leases that
+run out are reaped in a batch by the `NameReservationReaper` script.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from systems.login.models import NameReservation
+from typeclasses.scripts import Script
+
+_LEASE_DURATION = timedelta(seconds=settings.NAME_RESERVATION_LEASE)
+
+NAME_PREFIX = "name:"
+CODENAME_PREFIX = "codename:"
+
+
+def name_key(first_name: str, last_name: str) -> str:
+    """Returns the reservation key for a first and last name."""
+    return f"{NAME_PREFIX}{first_name.strip().lower()} {last_name.strip().lower()}"
+
+
+def codename_key(codename: str) -> str:
+    """Returns the reservation key for a codename."""
+    return f"{CODENAME_PREFIX}{codename.strip().lower()}"
+
+
+def name_holder(first_name: str, last_name: str) -> int | None:
+    """
+    Finds who is holding a name. A first name matching someone's codename counts as held by them.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: The id of the character with a live reservation on the name, or `None` if it's free
+    """
+    return (
+        NameReservation.objects.filter(db_key__in=(name_key(first_name, last_name), codename_key(first_name)))
+        .exclude(db_expires__lt=timezone.now())
+        .values_list("db_object_id", flat=True)
+        .first()
+    )
+
+
+def reserve_name(obj_id: int, first_name: str, last_name: str) -> int | None:
+    """
+    Tries to lease a name for a character. If the character already holds the name, the lease is renewed. Any other
+    unconfirmed name the character was holding is released.
+    :param obj_id: The id of the character claiming the name.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: The id of the character holding the name afterward, which is `obj_id` if the reservation succeeded
+    """
+    key = name_key(first_name, last_name)
+    now = timezone.now()
+    expires = now + _LEASE_DURATION
+
+    codename_holder = (
+        NameReservation.objects.filter(db_key=codename_key(first_name))
+        .exclude(db_object_id=obj_id)
+        .values_list("db_object_id", flat=True)
+        .first()
+    )
+    if codename_holder:
+        return codename_holder
+
+    with transaction.atomic():
+        NameReservation.objects.filter(
+            db_object_id=obj_id, db_key__startswith=NAME_PREFIX, db_expires__isnull=False
+        ).exclude(db_key=key).delete()
+        try:
+            with transaction.atomic():
+                NameReservation.objects.create(db_key=key, db_object_id=obj_id, db_expires=expires)
+            return obj_id
+        except IntegrityError:
+            pass
+
+        # Renew our own lease, or take over one that has run out but hasn't been reaped yet
+        claimed = NameReservation.objects.filter(
+            Q(db_object_id=obj_id, db_expires__isnull=False) | Q(db_expires__lt=now), db_key=key
+        ).update(db_object_id=obj_id, db_expires=expires)
+        if claimed:
+            return obj_id
+        return NameReservation.objects.filter(db_key=key).values_list("db_object_id", flat=True).first()
+
+
+def confirm_name(obj_id: int, first_name: str, last_name: str) -> bool:
+    """
+    Makes a character's lease on a name permanent. The lease is reacquired first in case it ran out.
+    :param obj_id: The id of the character claiming the name.
+    :param first_name: The character's first name.
+    :param last_name: The character's last name.
+    :return: `True` if the character now owns the name, `False` if someone else holds it
+    """
+    with transaction.atomic():
+        if reserve_name(obj_id, first_name, last_name) != obj_id:
+            return False
+        NameReservation.objects.filter(db_key=name_key(first_name, last_name), db_object_id=obj_id).update(
+            db_expires=None
+        )
+    return True
+
+
+def release_names(obj_id: int):
+    """Releases every name reserved by a character."""
+    NameReservation.objects.filter(db_object_id=obj_id).delete()
+
+
+def reap_expired_reservations() -> int:
+    """
+    Deletes every lease that has run out in one query.
+    :return: The number of leases removed
+    """
+    deleted, _ = NameReservation.objects.filter(db_expires__lt=timezone.now()).delete()
+    return deleted
+
+
+def backfill_name_reservations() -> int:
+    """
+    Reserves the names and codenames of existing characters. This only does anything when there are no confirmed
+    reservations yet, such as the first start after the reservation table was added.
+    :return: The number of reservations created
+    """
+    from typeclasses.characters import Character
+
+    if NameReservation.objects.filter(db_expires__isnull=True).exists():
+        return 0
+
+    reservations = []
+    # Characters still in chargen reserve their names through the menu
+    for char in Character.objects.exclude(db_attributes__db_key="chargen_step"):
+        char_db = char.db
+        if char_db.first_name:
+            reservations.append(NameReservation(db_key=name_key(char_db.first_name, char_db.last_name or ""),
+                                                db_object_id=char.id))
+        for codename in (char_db.codename1, char_db.codename2):
+            if codename:
+                reservations.append(NameReservation(db_key=codename_key(codename), db_object_id=char.id))
+    NameReservation.objects.bulk_create(reservations, ignore_conflicts=True)
+    return len(reservations)
+
+
+class NameReservationReaper(Script):
+    """Periodically removes name leases that have run out. This is started through `GLOBAL_SCRIPTS`."""
+
+    def at_repeat(self):
+        reap_expired_reservations()
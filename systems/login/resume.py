@@ -0,0 +1,89 @@
+"""
+Reconnect resume tokens
+
+Printer - October 2026
+
+Logging in through the menu hashes the account's password, which is slow on purpose. When a session logs in it's sent a
+signed, short-lived resume token as the `resume_token` OOB command (`Resume.Token` over GMCP), and a client that
+reconnects can send it back with the `resume` input function (`Core.Resume` over GMCP) to skip the login menu. The
+session goes straight back to its last character, or to character selection if there isn't one.
+
+Tokens are signed with Django's HMAC signing and carry the account's token generation. Bumping the generation with
+`revoke_resume_tokens`, which happens whenever the password changes, makes every token issued before it invalid.
+"""
+
+from django.conf import settings
+from django.core import signing
+from evennia.utils import logger
+
+# Keeps resume token signatures apart from anything else signed with the secret key
+_SALT = "systems.login.resume"
+
+
+def _generation(account) -> int:
+    return account.attributes.get("resume_generation", default=0)
+
+
+def issue_resume_token(account) -> str:
+    """
+    Signs a resume token for an account.
+    :param account: The account logging in
+    :return: The token
+    """
+    return signing.dumps({"account": account.id, "generation": _generation(account)}, salt=_SALT)
+
+
+def revoke_resume_tokens(account):
+    """Makes every resume token issued for an account so far invalid."""
+    account.attributes.add("resume_generation", _generation(account) + 1)
+
+
+def verify_resume_token(token: str):
+    """
+    Checks a resume token's signature, age and generation.
+    :param token: The token a client sent
+    :return: The account it was issued for, or `None` if it isn't valid
+    """
+    from evennia.accounts.models import AccountDB
+
+    try:
+        payload = signing.loads(token, salt=_SALT, max_age=settings.RESUME_TOKEN_LIFETIME)
+        account = AccountDB.objects.get(id=payload["account"])
+    except (signing.BadSignature, AccountDB.DoesNotExist, KeyError, TypeError):
+        return None
+    if not account.is_active or payload["generation"] != _generation(account):
+        return None
+    return account
+
+
+def send_resume_token(session, account):
+    """Sends a session a fresh resume token for the account it's logging into."""
+    session.msg(resume_token=((issue_resume_token(account),), {"lifetime": settings.RESUME_TOKEN_LIFETIME}))
+
+
+def resume_session(session, token: str) -> bool:
+    """
+    Logs a session in with a resume token instead of the login menu.
+    :param session: The session at the login menu
+    :param token: The token it sent
+    :return: Whether the session was logged in
+    """
+    # Imported here since the login menu imports this module
+    from systems.login.login import node_quit_or_login, start_login_menu
+
+    if session.logged_in:
+        return False
+    account = verify_resume_token(token)
+    if not account or account.is_banned(username=account.username, ip=session.address):
+        logger.log_sec(f"Resume token rejected (IP: {session.address}).")
+        return False
+
+    if session.ndb._evmenu:
+        session.ndb._evmenu.close_menu()
+    logger.log_sec(f"Session resumed with a token for {account} (IP: {session.address}).")
+    last_puppet = account.db._last_puppet
+    if last_puppet and account.is_playable_name(last_puppet.key):
+        node_quit_or_login(session, "", login=True, account=account, name=last_puppet.key)
+    else:
+        start_login_menu(session, startnode="node_character_selection", account=account)
+    return True
@@ -0,0 +1,168 @@
+import unittest
+from datetime import timedelta
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import evennia
+from django.test import override_settings
+from django.utils import timezone
+from evennia.server.serversession import ServerSession
+from evennia.utils.test_resources import EvenniaTest
+from twisted.internet.defer import Deferred
+
+from containers.RosterCharacterData import RosterCharacterData
+from systems.login import name_checks
+from systems.login.models import NameReservation
+from systems.login.reservations import (
+    codename_key, confirm_name, name_key, reap_expired_reservations, reserve_name
+)
+from systems.login.resume import issue_resume_token, resume_session, revoke_resume_tokens, verify_resume_token
+
+
+class CheckNameAvailableTests(unittest.TestCase):
+    """This tests collapsing concurrent checks in `check_name_available`"""
+
+    def setUp(self):
+        self.query = Deferred()
+        patcher = patch.object(name_checks.threads, "deferToThread", return_value=self.query)
+        self.defer_to_thread = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(name_checks._IN_FLIGHT.clear)
+
+    def test_same_name_shares_query(self):
+        """Tests that checks for the same normalized name only run one query"""
+        results = []
+        name_checks.check_name_available(1, "Clark", "Kent").addCallback(results.append)
+        name_checks.check_name_available(1, " clark", "KENT ").addCallback(results.append)
+        self.assertEqual(self.defer_to_thread.call_count, 1)
+        self.query.callback(1)
+        self.assertEqual(results, [True, True])
+        self.assertEqual(name_checks._IN_FLIGHT, {})
+
+    def test_shared_query_goes_to_first_claimant(self):
+        """Tests that only the character whose query claimed the name is told it's available"""
+        results = []
+        name_checks.check_name_available(1, "Clark", "Kent").addCallback(results.append)
+        name_checks.check_name_available(2, "Clark", "Kent").addCallback(results.append)
+        self.query.callback(1)
+        self.assertEqual(results, [True, False])
+
+    def test_taken_name(self):
+        """Tests that a name found by the query is reported as unavailable"""
+        results = []
+        name_checks.check_name_available(1, "Clark", "Kent").addCallback(results.append)
+        self.query.callback(2)
+        self.assertEqual(results, [False])
+
+    def test_new_query_after_completion(self):
+        """Tests that a finished query isn't reused for later checks"""
+        name_checks.check_name_available(1, "Clark", "Kent")
+        self.query.callback(1)
+        name_checks.check_name_available(1, "Clark", "Kent")
+        self.assertEqual(self.defer_to_thread.call_count, 2)
+
+
+class ScheduleNameCheckTests(unittest.TestCase):
+    """This tests the per-session debounce in `schedule_name_check`"""
+
+    def test_reschedule_cancels_pending_check(self):
+        """Tests that a new name replaces the session's pending check"""
+        session = MagicMock()
+        session.ndb._name_check_call = None
+        with patch.object(name_checks.reactor, "callLater") as call_later:
+            first_call = MagicMock()
+            first_call.active.return_value = True
+            call_later.return_value = first_call
+            name_checks.schedule_name_check(session, 1, "Clark", "Kent", None, None)
+            name_checks.schedule_name_check(session, 1, "Bruce", "Wayne", None, None)
+        first_call.cancel.assert_called_once()
+        self.assertEqual(call_later.call_count, 2)
+
+
+class NameReservationTests(EvenniaTest):
+    """This tests leasing and confirming names in `systems.login.reservations`"""
+
+    def test_conflicting_lease(self):
+        """Tests that a name leased by one character can't be claimed by another"""
+        self.assertEqual(reserve_name(self.char1.id, "Clark", "Kent"), self.char1.id)
+        self.assertEqual(reserve_name(self.char2.id, "clark", "kent"), self.char1.id)
+
+    def test_changing_name_releases_lease(self):
+        """Tests that leasing a new name frees the character's previous unconfirmed name"""
+        reserve_name(self.char1.id, "Clark", "Kent")
+        reserve_name(self.char1.id, "Bruce", "Wayne")
+        self.assertEqual(reserve_name(self.char2.id, "Clark", "Kent"), self.char2.id)
+
+    def test_expired_lease_can_be_taken(self):
+        """Tests that a lease that ran out can be claimed before it's reaped"""
+        reserve_name(self.char1.id, "Clark", "Kent")
+        NameReservation.objects.update(db_expires=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(reserve_name(self.char2.id, "Clark", "Kent"), self.char2.id)
+
+    def test_codename_blocks_first_name(self):
+        """Tests that a first name can't match someone else's codename"""
+        NameReservation.objects.create(db_key=codename_key("Superman"), db_object_id=self.char2.id)
+        self.assertEqual(reserve_name(self.char1.id, "Superman", ""), self.char2.id)
+
+    def test_confirm_and_reap(self):
+        """Tests that confirmed names survive reaping while expired leases don't"""
+        reserve_name(self.char1.id, "Clark", "Kent")
+        reserve_name(self.char2.id, "Bruce", "Wayne")
+        self.assertTrue(confirm_name(self.char1.id, "Clark", "Kent"))
+        NameReservation.objects.exclude(db_expires=None).update(db_expires=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(reap_expired_reservations(), 1)
+        self.assertTrue(NameReservation.objects.filter(db_key=name_key("Clark", "Kent")).exists())
+        self.assertFalse(confirm_name(self.char2.id, "Clark", "Kent"))
+
+
+class ResumeTokenTests(EvenniaTest):
+    """This tests issuing, checking and logging in with resume tokens"""
+
+    def test_round_trip(self):
+        """Tests that a fresh token is good for the account it was issued for"""
+        self.assertEqual(verify_resume_token(issue_resume_token(self.account)), self.account)
+
+    def test_tampered(self):
+        """Tests that a token that's been changed is rejected"""
+        token = issue_resume_token(self.account)
+        self.assertIsNone(verify_resume_token(token[:-1] + ("A" if token[-1] != "A" else "B")))
+        self.assertIsNone(verify_resume_token("not a token"))
+
+    def test_revoked(self):
+        """Tests that revoking an account's tokens, including by changing its password, invalidates them"""
+        token = issue_resume_token(self.account)
+        revoke_resume_tokens(self.account)
+        self.assertIsNone(verify_resume_token(token))
+        token = issue_resume_token(self.account)
+        self.account.set_password("anewpassword")
+        self.assertIsNone(verify_resume_token(token))
+
+    def test_expired(self):
+        """Tests that tokens stop working once their lifetime is up"""
+        token = issue_resume_token(self.account)
+        with override_settings(RESUME_TOKEN_LIFETIME=-1):
+            self.assertIsNone(verify_resume_token(token))
+
+    def test_resume_puppets_last_character(self):
+        """Tests that resuming logs the session in and puts it back in its last character"""
+        entry = RosterCharacterData()
+        entry.name = self.char1.key
+        self.account.db.roster = {self.char1.key.lower(): entry}
+        self.account.characters.add(self.char1)
+        self.account.db._last_puppet = self.char1
+
+        handler = evennia.SESSION_HANDLER
+        patcher = patch.object(handler, "login", partial(type(handler).login, handler, testmode=True))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        session = ServerSession()
+        session.init_session("telnet", ("localhost", "test"), handler)
+        session.sessid = 600
+        handler[session.sessid] = session
+        try:
+            self.assertTrue(resume_session(session, issue_resume_token(self.account)))
+            self.assertTrue(session.logged_in)
+            self.assertEqual(session.puppet, self.char1)
+        finally:
+            # Deleting the account would otherwise try to disconnect the session from the portal
+            handler.pop(session.sessid)
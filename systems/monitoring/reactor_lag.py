@@ -0,0 +1,74 @@
+"""
+Reactor lag monitor
+
+Printer - October 2026
+
+Measures how late the server's reactor runs a timer it scheduled, which is how long anything else waiting on the reactor
+is being held up. The monitor is started as a server plugin service, and its recent samples can be read by clients
+through the `reactor_lag` input function.
+"""
+
+from collections import deque
+from time import monotonic
+
+from twisted.application.service import Service
+from twisted.internet import reactor
+
+# Seconds between lag samples
+SAMPLE_INTERVAL = 0.1
+# Seconds of samples kept for reporting
+SAMPLE_HISTORY = 5 * 60
+
+
+class ReactorLagMonitor(Service):
+    """A service that samples the reactor's lag by timing how late a repeating timer fires."""
+
+    name = "ReactorLagMonitor"
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, history: float = SAMPLE_HISTORY):
+        self.interval = interval
+        # (time sampled, lag in seconds) pairs
+        self.samples = deque(maxlen=int(history / interval))
+        self._call = None
+        self._scheduled_for = None
+
+    def startService(self):
+        super().startService()
+        self._schedule()
+
+    def stopService(self):
+        if self._call and self._call.active():
+            self._call.cancel()
+        self._call = None
+        return super().stopService()
+
+    def _schedule(self):
+        self._scheduled_for = monotonic() + self.interval
+        self._call = reactor.callLater(self.interval, self._sample)
+
+    def _sample(self):
+        now = monotonic()
+        self.samples.append((now, max(0.0, now - self._scheduled_for)))
+        self._schedule()
+
+    def stats(self, window: float = 5.0) -> dict:
+        """
+        Summarizes the lag over recent samples.
+        :param window: How many seconds back to look
+        :return: A dict with the latest, mean, 95th percentile and maximum lag in seconds, and the sample count
+        """
+        cutoff = monotonic() - window
+        lags = sorted(lag for sampled, lag in self.samples if sampled >= cutoff)
+        if not lags:
+            return {"current": 0.0, "mean": 0.0, "p95": 0.0, "max": 0.0, "samples": 0}
+        return {
+            "current": self.samples[-1][1],
+            "mean": sum(lags) / len(lags),
+            "p95": lags[min(len(lags) - 1, int(len(lags) * 0.95))],
+            "max": lags[-1],
+            "samples": len(lags),
+        }
+
+
+# The monitor started by `server_services_plugins`
+LAG_MONITOR = ReactorLagMonitor()
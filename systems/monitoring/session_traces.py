@@ -0,0 +1,98 @@
+"""
+Session traces
+
+Printer - October 2026
+
+Records what sessions send to the server, so real load such as an event night or a launch wave can be replayed against a
+test server with `benchmarks.replay`. Recording is off unless `SESSION_TRACE_FILE` is set.
+
+A trace is an append-only file with one JSON array per line, starting with the time it was received and the session id:
+
+    [time, sessid, "connect", protocol_key]
+    [time, sessid, "input", cmdname, args, kwargs, duration]
+    [time, sessid, "password", duration]
+    [time, sessid, "disconnect"]
+
+`duration` is how many seconds the server spent handling the input before returning to the reactor. Passwords entered at
+the login menu are recorded as "password" lines without their text unless `SESSION_TRACE_ANONYMIZE` is turned off.
+"""
+
+import json
+
+from django.conf import settings
+
+# The login menu node that takes passwords
+PASSWORD_NODE = "node_enter_password"
+
+# The recorder for `SESSION_TRACE_FILE`, or `False` if recording is off. Set on first use.
+_RECORDER = None
+
+
+class TraceRecorder:
+    """Appends session events to a trace file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def _write(self, *record):
+        if self._file is None:
+            # Line buffered, so a crash loses at most the line being written
+            self._file = open(self.path, "a", buffering=1, encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+    def record_connect(self, session, received: float):
+        self._write(round(received, 3), session.sessid, "connect", session.protocol_key)
+
+    def record_input(self, session, received: float, inputs: dict, duration: float, redact: bool = False):
+        """
+        Records the input functions called by one message from a session.
+        :param session: The session the input came from
+        :param received: When it was received, as a Unix time
+        :param inputs: The input in `data_in` form, `{cmdname: (args, kwargs)}`
+        :param duration: Seconds spent handling the whole message
+        :param redact: Whether text input is a password that should be left out
+        """
+        received, duration = round(received, 3), round(duration, 6)
+        for cmdname, (args, kwargs) in inputs.items():
+            if redact and cmdname == "text":
+                self._write(received, session.sessid, "password", duration)
+            else:
+                self._write(received, session.sessid, "input", cmdname, args, kwargs, duration)
+
+    def record_disconnect(self, session, received: float):
+        self._write(round(received, 3), session.sessid, "disconnect")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def trace_recorder() -> TraceRecorder | None:
+    """Returns the recorder for `SESSION_TRACE_FILE`, or `None` if recording is off."""
+    global _RECORDER
+    if _RECORDER is None:
+        path = getattr(settings, "SESSION_TRACE_FILE", None)
+        _RECORDER = TraceRecorder(path) if path else False
+    return _RECORDER or None
+
+
+def is_entering_password(session) -> bool:
+    """Returns whether a session's next text input is a password for the login menu."""
+    menu = session.ndb._evmenu
+    return bool(menu) and getattr(menu, "nodename", None) == PASSWORD_NODE
+
+
+def read_trace(path: str):
+    """
+    Reads a trace file, skipping a partly written last line.
+    :param path: The trace file
+    :return: A generator of the records as lists
+    """
+    with open(path, encoding="utf-8") as trace_file:
+        for line in trace_file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from server.conf.serversession import ServerSession
+from systems.monitoring import reactor_lag, session_traces
+from systems.monitoring.reactor_lag import ReactorLagMonitor
+from systems.monitoring.session_traces import TraceRecorder, read_trace
+
+
+class ReactorLagMonitorTests(unittest.TestCase):
+    """This tests summarizing samples in `ReactorLagMonitor`"""
+
+    def setUp(self):
+        self.monitor = ReactorLagMonitor(interval=0.1, history=10)
+        patcher = patch.object(reactor_lag, "monotonic", return_value=100.0)
+        self.monotonic = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_samples(self):
+        """Tests that an idle monitor reports no lag"""
+        self.assertEqual(self.monitor.stats(), {"current": 0.0, "mean": 0.0, "p95": 0.0, "max": 0.0, "samples": 0})
+
+    def test_window(self):
+        """Tests that only samples inside the window are summarized"""
+        self.monitor.samples.extend([(90.0, 5.0), (97.0, 0.5), (98.0, 0.1), (99.0, 0.3)])
+        stats = self.monitor.stats(window=5)
+        self.assertEqual(stats["samples"], 3)
+        self.assertEqual(stats["max"], 0.5)
+        self.assertEqual(stats["current"], 0.3)
+        self.assertAlmostEqual(stats["mean"], 0.3)
+
+    def test_sample_measures_lateness(self):
+        """Tests that a sample records how late its timer fired"""
+        self.monitor._scheduled_for = 99.75
+        with patch.object(self.monitor, "_schedule"):
+            self.monitor._sample()
+        self.assertEqual(list(self.monitor.samples), [(100.0, 0.25)])
+
+
+class SessionTraceTests(EvenniaTest):
+    """This tests recording session input with `TraceRecorder`"""
+
+    def setUp(self):
+        super().setUp()
+        handle, self.path = tempfile.mkstemp(suffix=".trace")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.recorder = TraceRecorder(self.path)
+        self.addCleanup(self.recorder.close)
+        patcher = patch.object(session_traces, "_RECORDER", self.recorder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.traced = ServerSession()
+        self.traced.init_session("telnet", ("localhost", "test"), MagicMock())
+        self.traced.sessid = 500
+
+    def _records(self):
+        self.recorder.close()
+        return list(read_trace(self.path))
+
+    def test_records_input(self):
+        """Tests that input is recorded with its arguments and handled as usual"""
+        self.traced.data_in(text=(["look"], {}))
+        self.traced.sessionhandler.call_inputfuncs.assert_called_once_with(self.traced, text=(["look"], {}))
+        records = self._records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0][1:6], [500, "input", "text", ["look"], {}])
+
+    def test_anonymizes_passwords(self):
+        """Tests that text sent to the password node is left out"""
+        self.traced.ndb._evmenu = MagicMock(nodename="node_enter_password")
+        self.traced.data_in(text=(["hunter2"], {}))
+        records = self._records()
+        self.assertEqual(records[0][1:3], [500, "password"])
+        self.assertNotIn("hunter2", str(records))
+
+    def test_skips_partial_lines(self):
+        """Tests that a line cut off by a crash is skipped when reading"""
+        self.recorder.record_disconnect(self.traced, 1.0)
+        self.recorder.close()
+        with open(self.path, "a") as trace_file:
+            trace_file.write('[2.0,500,"inp')
+        self.assertEqual(self._records(), [[1.0, 500, "disconnect"]])
@@ -0,0 +1,199 @@
+"""
+Room graph
+
+Printer - October 2026
+
+Keeps every exit in the game as an edge between rooms in memory, so routes for NPC movement, walking somewhere or
+distance checks don't have to look exits up room by room. The graph is loaded with one query the first time it's used,
+or when the server starts, and exits update it themselves when they're created, deleted, moved or relinked.
+
+Rooms are numbered in the order they're first seen, and each room keeps the rooms its exits lead to and the exits' ids in
+integer arrays. Routes are found with a breadth-first search, since rooms have no coordinates to guide a smarter search,
+and the last `ROUTE_CACHE_SIZE` routes are cached until the graph next changes.
+
+    from systems.navigation.room_graph import ROOM_GRAPH
+
+    ROOM_GRAPH.directions(caller.location, target_room)  # ["north", "east", "up"]
+    ROOM_GRAPH.distance(caller.location, target_room)    # 3
+
+Exits' traverse locks aren't part of the graph, so anything walking a route still has to be let through each exit.
+"""
+
+from array import array
+from collections import OrderedDict, deque
+
+# Routes kept in the route cache
+ROUTE_CACHE_SIZE = 1024
+
+
+def _object_id(obj) -> int:
+    return obj if isinstance(obj, int) else obj.id
+
+
+class RoomGraph:
+    """Rooms linked by the exits between them."""
+
+    def __init__(self):
+        self.counters = {"hits": 0, "misses": 0}
+        self._reset()
+
+    def _reset(self):
+        self.loaded = False
+        # Room id to its node number, and node number to room id
+        self.nodes = {}
+        self.rooms = array("q")
+        # For each node, the nodes its exits lead to and the ids of those exits, in the same order
+        self.targets = []
+        self.exits = []
+        # Exit id to its source node, target node and key
+        self.edges = {}
+        self.routes = OrderedDict()
+
+    def _node(self, room_id: int) -> int:
+        """Returns a room's node number, adding it to the graph if it's new."""
+        node = self.nodes.get(room_id)
+        if node is None:
+            node = self.nodes[room_id] = len(self.rooms)
+            self.rooms.append(room_id)
+            self.targets.append(array("l"))
+            self.exits.append(array("q"))
+        return node
+
+    def _link(self, exit_id: int, key: str, source_id: int, target_id: int):
+        source, target = self._node(source_id), self._node(target_id)
+        self.targets[source].append(target)
+        self.exits[source].append(exit_id)
+        self.edges[exit_id] = (source, target, key)
+
+    def _unlink(self, exit_id: int) -> bool:
+        edge = self.edges.pop(exit_id, None)
+        if edge is None:
+            return False
+        exits = self.exits[edge[0]]
+        position = exits.index(exit_id)
+        del exits[position]
+        del self.targets[edge[0]][position]
+        return True
+
+    def load(self):
+        """Builds the graph from every object in the database that has a location and a destination."""
+        from evennia.objects.models import ObjectDB
+
+        self._reset()
+        linked = ObjectDB.objects.filter(db_location__isnull=False, db_destination__isnull=False)
+        for exit_id, key, source_id, target_id in linked.values_list("id", "db_key", "db_location_id",
+                                                                      "db_destination_id").order_by("id"):
+            self._link(exit_id, key, source_id, target_id)
+        self.loaded = True
+
+    def update_exit(self, exit_obj):
+        """
+        Puts an exit's current location, destination and key into the graph. Exits without both a location and a
+        destination are taken out of it.
+        :param exit_obj: The exit that was created, moved, relinked or renamed
+        """
+        if not self.loaded or not exit_obj.id:
+            return
+        changed = self._unlink(exit_obj.id)
+        if exit_obj.location and exit_obj.destination:
+            self._link(exit_obj.id, exit_obj.key, exit_obj.location.id, exit_obj.destination.id)
+            changed = True
+        if changed:
+            self.routes.clear()
+
+    def remove_exit(self, exit_id: int):
+        if self.loaded and self._unlink(exit_id):
+            self.routes.clear()
+
+    def route(self, start, goal, max_steps: int | None = None) -> tuple[int, ...] | None:
+        """
+        Finds the shortest way from one room to another.
+        :param start: The room to start from, or its id
+        :param goal: The room to get to, or its id
+        :param max_steps: The most exits to go through before giving up
+        :return: The ids of the exits to go through in order, or `None` if there's no way there
+        """
+        if not self.loaded:
+            self.load()
+        key = (_object_id(start), _object_id(goal), max_steps)
+        if key in self.routes:
+            self.counters["hits"] += 1
+            self.routes.move_to_end(key)
+            return self.routes[key]
+
+        self.counters["misses"] += 1
+        route = self._search(*key)
+        self.routes[key] = route
+        if len(self.routes) > ROUTE_CACHE_SIZE:
+            self.routes.popitem(last=False)
+        return route
+
+    def _search(self, start_id: int, goal_id: int, max_steps: int | None) -> tuple[int, ...] | None:
+        """Runs a breadth-first search between two rooms."""
+        start, goal = self.nodes.get(start_id), self.nodes.get(goal_id)
+        if start_id == goal_id:
+            return ()
+        if start is None or goal is None:
+            return None
+        # The exit taken into each node reached so far, and how many steps away it is
+        came_by = array("q", [-1]) * len(self.rooms)
+        steps = array("l", [-1]) * len(self.rooms)
+        steps[start] = 0
+        frontier = deque([start])
+        while frontier:
+            node = frontier.popleft()
+            if max_steps is not None and steps[node] >= max_steps:
+                continue
+            for target, exit_id in zip(self.targets[node], self.exits[node]):
+                if steps[target] != -1:
+                    continue
+                steps[target] = steps[node] + 1
+                came_by[target] = exit_id
+                if target == goal:
+                    return self._trace_back(came_by, goal)
+                frontier.append(target)
+        return None
+
+    def _trace_back(self, came_by: array, goal: int) -> tuple[int, ...]:
+        route = []
+        node = goal
+        while came_by[node] != -1:
+            route.append(came_by[node])
+            node = self.edges[came_by[node]][0]
+        return tuple(reversed(route))
+
+    def path(self, start, goal, max_steps: int | None = None) -> list[int] | None:
+        """Returns the ids of the rooms along the shortest way between two rooms, including both, or `None`."""
+        route = self.route(start, goal, max_steps)
+        if route is None:
+            return None
+        return [_object_id(start)] + [self.rooms[self.edges[exit_id][1]] for exit_id in route]
+
+    def directions(self, start, goal, max_steps: int | None = None) -> list[str] | None:
+        """Returns the keys of the exits to go through to get from one room to another, or `None`."""
+        route = self.route(start, goal, max_steps)
+        return None if route is None else [self.edges[exit_id][2] for exit_id in route]
+
+    def distance(self, start, goal, max_steps: int | None = None) -> int | None:
+        """Returns how many exits apart two rooms are, or `None` if there's no way between them."""
+        route = self.route(start, goal, max_steps)
+        return None if route is None else len(route)
+
+    def neighbours(self, room) -> dict[str, int]:
+        """Returns the rooms a room's exits lead to, by exit key."""
+        if not self.loaded:
+            self.load()
+        node = self.nodes.get(_object_id(room))
+        if node is None:
+            return {}
+        return {self.edges[exit_id][2]: self.rooms[target] for target, exit_id in zip(self.targets[node],
+                                                                                       self.exits[node])}
+
+    def stats(self) -> dict:
+        """Returns the size of the graph and how well the route cache is doing."""
+        return {"rooms": len(self.rooms), "exits": len(self.edges), "cached_routes": len(self.routes),
+                **self.counters}
+
+
+# The graph kept up to date by `typeclasses.exits.Exit`
+ROOM_GRAPH = RoomGraph()
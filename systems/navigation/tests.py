@@ -0,0 +1,53 @@
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from systems.navigation.room_graph import ROOM_GRAPH
+from typeclasses.exits import Exit
+from typeclasses.rooms import Room
+
+
+class RoomGraphTests(EvenniaTest):
+    """This tests finding routes in `ROOM_GRAPH` and keeping it up to date"""
+
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        # room1 -out-> room2 -east-> room3 -up-> room4, and room1 -shortcut-> room3
+        self.room3 = create.create_object(Room, key="Room3")
+        self.room4 = create.create_object(Room, key="Room4")
+        self._exit("east", self.room2, self.room3)
+        self._exit("up", self.room3, self.room4)
+        self.addCleanup(ROOM_GRAPH._reset)
+        ROOM_GRAPH.load()
+
+    def _exit(self, key, location, destination):
+        return create.create_object(Exit, key=key, location=location, destination=destination)
+
+    def test_shortest_route(self):
+        """Tests that the shortest route is found and cached"""
+        self.assertEqual(ROOM_GRAPH.directions(self.room1, self.room4), ["out", "east", "up"])
+        self.assertEqual(ROOM_GRAPH.path(self.room1, self.room3), [self.room1.id, self.room2.id, self.room3.id])
+        self.assertIsNone(ROOM_GRAPH.route(self.room4, self.room1))
+        self.assertIsNone(ROOM_GRAPH.route(self.room1, self.room4, max_steps=2))
+        self.assertEqual(ROOM_GRAPH.distance(self.room1, self.room4), 3)
+        self.assertEqual(ROOM_GRAPH.stats()["hits"], 1)
+
+    def test_new_exit(self):
+        """Tests that creating an exit updates the graph and drops cached routes"""
+        self.assertEqual(ROOM_GRAPH.distance(self.room1, self.room4), 3)
+        self._exit("shortcut", self.room1, self.room3)
+        self.assertEqual(ROOM_GRAPH.directions(self.room1, self.room4), ["shortcut", "up"])
+
+    def test_relink_and_delete(self):
+        """Tests that relinking, moving and deleting exits updates the graph"""
+        down = self._exit("down", self.room4, self.room3)
+        self.assertEqual(ROOM_GRAPH.distance(self.room4, self.room3), 1)
+        down.destination = self.room1
+        self.assertEqual(ROOM_GRAPH.directions(self.room4, self.room3), ["down", "out", "east"])
+        down.move_to(self.room3, quiet=True, move_type="teleport")
+        self.assertIsNone(ROOM_GRAPH.route(self.room4, self.room3))
+        self.assertEqual(ROOM_GRAPH.neighbours(self.room3), {"up": self.room4.id, "down": self.room1.id})
+        down.delete()
+        self.assertEqual(ROOM_GRAPH.neighbours(self.room3), {"up": self.room4.id})
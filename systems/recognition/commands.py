@@ -0,0 +1,65 @@
+"""
+Recognition commands
+
+Printer - October 2026
+"""
+
+from commands.command import Command
+from systems.recognition.recognition import display_name, display_names, introduce
+from utils.string import listify
+
+_USAGE = "Usage: introduce <character> | introduce all"
+
+
+class CmdIntroduce(Command):
+    """
+    introduce yourself to someone
+
+    Usage:
+      introduce <character>
+      introduce all
+
+    Tells a character in the room your name, so they see it instead of your
+    intro from then on. Pick them by what you see them as, like their intro.
+    'introduce all' introduces you to everyone in the room.
+
+    Examples:
+      introduce lanky stranger
+    """
+
+    key = "introduce"
+    locks = "cmd:all()"
+    help_category = "General"
+
+    def func(self):
+        caller, query = self.caller, self.args.strip().lower()
+        if not query:
+            self.msg(_USAGE)
+            return
+        others = caller.location.contents_get(content_type="character") if caller.location else []
+        others = [other for other in others if other != caller]
+        if query == "all":
+            targets = others
+        else:
+            # Characters are picked by what the caller sees, so real names can't be guessed at
+            names = [name.lower() for name in display_names(caller, others)]
+            targets = ([other for other, name in zip(others, names) if name == query]
+                       or [other for other, name in zip(others, names) if query in name])
+            if len(targets) > 1:
+                self.msg(f"Which one? {listify(display_names(caller, targets), use_and=False)}")
+                return
+        if not targets:
+            self.msg("You don't see anyone like that here.")
+            return
+
+        introduced = []
+        them = caller.db.them or "it"
+        for target in targets:
+            seen_as = display_name(target, caller)
+            if introduce(target, caller):
+                target.msg(f"{seen_as[:1].upper()}{seen_as[1:]} introduces {them}self to you as {caller.name}.")
+                introduced.append(target)
+        if introduced:
+            self.msg(f"You introduce yourself to {listify(display_names(caller, introduced))}.")
+        else:
+            self.msg("They already know who you are.")
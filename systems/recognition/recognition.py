@@ -0,0 +1,127 @@
+"""
+Character recognition
+
+Printer - October 2026
+
+Characters only see each other's names once they've been introduced. Until then they see the other character's intro,
+like "A newcomer". Who a character recognizes is saved as one attribute holding the sorted ids packed into an integer
+array, and is unpacked into a set when the character is puppeted, so checking a name while rendering a room, channel or
+emote is a set lookup. Builders and above recognize everyone. Players introduce themselves with `introduce`.
+
+    introduce(viewer, target)
+    display_name(viewer, target)           # "Jane Doe" or "A newcomer"
+    display_names(viewer, room.characters) # every name at once
+"""
+
+from array import array
+
+# Where the recognized ids are saved on each character
+ATTRIBUTE_KEY = "recognized"
+ATTRIBUTE_CATEGORY = "recognition"
+# What characters without an intro are shown as before they're recognized
+DEFAULT_INTRO = "A newcomer"
+
+
+class Recognition:
+    """Who one character recognizes, loaded into memory."""
+
+    def __init__(self, character):
+        packed = character.attributes.get(ATTRIBUTE_KEY, category=ATTRIBUTE_CATEGORY)
+        ids = array("q")
+        if packed:
+            ids.frombytes(packed)
+        self.known = set(ids)
+        self.sees_all = character.check_permstring("Builder")
+
+    def recognizes(self, target_id: int) -> bool:
+        return self.sees_all or target_id in self.known
+
+    def pack(self) -> bytes:
+        return array("q", sorted(self.known)).tobytes()
+
+
+def _has_recognition(viewer) -> bool:
+    return "character" in getattr(viewer, "_content_types", ())
+
+
+def recognition(character) -> Recognition:
+    """
+    Returns who a character recognizes, loading it if it isn't loaded yet.
+    :param character: The viewing character
+    """
+    loaded = character.ndb._recognition
+    if loaded is None:
+        loaded = character.ndb._recognition = Recognition(character)
+    return loaded
+
+
+def unload_recognition(character):
+    """Drops a character's loaded recognition, so it's read again the next time it's needed."""
+    character.ndb._recognition = None
+
+
+def recognizes(viewer, target) -> bool:
+    """
+    Checks whether a viewer knows who a character is. Characters always recognize themselves, and anything that isn't a
+    character, like accounts and the server itself, recognizes everyone.
+    :param viewer: Who's looking
+    :param target: The character being looked at
+    """
+    if viewer == target or not _has_recognition(viewer):
+        return True
+    return recognition(viewer).recognizes(target.id)
+
+
+def introduce(viewer, target) -> bool:
+    """
+    Makes a viewer recognize a character.
+    :param viewer: The character being introduced to
+    :param target: The character they're being introduced to
+    :return: Whether they didn't already recognize them
+    """
+    known = recognition(viewer)
+    if target.id in known.known:
+        return False
+    known.known.add(target.id)
+    viewer.attributes.add(ATTRIBUTE_KEY, known.pack(), category=ATTRIBUTE_CATEGORY)
+    return True
+
+
+def forget(viewer, target) -> bool:
+    """
+    Makes a viewer stop recognizing a character.
+    :param viewer: The character forgetting
+    :param target: The character being forgotten
+    :return: Whether they recognized them before
+    """
+    known = recognition(viewer)
+    if target.id not in known.known:
+        return False
+    known.known.discard(target.id)
+    viewer.attributes.add(ATTRIBUTE_KEY, known.pack(), category=ATTRIBUTE_CATEGORY)
+    return True
+
+
+def display_name(viewer, target) -> str:
+    """
+    Returns a character's name if the viewer recognizes them, otherwise their intro.
+    :param viewer: Who's looking
+    :param target: The character being looked at
+    """
+    if recognizes(viewer, target):
+        return target.name
+    return target.db.intro or DEFAULT_INTRO
+
+
+def display_names(viewer, targets) -> list[str]:
+    """
+    Returns what a viewer sees for each of a group of characters, like everyone in a room, loading the viewer's
+    recognition only once.
+    :param viewer: Who's looking
+    :param targets: The characters being looked at
+    """
+    if not _has_recognition(viewer):
+        return [target.name for target in targets]
+    known = recognition(viewer)
+    return [target.name if target == viewer or known.recognizes(target.id) else (target.db.intro or DEFAULT_INTRO)
+            for target in targets]
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from evennia.utils.test_resources import EvenniaCommandTest, EvenniaTest
+
+from systems.recognition.commands import CmdIntroduce
+from systems.recognition.recognition import (
+    ATTRIBUTE_CATEGORY, ATTRIBUTE_KEY, display_names, forget, introduce, recognizes, unload_recognition
+)
+from typeclasses.characters import Character
+from typeclasses.rooms import Room
+
+
+class RecognitionTests(EvenniaTest):
+    """This tests who characters recognize and the names they see"""
+
+    room_typeclass = Room
+    character_typeclass = Character
+
+    def setUp(self):
+        super().setUp()
+        # The test account and character are developers, who'd recognize everyone
+        for entity in (self.account, self.char1):
+            entity.permissions.remove("Developer")
+            entity.permissions.add("Player")
+        unload_recognition(self.char1)
+
+    def test_staff(self):
+        """Tests that builders recognize everyone"""
+        self.char1.permissions.add("Builder")
+        unload_recognition(self.char1)
+        self.assertTrue(recognizes(self.char1, self.char2))
+
+    def test_introduce(self):
+        """Tests that characters see intros until they're introduced"""
+        self.char2.db.intro = "A lanky stranger"
+        self.assertEqual(self.char2.get_display_name(self.char1), "A lanky stranger")
+        self.assertEqual(self.char2.get_display_name(self.char2), self.char2.key)
+        self.assertTrue(introduce(self.char1, self.char2))
+        self.assertFalse(introduce(self.char1, self.char2))
+        self.assertEqual(self.char2.get_display_name(self.char1), self.char2.key)
+        self.assertFalse(recognizes(self.char2, self.char1))
+
+    def test_saved(self):
+        """Tests that recognition is saved packed and read back after unloading"""
+        introduce(self.char1, self.char2)
+        self.assertIsInstance(self.char1.attributes.get(ATTRIBUTE_KEY, category=ATTRIBUTE_CATEGORY), bytes)
+        unload_recognition(self.char1)
+        self.assertTrue(recognizes(self.char1, self.char2))
+        self.assertTrue(forget(self.char1, self.char2))
+        unload_recognition(self.char1)
+        self.assertFalse(recognizes(self.char1, self.char2))
+
+    def test_room_names(self):
+        """Tests that a room lists characters by the names its viewer knows"""
+        self.assertEqual(display_names(self.char1, [self.char1, self.char2]), [self.char1.key, "A newcomer"])
+        self.assertEqual(display_names(None, [self.char2]), [self.char2.key])
+        introduce(self.char2, self.char1)
+        self.assertIn(self.char1.key, self.room1.get_display_characters(self.char2))
+        self.assertIn("A newcomer", self.room1.get_display_characters(self.char1))
+
+
+class CmdIntroduceTests(EvenniaCommandTest):
+    """This tests the `introduce` command"""
+
+    room_typeclass = Room
+    character_typeclass = Character
+
+    def setUp(self):
+        super().setUp()
+        for entity in (self.account, self.char1):
+            entity.permissions.remove("Developer")
+            entity.permissions.add("Player")
+        unload_recognition(self.char1)
+        self.char1.db.intro, self.char1.db.them = "A tall woman", "her"
+        self.char2.db.intro = "A lanky stranger"
+
+    def test_introduce(self):
+        """Tests that characters are picked by their intro and learn the caller's name"""
+        self.call(CmdIntroduce(), self.char2.key, "You don't see anyone like that here.")
+        self.call(CmdIntroduce(), "lanky", "You introduce yourself to A lanky stranger.")
+        self.assertEqual(self.char1.get_display_name(self.char2), self.char1.key)
+        self.assertFalse(recognizes(self.char1, self.char2))
+        self.call(CmdIntroduce(), "all", "They already know who you are.")
+
+    def test_told(self):
+        """Tests that the character introduced to is told the name"""
+        with patch.object(self.char2, "msg") as msg:
+            self.call(CmdIntroduce(), "all", "You introduce yourself to")
+        msg.assert_called_once_with(f"A tall woman introduces herself to you as {self.char1.key}.")
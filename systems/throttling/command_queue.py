@@ -0,0 +1,179 @@
+"""
+Fair command queue
+
+Printer - October 2026
+
+Text input from each session is rate limited with a token bucket: a session can send `COMMAND_BURST` commands at once and
+`COMMAND_RATE` a second after that. Commands can also put their session in a ROM-style wait state, which holds its next
+commands back for a while. Input that can't run right away waits in the session's queue, up to `COMMAND_QUEUE_LIMIT`
+commands, and queues are drained round-robin so a session pasting hundreds of lines only gets its turn alongside everyone
+else's commands.
+"""
+
+from collections import deque
+
+from django.conf import settings
+from evennia.utils import logger
+from twisted.internet import reactor
+
+# Most queued commands run in one drain before the reactor gets to handle other events
+COMMANDS_PER_DRAIN = 50
+
+_DROPPED_MESSAGE = "`RYou're sending commands too fast, so some of them were ignored."
+
+
+class SessionQueue:
+    """The rate limit, wait state and queued input of one session."""
+
+    def __init__(self, session, now: float):
+        self.session = session
+        self.tokens = float(settings.COMMAND_BURST)
+        self.updated = now
+        # When the session's wait state ends
+        self.ready_at = now
+        # (input kwargs, time received) pairs
+        self.inputs = deque()
+        self.dropped = 0
+        # Whether the session's been told input was dropped since its queue was last empty
+        self.warned = False
+
+    def refill(self, now: float):
+        self.tokens = min(float(settings.COMMAND_BURST), self.tokens + (now - self.updated) * settings.COMMAND_RATE)
+        self.updated = now
+
+    def next_ready(self, now: float) -> float:
+        """Returns when the session can run its next command."""
+        self.refill(now)
+        token_ready = now if self.tokens >= 1 else now + (1 - self.tokens) / settings.COMMAND_RATE
+        return max(self.ready_at, token_ready)
+
+
+class CommandScheduler:
+    """Decides when each session's text input runs."""
+
+    def __init__(self, clock=reactor):
+        self.clock = clock
+        self.queues: dict[int, SessionQueue] = {}
+        # Sessions with queued input, in the order they'll next be served
+        self.backlog: dict[int, SessionQueue] = {}
+        self.delayed = 0
+        self.dropped = 0
+        self._drain_call = None
+
+    def _queue(self, session) -> SessionQueue:
+        queue = self.queues.get(session.sessid)
+        if queue is None or queue.session is not session:
+            queue = self.queues[session.sessid] = SessionQueue(session, self.clock.seconds())
+        return queue
+
+    def submit(self, session, inputs: dict, received: float):
+        """
+        Runs a session's input now if it's allowed to, or queues it.
+        :param session: The session that sent the input
+        :param inputs: The input in `data_in` form
+        :param received: When it was received, as a Unix time
+        """
+        queue = self._queue(session)
+        now = self.clock.seconds()
+        if not queue.inputs and queue.next_ready(now) <= now:
+            queue.tokens -= 1
+            session.run_input(inputs, received)
+            return
+
+        if len(queue.inputs) >= settings.COMMAND_QUEUE_LIMIT:
+            queue.dropped += 1
+            self.dropped += 1
+            if not queue.warned:
+                queue.warned = True
+                session.msg(_DROPPED_MESSAGE)
+            return
+        queue.inputs.append((inputs, received))
+        self.delayed += 1
+        self.backlog.setdefault(session.sessid, queue)
+        self._schedule(now)
+
+    def set_wait(self, session, seconds: float):
+        """
+        Holds a session's next commands back, like ROM's `WAIT_STATE`. A longer wait already in place is kept.
+        :param session: The session to make wait
+        :param seconds: How long to wait from now
+        """
+        queue = self._queue(session)
+        queue.ready_at = max(queue.ready_at, self.clock.seconds() + seconds)
+
+    def forget(self, session):
+        """Drops a disconnected session's queue and anything still in it."""
+        queue = self.queues.get(session.sessid)
+        if queue is not None and queue.session is session:
+            del self.queues[session.sessid]
+            self.backlog.pop(session.sessid, None)
+
+    def _schedule(self, now: float):
+        """Makes sure a drain is coming by the time the next queued command can run."""
+        if not self.backlog:
+            return
+        ready = min(queue.next_ready(now) for queue in self.backlog.values())
+        delay = max(0.0, ready - now)
+        if self._drain_call is not None and self._drain_call.active():
+            if self._drain_call.getTime() <= now + delay:
+                return
+            self._drain_call.cancel()
+        self._drain_call = self.clock.callLater(delay, self.drain)
+
+    def drain(self):
+        """
+        Runs queued commands, one per ready session per pass, until none are ready or `COMMANDS_PER_DRAIN` have run.
+        """
+        self._drain_call = None
+        budget = COMMANDS_PER_DRAIN
+        ran = True
+        while budget and ran:
+            ran = False
+            for sessid, queue in list(self.backlog.items()):
+                now = self.clock.seconds()
+                if queue.next_ready(now) > now:
+                    continue
+                inputs, received = queue.inputs.popleft()
+                queue.tokens -= 1
+                # Served sessions go to the back of the line
+                del self.backlog[sessid]
+                if queue.inputs:
+                    self.backlog[sessid] = queue
+                else:
+                    queue.warned = False
+                try:
+                    queue.session.run_input(inputs, received)
+                except Exception:
+                    logger.log_trace(f"Queued input from session {sessid} failed.")
+                ran = True
+                budget -= 1
+                if not budget:
+                    break
+        self._schedule(self.clock.seconds())
+
+    def stats(self) -> dict:
+        """Returns the total queued, delayed and dropped commands, and the deepest queue."""
+        depths = [len(queue.inputs) for queue in self.backlog.values()]
+        return {
+            "queued": sum(depths),
+            "backlogged_sessions": len(depths),
+            "max_depth": max(depths, default=0),
+            "delayed": self.delayed,
+            "dropped": self.dropped,
+        }
+
+    def session_stats(self, session) -> dict:
+        """Returns a session's queue depth, dropped commands, remaining burst and seconds left in its wait state."""
+        queue = self._queue(session)
+        now = self.clock.seconds()
+        queue.refill(now)
+        return {
+            "depth": len(queue.inputs),
+            "dropped": queue.dropped,
+            "tokens": queue.tokens,
+            "wait": max(0.0, queue.ready_at - now),
+        }
+
+
+# The scheduler used by `ServerSession`
+COMMAND_SCHEDULER = CommandScheduler()
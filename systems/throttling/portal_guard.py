@@ -0,0 +1,187 @@
+"""
+Portal connection guard
+
+Printer - October 2026
+
+Keeps connections that never log in from piling up at the portal. Each address can hold at most
+`MAX_CONNECTIONS_PER_IP` connections, and connections that haven't logged in after `UNLOGGEDIN_TIMEOUT` seconds are
+disconnected, which also ends the login menu the server keeps for them. Timeouts are kept on a timing wheel that the
+`PortalGuard` service turns once a second, disconnecting everything in the slot that comes up together.
+
+The guard is told about connections by `GuardedPortalSessionHandler`, and is started as a portal plugin service. Its
+counters are logged every `STATS_INTERVAL` seconds when they've changed.
+"""
+
+from math import ceil
+
+from django.conf import settings
+from evennia.server.portal.portalsessionhandler import PortalSessionHandler
+from evennia.utils import logger
+from twisted.application.service import Service
+from twisted.internet import reactor, task
+
+# Seconds between turns of the timing wheel
+TICK = 1.0
+# Seconds between logging the guard's counters
+STATS_INTERVAL = 10 * 60
+# Protocols whose connections are guarded. Bot connections made by the server itself aren't.
+GUARDED_PROTOCOLS = ("telnet", "ssl", "ssh", "websocket", "ajax/comet")
+
+_TOO_MANY_CONNECTIONS = "Too many connections from your address. Close one and try again."
+_LOGIN_TIMED_OUT = "You took too long to log in. Goodbye!"
+
+
+class TimingWheel:
+    """
+    Buckets items by the tick they expire on, so adding, removing and expiring an item doesn't depend on how many
+    others are waiting.
+    """
+
+    def __init__(self, span: float, tick: float = TICK):
+        self.tick = tick
+        self.slots = [set() for _ in range(ceil(span / tick) + 1)]
+        self.position = 0
+        # Item to the index of its slot
+        self.slot_of = {}
+
+    def __len__(self):
+        return len(self.slot_of)
+
+    def add(self, item, delay: float):
+        """
+        Schedules an item to expire, replacing any earlier schedule for it.
+        :param item: The item
+        :param delay: Seconds until it expires, rounded up to whole ticks and capped to the wheel's span
+        """
+        self.discard(item)
+        ticks = min(len(self.slots) - 1, max(1, ceil(delay / self.tick)))
+        slot = (self.position + ticks) % len(self.slots)
+        self.slots[slot].add(item)
+        self.slot_of[item] = slot
+
+    def discard(self, item):
+        slot = self.slot_of.pop(item, None)
+        if slot is not None:
+            self.slots[slot].discard(item)
+
+    def advance(self) -> set:
+        """
+        Turns the wheel one tick.
+        :return: The items that expired
+        """
+        self.position = (self.position + 1) % len(self.slots)
+        expired, self.slots[self.position] = self.slots[self.position], set()
+        for item in expired:
+            del self.slot_of[item]
+        return expired
+
+
+class PortalGuard(Service):
+    """A portal service that limits connections per address and disconnects ones that don't log in."""
+
+    name = "PortalGuard"
+
+    def __init__(self):
+        self.wheel = TimingWheel(settings.UNLOGGEDIN_TIMEOUT)
+        # Address to its connected sessions
+        self.by_address = {}
+        # Sessions turned away, whose disconnects aren't passed on to the server
+        self.refused = set()
+        self.counters = {"refused": 0, "timed_out": 0}
+        self._ticker = task.LoopingCall(self.turn)
+        self._stats_logger = task.LoopingCall(self.log_stats)
+        self._logged_counters = None
+
+    def startService(self):
+        super().startService()
+        self._ticker.start(self.wheel.tick, now=False)
+        self._stats_logger.start(STATS_INTERVAL, now=False)
+
+    def stopService(self):
+        for looping_call in (self._ticker, self._stats_logger):
+            if looping_call.running:
+                looping_call.stop()
+        return super().stopService()
+
+    def admit(self, session) -> bool:
+        """
+        Decides whether a new connection can stay, and starts its login timeout if it can.
+        :param session: The connecting portal session
+        :return: `False` if its address already has too many connections
+        """
+        if session.protocol_key not in GUARDED_PROTOCOLS or not session.address:
+            return True
+        connected = self.by_address.setdefault(session.address, set())
+        if len(connected) >= settings.MAX_CONNECTIONS_PER_IP:
+            self.counters["refused"] += 1
+            self.refused.add(session)
+            return False
+        connected.add(session)
+        if not session.logged_in:
+            self.wheel.add(session, settings.UNLOGGEDIN_TIMEOUT)
+        return True
+
+    def logged_in(self, session):
+        self.wheel.discard(session)
+
+    def release(self, session) -> bool:
+        """
+        Forgets a disconnected session.
+        :param session: The disconnected portal session
+        :return: `False` if it was turned away, so the server never heard of it
+        """
+        if session in self.refused:
+            self.refused.discard(session)
+            return False
+        self.wheel.discard(session)
+        connected = self.by_address.get(session.address)
+        if connected is not None:
+            connected.discard(session)
+            if not connected:
+                del self.by_address[session.address]
+        return True
+
+    def turn(self):
+        """Turns the timing wheel and disconnects every session in the slot that came up that still hasn't logged in."""
+        expired = [session for session in self.wheel.advance() if not session.logged_in]
+        for session in expired:
+            session.disconnect(_LOGIN_TIMED_OUT)
+        self.counters["timed_out"] += len(expired)
+
+    def stats(self) -> dict:
+        """Returns the guard's counters along with how many connections and addresses it's watching."""
+        return {
+            **self.counters,
+            "awaiting_login": len(self.wheel),
+            "addresses": len(self.by_address),
+            "busiest_address": max((len(sessions) for sessions in self.by_address.values()), default=0),
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        if stats != self._logged_counters:
+            self._logged_counters = stats
+            logger.log_info("Portal guard: " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+
+
+# The guard started by `portal_services_plugins`
+PORTAL_GUARD = PortalGuard()
+
+
+class GuardedPortalSessionHandler(PortalSessionHandler):
+    """The portal's session handler, which tells `PORTAL_GUARD` about connections coming and going."""
+
+    def connect(self, session):
+        if session and not PORTAL_GUARD.admit(session):
+            # The protocol is still setting up the connection, so it's closed right after
+            reactor.callLater(0, session.disconnect, _TOO_MANY_CONNECTIONS)
+            return
+        super().connect(session)
+
+    def disconnect(self, session):
+        if PORTAL_GUARD.release(session):
+            super().disconnect(session)
+
+    def server_logged_in(self, session, data):
+        super().server_logged_in(session, data)
+        PORTAL_GUARD.logged_in(session)
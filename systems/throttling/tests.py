@@ -0,0 +1,145 @@
+import unittest
+from unittest.mock import MagicMock
+
+from django.conf import settings
+from twisted.internet.task import Clock
+
+from systems.throttling.command_queue import CommandScheduler
+from systems.throttling.portal_guard import PortalGuard, TimingWheel
+
+
+class CommandSchedulerTests(unittest.TestCase):
+    """This tests rate limiting and fairly draining input in `CommandScheduler`"""
+
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = CommandScheduler(clock=self.clock)
+        self.ran = []
+        self.flooder = self._session(1)
+        self.player = self._session(2)
+
+    def _session(self, sessid):
+        session = MagicMock(sessid=sessid)
+        session.run_input.side_effect = lambda inputs, received: self.ran.append((sessid, inputs["text"]))
+        return session
+
+    def _send(self, session, count):
+        for num in range(count):
+            self.scheduler.submit(session, {"text": num}, 0.0)
+
+    def test_burst_runs_immediately(self):
+        """Tests that input within the burst isn't held back"""
+        self._send(self.player, settings.COMMAND_BURST)
+        self.assertEqual(len(self.ran), settings.COMMAND_BURST)
+        self.assertEqual(self.scheduler.stats()["queued"], 0)
+
+    def test_rate_limited(self):
+        """Tests that input past the burst runs at the command rate"""
+        self._send(self.flooder, settings.COMMAND_BURST + 2)
+        self.assertEqual(self.scheduler.stats()["queued"], 2)
+        self.clock.advance(1 / settings.COMMAND_RATE)
+        self.assertEqual(len(self.ran), settings.COMMAND_BURST + 1)
+        self.clock.advance(1 / settings.COMMAND_RATE)
+        self.assertEqual(len(self.ran), settings.COMMAND_BURST + 2)
+
+    def test_flooder_doesnt_delay_others(self):
+        """Tests that one session's backlog doesn't hold back another session's input"""
+        self._send(self.flooder, settings.COMMAND_BURST + 10)
+        self.scheduler.submit(self.player, {"text": "look"}, 0.0)
+        self.assertEqual(self.ran[-1], (2, "look"))
+
+    def test_round_robin(self):
+        """Tests that backlogged sessions take turns"""
+        for session in (self.flooder, self.player):
+            self.scheduler.set_wait(session, 1)
+            self._send(session, 3)
+        self.ran.clear()
+        self.clock.advance(1)
+        self.assertEqual([sessid for sessid, _ in self.ran], [1, 2, 1, 2, 1, 2])
+
+    def test_wait_state(self):
+        """Tests that a wait state holds back the next command, and a shorter wait doesn't cut it short"""
+        self.scheduler.set_wait(self.player, 2)
+        self.scheduler.set_wait(self.player, 1)
+        self._send(self.player, 1)
+        self.clock.advance(1.5)
+        self.assertEqual(self.ran, [])
+        self.clock.advance(0.5)
+        self.assertEqual(self.ran, [(2, 0)])
+
+    def test_queue_limit(self):
+        """Tests that input past the queue limit is dropped, with one warning"""
+        self._send(self.flooder, settings.COMMAND_BURST + settings.COMMAND_QUEUE_LIMIT + 3)
+        stats = self.scheduler.stats()
+        self.assertEqual(stats["max_depth"], settings.COMMAND_QUEUE_LIMIT)
+        self.assertEqual(stats["dropped"], 3)
+        self.flooder.msg.assert_called_once()
+
+    def test_forget(self):
+        """Tests that a disconnected session's queued input is dropped"""
+        self._send(self.flooder, settings.COMMAND_BURST + 5)
+        self.scheduler.forget(self.flooder)
+        self.clock.advance(10)
+        self.assertEqual(len(self.ran), settings.COMMAND_BURST)
+        self.assertEqual(self.scheduler.stats()["backlogged_sessions"], 0)
+
+
+class TimingWheelTests(unittest.TestCase):
+    """This tests scheduling and expiring items on a `TimingWheel`"""
+
+    def test_expires_on_time(self):
+        """Tests that items expire on the tick their delay runs out, and not before"""
+        wheel = TimingWheel(span=10, tick=1)
+        wheel.add("a", 2)
+        wheel.add("b", 2.5)
+        self.assertEqual(wheel.advance(), set())
+        self.assertEqual(wheel.advance(), {"a"})
+        self.assertEqual(wheel.advance(), {"b"})
+        self.assertEqual(len(wheel), 0)
+
+    def test_reschedule_and_discard(self):
+        """Tests that adding an item again moves it, and discarded items never expire"""
+        wheel = TimingWheel(span=5, tick=1)
+        wheel.add("a", 1)
+        wheel.add("a", 3)
+        wheel.add("b", 1)
+        wheel.discard("b")
+        self.assertEqual([wheel.advance() for _ in range(3)], [set(), set(), {"a"}])
+
+
+class PortalGuardTests(unittest.TestCase):
+    """This tests connection limits and login timeouts in `PortalGuard`"""
+
+    def setUp(self):
+        self.guard = PortalGuard()
+
+    def _session(self, address="10.0.0.1", logged_in=False):
+        return MagicMock(protocol_key="telnet", address=address, logged_in=logged_in)
+
+    def test_connections_per_address(self):
+        """Tests that an address can't go over its connection limit, and can reconnect once one closes"""
+        sessions = [self._session() for _ in range(settings.MAX_CONNECTIONS_PER_IP)]
+        self.assertTrue(all(self.guard.admit(session) for session in sessions))
+        extra = self._session()
+        self.assertFalse(self.guard.admit(extra))
+        self.assertTrue(self.guard.admit(self._session("10.0.0.2")))
+        self.assertFalse(self.guard.release(extra))
+        self.assertTrue(self.guard.release(sessions[0]))
+        self.assertTrue(self.guard.admit(self._session()))
+        self.assertEqual(self.guard.stats()["refused"], 1)
+
+    def test_login_timeout(self):
+        """Tests that sessions still at the login screen are disconnected together once their time is up"""
+        waiting = [self._session() for _ in range(3)]
+        player = self._session()
+        for session in waiting + [player]:
+            self.guard.admit(session)
+        self.guard.logged_in(player)
+        for _ in range(int(settings.UNLOGGEDIN_TIMEOUT) - 1):
+            self.guard.turn()
+        self.assertFalse(any(session.disconnect.called for session in waiting))
+        self.guard.turn()
+        for session in waiting:
+            session.disconnect.assert_called_once()
+        player.disconnect.assert_not_called()
+        self.assertEqual(self.guard.stats()["timed_out"], 3)
@@ -0,0 +1,129 @@
+"""
+Game calendar
+
+Printer - October 2026
+
+Keeps track of who has a birthday when, on top of the game clock in `systems.timekeeping.game_clock`.
+
+    from systems.timekeeping.game_calendar import GAME_CALENDAR
+
+    GAME_CALENDAR.age_of(character)
+
+Birthdays are kept in memory as (month, day) to the ids and birth years of every character in the directory, loaded
+with one query from the directory's birthday Tags. When the day rolls over, `GameCalendarScript` reloads them, sets the
+apparent age of everyone whose birthday it is in one bulk update, and calls their `at_birthday` hooks. Characters born
+on February 29th have their birthdays on February 28th in common years. The script's minutely run is also the game
+clock's tick.
+"""
+
+from django.conf import settings
+from django.db.models import F
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.typeclasses.tags import Tag
+from evennia.utils import logger
+from evennia.utils.dbserialize import to_pickle
+import pendulum
+
+from systems.directory.directory import BIRTHDAY_CATEGORY
+from systems.timekeeping.game_clock import GAME_CLOCK
+from typeclasses.scripts import Script
+
+# The most missed days caught up on when the server has been down over midnight
+MAX_CATCH_UP_DAYS = 31
+
+
+class GameCalendar:
+    """Who has a birthday when."""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.loaded = False
+        # (month, day) to a dict of character ids to birth years
+        self.birthdays = {}
+
+    def age_of(self, character) -> int | None:
+        """Returns a character's age in the game, or `None` if their birthday isn't set."""
+        birthday = character.attributes.get(["birth_year", "birth_month", "birth_day"], return_obj=True,
+                                            return_list=True)
+        if not all(birthday):
+            return None
+        return GAME_CLOCK.age(*(attribute.value for attribute in birthday))
+
+    def load(self):
+        """Reads every listed character's birthday with one query."""
+        birthdays = {}
+        rows = Tag.objects.filter(db_category=BIRTHDAY_CATEGORY, objectdb__isnull=False).values_list(
+            "objectdb__id", "db_key"
+        )
+        for character_id, key in rows:
+            year, month, day = (int(part) for part in key.split("-"))
+            birthdays.setdefault((month, day), {})[character_id] = year
+        self.birthdays = birthdays
+        self.loaded = True
+
+    def birthdays_on(self, date) -> dict:
+        """
+        Returns who has a birthday on a day.
+        :param date: A real date
+        :return: A dict of character ids to birth years
+        """
+        if not self.loaded:
+            self.load()
+        born = dict(self.birthdays.get((date.month, date.day), {}))
+        if (date.month, date.day) == (2, 28) and not date.is_leap_year():
+            born.update(self.birthdays.get((2, 29), {}))
+        return born
+
+    def celebrate(self, date) -> int:
+        """
+        Updates the apparent age of everyone with a birthday on a day in one batch, then calls their `at_birthday`.
+        :param date: The real date of the birthdays
+        :return: How many characters had a birthday
+        """
+        born = self.birthdays_on(date)
+        if not born:
+            return 0
+        # Everyone born on the same day of the year turns a whole number of years older on it
+        ages = {character_id: date.year + settings.YEARS_IN_THE_FUTURE - birth_year
+                for character_id, birth_year in born.items()}
+
+        attributes = list(Attribute.objects.filter(
+            objectdb__id__in=born, db_key="apparent_age", db_category__isnull=True
+        ).annotate(character_id=F("objectdb__id")))
+        for attribute in attributes:
+            attribute.db_value = to_pickle(ages[attribute.character_id])
+        Attribute.objects.bulk_update(attributes, ["db_value"])
+
+        for character in ObjectDB.objects.filter(id__in=born):
+            try:
+                character.at_birthday(ages[character.id])
+            except Exception:
+                logger.log_trace(f"at_birthday failed for {character} (#{character.id}).")
+        return len(born)
+
+
+GAME_CALENDAR = GameCalendar()
+
+
+class GameCalendarScript(Script):
+    """
+    Ticks the game clock, and rolls the game calendar over when the day changes in `GAME_TIMEZONE`, celebrating the
+    day's birthdays. Days missed while the server was down are caught up on. This is started through `GLOBAL_SCRIPTS`.
+    """
+
+    def at_repeat(self):
+        GAME_CLOCK.tick()
+        today = GAME_CLOCK.today()
+        last_day = self.db.last_day
+        if last_day == today.to_date_string():
+            return
+        GAME_CALENDAR.load()
+        day = pendulum.parse(last_day).date().add(days=1) if last_day else today
+        day = max(day, today.subtract(days=MAX_CATCH_UP_DAYS - 1))
+        while day <= today:
+            GAME_CALENDAR.celebrate(day)
+            day = day.add(days=1)
+        self.db.last_day = today.to_date_string()
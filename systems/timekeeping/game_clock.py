@@ -0,0 +1,98 @@
+"""
+Game clock
+
+Printer - October 2026
+
+The game's time is the time in `GAME_TIMEZONE`, with the game's years `YEARS_IN_THE_FUTURE` ahead of the real ones.
+Working that out takes a timezone conversion, so the clock does it once a minute, when `GameCalendarScript` ticks it,
+and everything else reads the cached minute and day:
+
+    from systems.timekeeping.game_clock import GAME_CLOCK
+
+    GAME_CLOCK.now()               # this minute in GAME_TIMEZONE
+    GAME_CLOCK.today()             # today's real date in GAME_TIMEZONE
+    GAME_CLOCK.age(1990, 3, 7)     # 38 on the game's 2028-03-07
+
+Ages and dates are worked out from plain integers, without any timezone math. If the clock hasn't been ticked for
+longer than a tick, like before the script starts, it ticks itself the next time it's read.
+"""
+
+from time import monotonic
+
+from django.conf import settings
+import pendulum
+
+# Seconds between ticks
+TICK_INTERVAL = 60
+
+
+class GameClock:
+    """The current minute and day in the game's timezone."""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.minute = None
+        self.date = None
+        self._ticked_at = None
+
+    def tick(self, now=None) -> bool:
+        """
+        Works out the current minute and day.
+        :param now: The current time, defaulting to the system clock's
+        :return: Whether the day changed
+        """
+        now = (now or pendulum.now()).in_timezone(settings.GAME_TIMEZONE)
+        self.minute = now.start_of("minute")
+        self._ticked_at = monotonic()
+        today = now.date()
+        if today == self.date:
+            return False
+        self.date = today
+        return True
+
+    def _current(self):
+        if self._ticked_at is None or monotonic() - self._ticked_at >= TICK_INTERVAL:
+            self.tick()
+
+    def now(self):
+        """Returns the current time in `GAME_TIMEZONE`, to the minute."""
+        self._current()
+        return self.minute
+
+    def today(self):
+        """Returns today's real date in `GAME_TIMEZONE`. The game's year is `year`."""
+        self._current()
+        return self.date
+
+    @property
+    def year(self) -> int:
+        """The game's current year."""
+        return self.today().year + settings.YEARS_IN_THE_FUTURE
+
+    def years_since(self, year: int, month: int, day: int, on=None) -> int:
+        """
+        Counts the whole real years since a date.
+        :param year: The date's year
+        :param month: The date's month
+        :param day: The date's day of the month
+        :param on: The real date to count to, defaulting to today
+        :return: The years
+        """
+        on = on or self.today()
+        return on.year - year - ((on.month, on.day) < (month, day))
+
+    def age(self, birth_year: int, birth_month: int, birth_day: int, on=None) -> int:
+        """
+        Works out how old someone born on a day is in the game.
+        :param birth_year: The year they were born in
+        :param birth_month: The month they were born in
+        :param birth_day: The day of the month they were born on
+        :param on: The real date to work it out on, defaulting to today
+        :return: Their age in years
+        """
+        return self.years_since(birth_year, birth_month, birth_day, on) + settings.YEARS_IN_THE_FUTURE
+
+
+GAME_CLOCK = GameClock()
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pendulum
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from constants.character import Race
+from systems.directory.directory import list_character
+from systems.timekeeping.game_calendar import GAME_CALENDAR, GameCalendarScript
+from systems.timekeeping.game_clock import GAME_CLOCK
+from typeclasses.characters import Character
+
+
+@override_settings(YEARS_IN_THE_FUTURE=2)
+class GameClockTests(SimpleTestCase):
+    """This tests caching the time and working out ages with `GAME_CLOCK`"""
+
+    def setUp(self):
+        self.addCleanup(GAME_CLOCK._reset)
+        GAME_CLOCK.tick(pendulum.datetime(2026, 3, 9, 12, 30, 45, tz=settings.GAME_TIMEZONE))
+
+    def test_tick(self):
+        """Tests that the time is kept to the minute and the day is worked out in the game's timezone"""
+        self.assertEqual(GAME_CLOCK.now(), pendulum.datetime(2026, 3, 9, 12, 30, tz=settings.GAME_TIMEZONE))
+        self.assertEqual(GAME_CLOCK.year, 2028)
+        # Early in the morning in UTC is still the day before in the game's timezone
+        self.assertFalse(GAME_CLOCK.tick(pendulum.datetime(2026, 3, 10, 5, tz="UTC")))
+        self.assertTrue(GAME_CLOCK.tick(pendulum.datetime(2026, 3, 10, 8, tz="UTC")))
+        self.assertEqual(GAME_CLOCK.today(), pendulum.date(2026, 3, 10))
+
+    def test_ages(self):
+        """Tests that ages count the years in the future and whether the birthday has come yet"""
+        self.assertEqual(GAME_CLOCK.age(2000, 3, 10), 27)
+        self.assertEqual(GAME_CLOCK.age(2000, 3, 9), 28)
+        self.assertEqual(GAME_CLOCK.years_since(2000, 3, 9), 26)
+        self.assertEqual(GAME_CLOCK.age(2000, 3, 10, on=pendulum.date(2026, 3, 10)), 28)
+
+
+@override_settings(YEARS_IN_THE_FUTURE=2)
+class GameCalendarTests(EvenniaTest):
+    """This tests working out ages and celebrating birthdays with `GAME_CALENDAR`"""
+
+    character_typeclass = Character
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(GAME_CALENDAR._reset)
+        self.addCleanup(GAME_CLOCK._reset)
+        self.char1.attributes.batch_add(("race", Race.HUMAN), ("tier", 1), ("birth_year", 2000), ("birth_month", 3),
+                                        ("birth_day", 10))
+        self.char2.attributes.batch_add(("race", Race.HUMAN), ("tier", 1), ("birth_year", 2004), ("birth_month", 2),
+                                        ("birth_day", 29))
+        list_character(self.char1)
+        list_character(self.char2)
+        GAME_CLOCK.tick(pendulum.datetime(2026, 3, 9, 12, tz=settings.GAME_TIMEZONE))
+
+    def test_age_of(self):
+        """Tests that a character's age is read from their birthday"""
+        self.assertEqual(GAME_CALENDAR.age_of(self.char1), 27)
+        self.char1.attributes.remove("birth_day")
+        self.assertIsNone(GAME_CALENDAR.age_of(self.char1))
+
+    def test_birthdays_on(self):
+        """Tests that birthdays are looked up by day, with leap day birthdays on February 28th in common years"""
+        self.assertEqual(GAME_CALENDAR.birthdays_on(pendulum.date(2026, 3, 10)), {self.char1.id: 2000})
+        self.assertEqual(GAME_CALENDAR.birthdays_on(pendulum.date(2027, 2, 28)), {self.char2.id: 2004})
+        self.assertEqual(GAME_CALENDAR.birthdays_on(pendulum.date(2028, 2, 28)), {})
+
+    def test_celebrate(self):
+        """Tests that a day's birthdays update apparent ages and call `at_birthday`"""
+        with patch.object(self.char1, "msg") as msg:
+            self.assertEqual(GAME_CALENDAR.celebrate(pendulum.date(2026, 3, 10)), 1)
+        self.assertEqual(self.char1.db.apparent_age, 28)
+        self.assertIn("28", msg.call_args.args[0])
+        self.assertEqual(self.char2.db.apparent_age, 45)
+
+    def test_script_catches_up(self):
+        """Tests that the script celebrates the days it missed, once"""
+        script = create.create_script(GameCalendarScript, key="game_calendar_test", autostart=False)
+        script.db.last_day = "2026-02-26"
+        GAME_CLOCK.tick(pendulum.datetime(2026, 3, 10, 12, tz=settings.GAME_TIMEZONE))
+        with patch.object(GAME_CLOCK, "tick"), patch.object(GAME_CALENDAR, "celebrate") as celebrate:
+            script.at_repeat()
+            script.at_repeat()
+        self.assertEqual(celebrate.call_count, 12)
+        self.assertEqual(celebrate.call_args.args[0], pendulum.date(2026, 3, 10))
+        self.assertEqual(script.db.last_day, "2026-03-10")
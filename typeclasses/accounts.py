@@ -26,6 +26,7 @@ from evennia.accounts.accounts import DefaultAccount, DefaultGuest
 from pygments.lexers import archetype
 
 from systems.login.character_creator import ContribChargenAccount
+from systems.login.resume import revoke_resume_tokens
 
 
 class Account(ContribChargenAccount):
@@ -140,3 +141,10 @@ class Account(ContribChargenAccount):
 
     def at_first_login(self, **kwargs):
         self.execute_cmd("charcreate")
+
+    def at_password_change(self, **kwargs):
+        super().at_password_change(**kwargs)
+        # Anyone holding a token from before the change has to log in with the new password. Accounts being created
+        # have their password set before they're saved, when there can't be any tokens yet.
+        if self.pk:
+            revoke_resume_tokens(self)
@@ -9,6 +9,11 @@ creation commands.
 """
 
 from evennia.objects.objects import DefaultCharacter
+from evennia.typeclasses.attributes import ModelAttributeBackend
+from evennia.utils.utils import lazy_property
+
+from systems.directory.directory import DirectoryAttributeHandler
+from systems.recognition.recognition import display_name, recognition, unload_recognition
 
 from .objects import ObjectParent
 
@@ -21,8 +26,15 @@ class Character(ObjectParent, DefaultCharacter):
     See mygame/typeclasses/objects.py for a list of
     properties and methods available on all Object child classes like this.
 
+    Other characters see this one's intro instead of its name until they've been introduced. See
+    `systems.recognition.recognition`. Race, tier and birth date are mirrored into Tags for searching, see
+    `systems.directory.directory`.
     """
 
+    @lazy_property
+    def attributes(self):
+        return DirectoryAttributeHandler(self, ModelAttributeBackend)
+
     def at_object_creation(self):
         super().at_object_creation()
         self.db.first_name = "New"
@@ -42,3 +54,23 @@ class Character(ObjectParent, DefaultCharacter):
         self.db.race = None
         self.db.codename1 = ""
         self.db.codename2 = ""
+
+    def at_birthday(self, age: int, **kwargs):
+        """
+        Called by the game calendar on the character's birthday, after their apparent age is updated.
+        :param age: How old they turned
+        """
+        self.msg(f"`YHappy birthday!`x You're `c{age}`x today.")
+
+    def get_display_name(self, looker=None, **kwargs):
+        return display_name(looker, self)
+
+    def at_post_puppet(self, **kwargs):
+        # Who the character recognizes is loaded once for the whole time it's puppeted, with its account's permissions
+        unload_recognition(self)
+        recognition(self)
+        super().at_post_puppet(**kwargs)
+
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        unload_recognition(self)
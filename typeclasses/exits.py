@@ -9,6 +9,8 @@ for allowing Characters to traverse the exit to its destination.
 
 from evennia.objects.objects import DefaultExit
 
+from systems.navigation.room_graph import ROOM_GRAPH
+
 from .objects import ObjectParent
 
 
@@ -21,6 +23,38 @@ class Exit(ObjectParent, DefaultExit):
     See mygame/typeclasses/objects.py for a list of
     properties and methods available on all Objects child classes like this.
 
+    Exits keep `ROOM_GRAPH` up to date as they're created, moved, relinked, renamed and deleted.
     """
 
-    pass
+    @property
+    def destination(self):
+        return DefaultExit.destination.fget(self)
+
+    @destination.setter
+    def destination(self, value):
+        # Relinking with `@link` and the like only sets the destination, so the graph is told here
+        DefaultExit.destination.fset(self, value)
+        ROOM_GRAPH.update_exit(self)
+
+    @destination.deleter
+    def destination(self):
+        DefaultExit.destination.fdel(self)
+        ROOM_GRAPH.update_exit(self)
+
+    def at_object_creation(self):
+        super().at_object_creation()
+        ROOM_GRAPH.update_exit(self)
+
+    def at_post_move(self, source_location, move_type="move", **kwargs):
+        super().at_post_move(source_location, move_type=move_type, **kwargs)
+        ROOM_GRAPH.update_exit(self)
+
+    def at_rename(self, oldname, newname):
+        super().at_rename(oldname, newname)
+        ROOM_GRAPH.update_exit(self)
+
+    def at_object_delete(self):
+        if not super().at_object_delete():
+            return False
+        ROOM_GRAPH.remove_exit(self.id)
+        return True
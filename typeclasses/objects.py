@@ -20,8 +20,43 @@ class ObjectParent:
     of the derived classes has itself defined that same hook already, that will
     take precedence.
 
+    What's inside an object is indexed by typeclass family in its `contents_cache`, which Evennia keeps up to date as
+    things move. `characters`, `exits` and `things` read from that index, so they don't go through every object inside.
     """
 
+    @property
+    def characters(self) -> list:
+        """The characters inside this."""
+        return self.contents_get(content_type="character")
+
+    @property
+    def exits(self) -> list:
+        """The exits leading out of this."""
+        return self.contents_get(content_type="exit")
+
+    @property
+    def things(self) -> list:
+        """The objects inside this that aren't characters, exits or rooms."""
+        return self.contents_get(content_type="object")
+
+    def swap_typeclass(self, new_typeclass, *args, **kwargs):
+        # The location indexes its contents by the typeclass they had when they arrived
+        location = self.location
+        if location:
+            location.contents_cache.remove(self)
+        try:
+            return super().swap_typeclass(new_typeclass, *args, **kwargs)
+        finally:
+            if location:
+                location.contents_cache.add(self)
+
+    def at_rename(self, oldname, newname):
+        super().at_rename(oldname, newname)
+        # Rooms cache how their contents look
+        location = self.location
+        if location and hasattr(location, "clear_appearance_cache"):
+            location.clear_appearance_cache()
+
 
 class Object(ObjectParent, DefaultObject):
     """
@@ -6,9 +6,20 @@ Rooms are simple containers that has no location of their own.
 """
 
 from evennia.objects.objects import DefaultRoom
+from evennia.utils.utils import iter_to_str
+
+from systems.recognition.recognition import display_names
 
 from .objects import ObjectParent
 
+# Lockstrings that let anyone see and find an object
+_PUBLIC_LOCKS = {"view": ("", "view:all()", "view:true()"), "search": ("", "search:all()", "search:true()")}
+
+
+def _visible_to_all(obj) -> bool:
+    """Returns whether an object's locks let anyone see it, so whether it's shown can be cached for every viewer."""
+    return all(obj.locks.get(access_type) in lockstrings for access_type, lockstrings in _PUBLIC_LOCKS.items())
+
 
 class Room(ObjectParent, DefaultRoom):
     """
@@ -19,6 +30,58 @@ class Room(ObjectParent, DefaultRoom):
 
     See mygame/typeclasses/objects.py for a list of
     properties and methods available on all Objects.
+
+    The parts of the room's appearance that are the same for everyone are cached until something comes into or leaves
+    the room or is renamed. Contents whose locks don't let everyone see them, and characters' names, which depend on who
+    the viewer recognizes, are still worked out on every look. Changing a lock on something already in the room
+    needs `clear_appearance_cache` to show.
     """
 
-    pass
+    def clear_appearance_cache(self):
+        """Drops the room's cached appearance, for when something in it changes how it looks."""
+        self.ndb._appearance_exit = None
+        self.ndb._appearance_character = None
+        self.ndb._appearance_object = None
+
+    def _appearance_cache(self, content_type: str) -> dict:
+        """
+        Returns the cache for one kind of content, starting it over if it was cleared or the contents changed.
+        :param content_type: "exit", "character" or "object", as indexed in `contents_cache`
+        """
+        name = f"_appearance_{content_type}"
+        cache = getattr(self.ndb, name)
+        # Contents can be moved by setting `location` without any hooks, so they're compared with the cached ones
+        contents = self.contents_get(content_type=content_type)
+        if cache is None or cache["contents"] != contents:
+            cache = {
+                "contents": contents,
+                "public": [obj for obj in contents if _visible_to_all(obj)],
+                "hidden": [obj for obj in contents if not _visible_to_all(obj)],
+            }
+            setattr(self.ndb, name, cache)
+        return cache
+
+    def get_display_exits(self, looker, **kwargs):
+        cache = self._appearance_cache("exit")
+        if cache["hidden"] or kwargs.get("exit_order"):
+            return super().get_display_exits(looker, **kwargs)
+        if "text" not in cache:
+            cache["text"] = super().get_display_exits(looker, **kwargs)
+        return cache["text"]
+
+    def get_display_characters(self, looker, **kwargs):
+        cache = self._appearance_cache("character")
+        characters = [char for char in cache["public"] if char != looker]
+        if cache["hidden"]:
+            characters += self.filter_visible(cache["hidden"], looker, **kwargs)
+        # Names are worked out on every look, since who's recognized depends on the viewer
+        names = iter_to_str(display_names(looker, characters), endsep=", and")
+        return f"|wCharacters:|n {names}" if names else ""
+
+    def get_display_things(self, looker, **kwargs):
+        cache = self._appearance_cache("object")
+        if cache["hidden"] or looker in cache["public"]:
+            return super().get_display_things(looker, **kwargs)
+        if "text" not in cache:
+            cache["text"] = super().get_display_things(looker, **kwargs)
+        return cache["text"]
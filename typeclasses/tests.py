@@ -0,0 +1,89 @@
+from evennia.objects.objects import DefaultRoom
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from typeclasses.characters import Character
+from typeclasses.exits import Exit
+from typeclasses.objects import Object
+from typeclasses.rooms import Room
+
+
+class RoomAppearanceCacheTests(EvenniaTest):
+    """This tests caching a room's appearance"""
+
+    room_typeclass = Room
+    exit_typeclass = Exit
+    object_typeclass = Object
+    character_typeclass = Character
+
+    def uncached(self, looker):
+        """Returns the room's appearance as the uncached hooks would render it"""
+        room = self.room1
+        return room.format_appearance(room.appearance_template.format(
+            name=room.get_display_name(looker),
+            extra_name_info=room.get_extra_display_name_info(looker),
+            desc=DefaultRoom.get_display_desc(room, looker),
+            header=room.get_display_header(looker),
+            footer=room.get_display_footer(looker),
+            exits=DefaultRoom.get_display_exits(room, looker),
+            characters=DefaultRoom.get_display_characters(room, looker),
+            things=DefaultRoom.get_display_things(room, looker),
+        ), looker)
+
+    def test_matches_uncached(self):
+        """Tests that looks from different viewers match the uncached appearance and leave out the viewer"""
+        for looker in (self.char1, self.char2, self.char1, self.char2):
+            appearance = self.room1.return_appearance(looker)
+            self.assertEqual(appearance, self.uncached(looker))
+            self.assertNotIn(looker.key, self.room1.get_display_characters(looker).split(":|n ")[1].split(", "))
+
+    def test_contents_change(self):
+        """Tests that moving, renaming and deleting contents shows up"""
+        self.room1.return_appearance(self.char1)
+        self.obj2.move_to(self.room2, quiet=True)
+        self.assertNotIn(self.obj2.key, self.room1.return_appearance(self.char1))
+        self.obj2.move_to(self.room1, quiet=True)
+        self.assertIn(self.obj2.key, self.room1.return_appearance(self.char1))
+        self.obj2.key = "Pebble"
+        self.obj2.at_rename("Obj2", "Pebble")
+        self.assertIn("Pebble", self.room1.return_appearance(self.char1))
+        self.obj2.delete()
+        self.assertNotIn("Pebble", self.room1.return_appearance(self.char1))
+
+    def test_exits_change(self):
+        """Tests that new exits and description edits show up"""
+        self.room1.return_appearance(self.char1)
+        create.create_object(Exit, key="trapdoor", location=self.room1, destination=self.room2)
+        self.room1.db.desc = "A dusty cellar."
+        appearance = self.room1.return_appearance(self.char1)
+        self.assertIn("trapdoor", appearance)
+        self.assertIn("A dusty cellar.", appearance)
+
+    def test_hidden_contents(self):
+        """Tests that contents not everyone can see are checked for each viewer"""
+        self.obj2.locks.add("view:id(%i)" % self.char1.id)
+        self.room1.clear_appearance_cache()
+        self.assertIn(self.obj2.key, self.room1.return_appearance(self.char1))
+        self.assertNotIn(self.obj2.key, self.room1.return_appearance(self.char2))
+
+
+class ContentsIndexTests(EvenniaTest):
+    """This tests reading a room's contents by typeclass family"""
+
+    room_typeclass = Room
+    exit_typeclass = Exit
+    object_typeclass = Object
+    character_typeclass = Character
+
+    def test_families(self):
+        """Tests that contents are grouped without querying the database"""
+        with self.assertNumQueries(0):
+            self.assertEqual(set(self.room1.characters), {self.char1, self.char2})
+            self.assertEqual(self.room1.exits, [self.exit])
+            self.assertEqual(set(self.room1.things), {self.obj1, self.obj2})
+
+    def test_swap_typeclass(self):
+        """Tests that swapping an object's typeclass moves it to its new family"""
+        self.obj1.swap_typeclass(Character, run_start_hooks=None)
+        self.assertIn(self.obj1, self.room1.characters)
+        self.assertNotIn(self.obj1, self.room1.things)
@@ -0,0 +1,132 @@
+"""
+Pronoun message templates
+
+Printer - October 2026
+
+Messages about a character, like emotes and system messages, are written once with tokens standing in for the actor:
+
+    $they, $them, $their - the actor's pronouns
+    $name                - the actor's name, as each recipient sees it
+    $$                   - a literal dollar sign
+
+Capitalizing a token (`$They`, `$Name`) capitalizes what replaces it. Any other `$word` is left alone.
+
+Templates are parsed once into a `PronounTemplate` and cached. Binding one to an actor reads the actor's pronouns
+once, and rendering it for each recipient only joins the pieces with that recipient's view of the actor's name.
+
+    broadcast(room, "$Name stretches and rolls $their shoulders.", actor=character)
+"""
+
+import re
+from functools import lru_cache
+
+PRONOUNS = ("they", "them", "their")
+TOKENS = PRONOUNS + ("name",)
+# Pronouns for actors that don't have any set, like objects
+IMPERSONAL_PRONOUNS = ("it", "it", "its")
+
+_TOKEN = re.compile(r"\$(\$|[A-Za-z]+)")
+
+
+class PronounTemplate:
+    """A parsed message template."""
+
+    def __init__(self, text: str):
+        self.text = text
+        # Literal text alternating with (token, capitalize) pairs, starting and ending with literal text
+        self.parts = []
+        literal = []
+        position = 0
+        for match in _TOKEN.finditer(text):
+            literal.append(text[position:match.start()])
+            position = match.end()
+            word = match.group(1)
+            if word == "$":
+                literal.append("$")
+            elif word.lower() in TOKENS:
+                self.parts += ["".join(literal), (word.lower(), word[0].isupper())]
+                literal = []
+            else:
+                literal.append(match.group(0))
+        literal.append(text[position:])
+        self.parts.append("".join(literal))
+        self.uses_name = any(part[0] == "name" for part in self.parts[1::2])
+
+    def bind(self, actor) -> "BoundTemplate":
+        """
+        Reads an actor's pronouns into the template.
+        :param actor: The object the message is about
+        :return: The template ready to render for each recipient
+        """
+        attributes = actor.attributes.get(list(PRONOUNS), return_obj=True, return_list=True)
+        pronouns = [attribute.value if attribute else None for attribute in attributes]
+        # Actors missing any of them are referred to impersonally, rather than with a mix
+        if not all(pronouns):
+            pronouns = IMPERSONAL_PRONOUNS
+        return BoundTemplate(self, actor, dict(zip(PRONOUNS, pronouns)))
+
+
+class BoundTemplate:
+    """A template with an actor's pronouns filled in, waiting on each recipient's view of the actor's name."""
+
+    def __init__(self, template: PronounTemplate, actor, pronouns: dict):
+        self.actor = actor
+        parts = list(template.parts)
+        for index in range(1, len(parts), 2):
+            token, capitalize = parts[index]
+            if token != "name":
+                parts[index] = _capitalize(pronouns[token]) if capitalize else pronouns[token]
+        self.parts = parts
+        self.static = None if template.uses_name else "".join(parts)
+
+    def render(self, recipient=None) -> str:
+        """
+        Fills in the actor's name as a recipient sees it.
+        :param recipient: Who the message is for
+        :return: The message
+        """
+        if self.static is not None:
+            return self.static
+        name = self.actor.get_display_name(recipient)
+        return "".join(
+            part if isinstance(part, str) else (_capitalize(name) if part[1] else name) for part in self.parts
+        )
+
+
+def _capitalize(word: str) -> str:
+    return word[:1].upper() + word[1:]
+
+
+@lru_cache(maxsize=1024)
+def compile_template(text: str) -> PronounTemplate:
+    """
+    Parses a message template, reusing the last parse of the same text.
+    :param text: The template
+    :return: The parsed template
+    """
+    return PronounTemplate(text)
+
+
+def render(text: str, actor, recipient=None) -> str:
+    """
+    Renders a message template for one recipient.
+    :param text: The template
+    :param actor: The object the message is about
+    :param recipient: Who the message is for
+    :return: The message
+    """
+    return compile_template(text).bind(actor).render(recipient)
+
+
+def broadcast(location, text: str, actor, exclude=None, **kwargs):
+    """
+    Sends a message template to everything in a location, each rendered as the recipient sees the actor.
+    :param location: Where to send the message
+    :param text: The template
+    :param actor: The object the message is about
+    :param exclude: An object or list of objects not to send it to
+    :param kwargs: Passed on to each recipient's `msg`
+    """
+    bound = compile_template(text).bind(actor)
+    for recipient in location.contents_get(exclude=exclude):
+        recipient.msg(bound.render(recipient), from_obj=actor, **kwargs)
@@ -1,7 +1,14 @@
 import unittest
+from unittest.mock import MagicMock
 
+from django.template import Context, Template
 from evennia import create_object
+from evennia.utils.test_resources import EvenniaTestCase
+from utils.pronoun_templates import broadcast, compile_template
 from utils.string import *
+from utils.tick_colors import XTERM256_TO_ANSI_BG, XTERM256_TO_ANSI_FG, downsample_to_ansi
+from utils.tick_html import TickHtmlStream, tick_to_html
+from utils.tick_text import pad, parse, Run, table, truncate, visible_width, wrap
 
 
 class TitleCaseTests(unittest.TestCase):
@@ -135,3 +142,121 @@ class NumberArgumentTests(unittest.TestCase):
         output = number_argument("apples and bananas")
         expected_output = (None, "apples", "and bananas")
         self.assertEqual(output, expected_output)
+
+
+class PronounTemplateTests(unittest.TestCase):
+    """This tests compiling and rendering pronoun templates"""
+
+    def setUp(self):
+        self.actor = MagicMock()
+        self.actor.attributes.get.return_value = [MagicMock(value=pronoun) for pronoun in ("she", "her", "her")]
+        self.actor.get_display_name.side_effect = lambda looker: "a tall woman" if looker else "Jane"
+
+    def test_compiled_once(self):
+        """Tests that the same text reuses its compiled template"""
+        self.assertIs(compile_template("$They wave."), compile_template("$They wave."))
+
+    def test_render(self):
+        """Tests that pronouns, names, capitals and escapes are filled in"""
+        template = compile_template("$Name waves $their hand at $them. $They paid $$5 for $item.")
+        self.assertEqual(template.bind(self.actor).render(MagicMock()),
+                         "A tall woman waves her hand at her. She paid $5 for $item.")
+        self.assertEqual(template.bind(self.actor).render(None),
+                         "Jane waves her hand at her. She paid $5 for $item.")
+
+    def test_broadcast_reads_pronouns_once(self):
+        """Tests that a broadcast reads the actor's pronouns once for every recipient"""
+        recipients = [MagicMock(), MagicMock(), MagicMock()]
+        location = MagicMock()
+        location.contents_get.return_value = recipients
+        broadcast(location, "$Name shrugs $their shoulders.", self.actor)
+        self.assertEqual(self.actor.attributes.get.call_count, 1)
+        for recipient in recipients:
+            recipient.msg.assert_called_once_with("A tall woman shrugs her shoulders.", from_obj=self.actor)
+
+
+class PronounTemplateActorTests(EvenniaTestCase):
+    """This tests reading pronouns from real actors"""
+
+    def setUp(self):
+        super().setUp()
+        self.actor = create_object(key="watch")
+        self.addCleanup(self.actor.delete)
+
+    def test_no_pronouns(self):
+        """Tests that actors without pronouns are referred to as it"""
+        self.assertEqual(compile_template("$Their hands tick.").bind(self.actor).render(), "Its hands tick.")
+
+    def test_some_pronouns(self):
+        """Tests that actors missing some of their pronouns are referred to as it"""
+        self.actor.db.they = "she"
+        self.assertEqual(compile_template("$They fall, $their x.").bind(self.actor).render(), "It fall, its x.")
+        self.actor.db.them, self.actor.db.their = "her", "her"
+        self.assertEqual(compile_template("$They fall, $their x.").bind(self.actor).render(), "She fall, her x.")
+
+
+class TickTextTests(unittest.TestCase):
+    """This tests measuring and laying out text with tick markup"""
+
+    def test_parse(self):
+        """Tests that markup is split into runs of visible text and cached"""
+        self.assertEqual(parse("`WJane`Y:`x ||3 `[=a|/ok"), (Run("Jane", "`W"), Run(":", "`Y"), Run(" |3 ", "`x"), Run("\nok", "`[=a")))
+        self.assertIs(parse("`cTier"), parse("`cTier"))
+        self.assertEqual(visible_width("`123Red `[500Blocks`x and `zliteral"), 24)
+
+    def test_wrap(self):
+        """Tests that wrapped lines carry their colors over"""
+        self.assertEqual(wrap("`Rred words here `Gand green", 10), ["`Rred words`x", "`Rhere`G and`x", "`R`Ggreen`x"])
+        self.assertEqual(wrap("abcdefghij klm", 4), ["abcd", "efgh", "ij", "klm"])
+        self.assertEqual(wrap("abc", 1), ["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            wrap("abc", 0)
+
+    def test_pad_and_truncate(self):
+        """Tests padding and cutting by visible width"""
+        self.assertEqual(pad("`Yab", 4, "r"), "  `Yab`x")
+        self.assertEqual(pad("ab", 4, "c"), " ab ")
+        self.assertEqual(truncate("`Wabc`Ydef", 4), "`Wabc`Yd`x")
+
+    def test_table(self):
+        """Tests that columns line up by what's shown"""
+        rows = [["`WJo`Y:", "Tier `c1`x"], ["`WMargaret`Y:", "Tier `C2`x", "Mage"]]
+        self.assertEqual(table(rows, indent=2).split("\n"),
+                         ["  `WJo`Y:`x       Tier `c1`x", "  `WMargaret`Y:`x Tier `C2`x Mage"])
+
+
+class TickHtmlTests(EvenniaTestCase):
+    """This tests rendering tick markup as HTML"""
+
+    def test_colors(self):
+        """Tests that codes become webclient color classes and text is escaped"""
+        self.assertEqual(tick_to_html("`WJane `r<b>`x ok `[=a`123x"),
+                         '<span class="tick-text"><span class="color-015">Jane </span>'
+                         '<span class="color-001">&lt;b&gt;</span> ok <span class="color-067 bgcolor-016">x</span></span>')
+
+    def test_stream(self):
+        """Tests that streamed lines carry colors over"""
+        self.assertEqual(list(TickHtmlStream().render(["`Gone\n", "two`x\n"])),
+                         ['<span class="tick-text">', '<span class="color-010">one\n</span>',
+                          '<span class="color-010">two</span>\n', "</span>"])
+
+    def test_filter(self):
+        """Tests the `ticks` template filter"""
+        rendered = Template("{% load tick_colors %}{{ intro|ticks }}").render(Context({"intro": "`YA <stranger>"}))
+        self.assertEqual(rendered, '<span class="tick-text"><span class="color-011">A &lt;stranger&gt;</span></span>')
+
+
+class DownsampleTests(unittest.TestCase):
+    """This tests swapping XTERM256 colors for ANSI ones"""
+
+    def test_tables(self):
+        """Tests that every XTERM256 color has an ANSI color, and ANSI colors map to themselves"""
+        self.assertEqual(len(XTERM256_TO_ANSI_FG), 256)
+        self.assertEqual(XTERM256_TO_ANSI_FG[9], "`R")
+        self.assertEqual(XTERM256_TO_ANSI_BG[4], "`[B")
+        self.assertEqual(XTERM256_TO_ANSI_FG[0], "`D")
+
+    def test_downsample(self):
+        """Tests that XTERM256 and greyscale codes are swapped, leaving escapes and ANSI codes alone"""
+        self.assertEqual(downsample_to_ansi("`050go `Rstop `=zwhite `[=ablack |550 ||500"),
+                         "`Ggo `Rstop `Wwhite `[Dblack `Y ||500")
@@ -62,6 +62,9 @@ Edited by Printer, 2025
 * Pure black is now dark grey.
 """
 
+import re
+from functools import lru_cache
+
 
 # ANSI constants (copied from evennia.utils.ansi to avoid import)
 
@@ -174,3 +177,143 @@ TICK_COLOR_ANSI_XTERM256_BRIGHT_BG_EXTRA_MAP = [
     (r"`[w", r"`[555"),  # white background
     (r"`[d", r"`[222"),  # dark grey background
 ]
+
+
+#############################################################
+#
+# Direct tick markup translation. Evennia translates markup
+# on every message, so these are for strings that are worth
+# translating once up front, like the enum values in
+# `constants.character`.
+#
+#############################################################
+
+_TICK_ANSI_CODES = dict(TICK_COLOR_ANSI_EXTRA_MAP)
+_TICK_BRIGHT_BG_CODES = dict(TICK_COLOR_ANSI_XTERM256_BRIGHT_BG_EXTRA_MAP)
+
+_TICK_REGEX = re.compile(
+    r"`\[=(?P<gbg>[a-z])|`\[(?P<bg>[0-9]{3})|`=(?P<gfg>[a-z])|`(?P<fg>[0-9]{3})|(?P<code>"
+    + "|".join(re.escape(code) for code in sorted({**_TICK_ANSI_CODES, **_TICK_BRIGHT_BG_CODES}, key=len, reverse=True))
+    + ")"
+)
+
+
+def xterm256_index(code: str) -> int:
+    """
+    Converts the body of an XTERM256 tick code to its xterm color index, matching Evennia's own conversion.
+    :param code: Three digits for a color (e.g. "500") or a greyscale letter from a to z
+    :return: The xterm color index
+    """
+    if code.isdigit():
+        red, green, blue = (int(digit) for digit in code)
+        return 16 + (red * 36) + (green * 6) + blue
+    if code == "a":
+        return 16  # pure black is the first color cube entry
+    if code == "z":
+        return 231  # pure white is the last color cube entry
+    return 134 + ord(code)
+
+
+def _tick_to_ansi_sub(match: re.Match) -> str:
+    """Replaces a single tick code match with its ANSI sequence."""
+    code = match.group("code")
+    if code in _TICK_BRIGHT_BG_CODES:
+        return f"\033[48;5;{xterm256_index(_TICK_BRIGHT_BG_CODES[code][2:])}m"
+    if code:
+        return _TICK_ANSI_CODES[code]
+    for group, background in (("fg", False), ("bg", True), ("gfg", False), ("gbg", True)):
+        if value := match.group(group):
+            return f"\033[{4 if background else 3}8;5;{xterm256_index(value)}m"
+    return match.group(0)
+
+
+def tick_to_ansi(text: str) -> str:
+    """
+    Translates tick color markup directly to ANSI escape sequences with XTERM256 colors.
+    :param text: Text with tick markup
+    :return: `text` with every tick code replaced by its ANSI sequence
+    """
+    return _TICK_REGEX.sub(_tick_to_ansi_sub, text)
+
+
+#############################################################
+#
+# Downsampling for clients without XTERM256. Evennia rounds
+# each XTERM256 code to an ANSI color on every message, so
+# instead every XTERM256 color is matched once to the ANSI
+# color that looks closest, and text for those clients has
+# its XTERM256 codes swapped for the matching ANSI tick codes.
+#
+#############################################################
+
+# RGB values of the ANSI colors, as xterm shows them
+_ANSI_RGB = (
+    (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0), (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+    (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0), (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+# Tick codes for the ANSI colors. Pure black isn't available in the foreground, so it's left out.
+_ANSI_FG_TICKS = ("", "`r", "`g", "`y", "`b", "`m", "`c", "`w", "`D", "`R", "`G", "`Y", "`B", "`M", "`C", "`W")
+_ANSI_BG_TICKS = ("`[D", "`[R", "`[G", "`[Y", "`[B", "`[M", "`[C", "`[W")
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _xterm256_rgb(index: int) -> tuple[int, int, int]:
+    """Returns the RGB value xterm shows a color index as."""
+    if index < 16:
+        return _ANSI_RGB[index]
+    if index < 232:
+        index -= 16
+        return _CUBE_LEVELS[index // 36], _CUBE_LEVELS[index // 6 % 6], _CUBE_LEVELS[index % 6]
+    grey = 8 + (index - 232) * 10
+    return grey, grey, grey
+
+
+def _lab(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
+    """Converts an sRGB color to CIELAB, where distances between colors are close to how different they look."""
+    linear = [((c / 255 + 0.055) / 1.055) ** 2.4 if c / 255 > 0.04045 else c / 255 / 12.92 for c in rgb]
+    xyz = (
+        (0.4124 * linear[0] + 0.3576 * linear[1] + 0.1805 * linear[2]) / 0.95047,
+        0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2],
+        (0.0193 * linear[0] + 0.1192 * linear[1] + 0.9505 * linear[2]) / 1.08883,
+    )
+    fx, fy, fz = (value ** (1 / 3) if value > 0.008856 else 7.787 * value + 16 / 116 for value in xyz)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _closest(index: int, candidates: range) -> int:
+    target = _lab(_xterm256_rgb(index))
+    return min(candidates, key=lambda ansi: sum((a - b) ** 2 for a, b in zip(target, _lab(_ANSI_RGB[ansi]))))
+
+
+# XTERM256 color index to the tick code of the closest ANSI foreground and background colors
+XTERM256_TO_ANSI_FG = tuple(_ANSI_FG_TICKS[_closest(index, range(1, 16))] for index in range(256))
+XTERM256_TO_ANSI_BG = tuple(_ANSI_BG_TICKS[_closest(index, range(8))] for index in range(256))
+
+_XTERM256_REGEX = re.compile(
+    r"(?P<escape>\|\|)|[`|](?:\[=(?P<gbg>[a-z])|\[(?P<bg>[0-9]{3})|=(?P<gfg>[a-z])|(?P<fg>[0-9]{3}))|(?P<bright_bg>"
+    + "|".join(re.escape(code) for code in _TICK_BRIGHT_BG_CODES) + ")"
+)
+
+
+def _downsample_sub(match: re.Match) -> str:
+    """Replaces a single XTERM256 code with the closest ANSI tick code."""
+    if code := match.group("bright_bg"):
+        return XTERM256_TO_ANSI_BG[xterm256_index(_TICK_BRIGHT_BG_CODES[code][2:])]
+    for group, table in (("fg", XTERM256_TO_ANSI_FG), ("bg", XTERM256_TO_ANSI_BG),
+                         ("gfg", XTERM256_TO_ANSI_FG), ("gbg", XTERM256_TO_ANSI_BG)):
+        if value := match.group(group):
+            index = xterm256_index(value)
+            # Digits past 5 can run past the end of the palette, which is left for Evennia to deal with
+            return table[index] if index < len(table) else match.group(0)
+    return match.group(0)
+
+
+@lru_cache(maxsize=4096)
+def downsample_to_ansi(text: str) -> str:
+    """
+    Swaps the XTERM256 codes in tick or pipe markup for the closest ANSI tick codes, for clients that only show ANSI
+    colors. Results are cached, since the same strings are sent to every such client.
+    :param text: Text with markup
+    :return: `text` with only ANSI color codes
+    """
+    return _XTERM256_REGEX.sub(_downsample_sub, text)
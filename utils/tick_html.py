@@ -0,0 +1,141 @@
+"""
+Tick markup to HTML
+
+Printer - October 2026
+
+Renders tick and pipe color markup straight to HTML for the website, instead of going through ANSI first. Colored text
+is put in spans with the same `color-NNN`, `bgcolor-NNN`, `underline` and `inverse` classes as Evennia's webclient,
+which `web/static/website/css/custom.css` colors for the website. Rendered strings are cached, since the same names and
+enum values are shown on page after page.
+
+Long texts like channel logs can be rendered a line at a time with `TickHtmlStream`, which carries colors over from one
+line to the next. In templates, load the `tick_colors` library and use the `ticks` filter:
+
+    {% load tick_colors %}
+    {{ character.db.intro|ticks }}
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+
+from evennia.utils.ansi import parse_ansi
+
+from utils.tick_text import RESETS, parse, split_codes
+
+_SGR = re.compile(r"\033\[([0-9;]*)m")
+
+
+@lru_cache(maxsize=256)
+def _sgr_params(code: str) -> tuple[int, ...]:
+    """Returns the ANSI SGR parameters a markup code stands for."""
+    params = []
+    for match in _SGR.finditer(parse_ansi(code, xterm256=True)):
+        params += [int(param) for param in match.group(1).split(";") if param]
+    return tuple(params)
+
+
+class _Style:
+    """The colors and effects in use at some point in a text."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.fg = None
+        self.bg = None
+        self.hilite = False
+        self.underline = False
+        self.inverse = False
+
+    def apply(self, code: str):
+        if code in RESETS:
+            self.reset()
+            return
+        params = iter(_sgr_params(code))
+        for param in params:
+            if param == 0:
+                self.reset()
+            elif param == 1:
+                self.hilite = True
+            elif param == 22:
+                self.hilite = False
+            elif param == 4:
+                self.underline = True
+            elif param == 7:
+                self.inverse = True
+            elif 30 <= param <= 37:
+                self.fg = param - 30
+            elif 40 <= param <= 47:
+                self.bg = param - 40
+            elif param in (38, 48) and next(params, None) == 5:
+                index = next(params, 0)
+                if param == 38:
+                    # xterm colors are kept apart from ANSI ones by being past the hilite range
+                    self.fg = 256 + index
+                else:
+                    self.bg = index
+
+    def classes(self) -> str:
+        classes = []
+        if self.fg is not None:
+            classes.append(f"color-{self.fg - 256 if self.fg >= 256 else self.fg + 8 * self.hilite:03d}")
+        elif self.hilite:
+            classes.append("color-015")
+        if self.bg is not None:
+            classes.append(f"bgcolor-{self.bg:03d}")
+        if self.underline:
+            classes.append("underline")
+        if self.inverse:
+            classes.append("inverse")
+        return " ".join(classes)
+
+
+def _render_runs(text: str, style: _Style) -> str:
+    """Renders text to HTML starting from a style, leaving the style as it is at the end of the text."""
+    html = []
+    for run in parse(text):
+        if run.style:
+            for code in split_codes(run.style):
+                style.apply(code)
+        if run.text:
+            classes = style.classes()
+            content = escape(run.text, quote=False)
+            html.append(f'<span class="{classes}">{content}</span>' if classes else content)
+    return "".join(html)
+
+
+@lru_cache(maxsize=2048)
+def tick_to_html(text: str) -> str:
+    """
+    Renders markup to HTML.
+    :param text: Text with tick or pipe markup
+    :return: HTML with the colors as spans, wrapped in a `tick-text` span that keeps spacing and line breaks
+    """
+    return f'<span class="tick-text">{_render_runs(text, _Style())}</span>'
+
+
+class TickHtmlStream:
+    """Renders a long text a line at a time, carrying colors over from each line to the next."""
+
+    def __init__(self):
+        self.style = _Style()
+
+    def render_line(self, line: str) -> str:
+        """
+        Renders one line. Markup codes can't be split between lines.
+        :param line: A line with markup, with or without its line break
+        :return: The line's HTML
+        """
+        return _render_runs(line, self.style)
+
+    def render(self, lines):
+        """
+        Renders lines as they come, for streaming responses.
+        :param lines: Lines with markup
+        :return: A generator of HTML, starting and ending the `tick-text` span
+        """
+        yield '<span class="tick-text">'
+        for line in lines:
+            yield self.render_line(line)
+        yield "</span>"
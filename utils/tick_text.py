@@ -0,0 +1,237 @@
+"""
+Markup-aware text layout
+
+Printer - October 2026
+
+Tick codes (`Y, `123, `[=a) and Evennia's pipe codes (|y, |n) take up characters without being shown, so `len()` and
+`textwrap` can't line text up. This parses markup once into runs of visible text with the codes that come before them,
+and measures, wraps, pads and lays out tables from the runs without losing any colors. Parses are cached, so strings that
+are shown over and over, like enum values, are only parsed once.
+
+    visible_width("`WTier `c3`x")                 # 6
+    wrap(description, 78)                        # lines that carry their colors over
+    table([["`WJane`Y:", "Tier `c3`x"], ...])    # columns lined up by what's shown
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from utils.tick_colors import TICK_COLOR_ANSI_EXTRA_MAP, TICK_COLOR_ANSI_XTERM256_BRIGHT_BG_EXTRA_MAP
+
+# Codes that end all styling
+RESETS = ("`x", "|n")
+# What markup that stands for characters is shown as. Tabs are counted as four spaces.
+_SPECIALS = {"/": "\n", "-": "    ", "_": " "}
+
+_TICK_CODES = sorted({code for code, _ in TICK_COLOR_ANSI_EXTRA_MAP + TICK_COLOR_ANSI_XTERM256_BRIGHT_BG_EXTRA_MAP}
+                     - {f"`{special}" for special in _SPECIALS}, key=len, reverse=True)
+_MARKUP = re.compile(
+    r"(?P<escape>\|\|)|(?P<special>[|`][/\-_])|(?P<code>"
+    r"\|\[?=[a-z]|\|\[?[0-5]{3}|\|\[?[rgybmcwxRGYBMCWX]|\|[nhHuUiI*^]"
+    r"|`\[?=[a-z]|`\[?[0-9]{3}|" + "|".join(re.escape(code) for code in _TICK_CODES) + ")"
+)
+_SPACES = re.compile(r"(\n| +)")
+
+
+class Run(NamedTuple):
+    """Visible text and the markup codes that come right before it."""
+
+    text: str
+    style: str = ""
+
+
+@lru_cache(maxsize=4096)
+def parse(text: str) -> tuple[Run, ...]:
+    """
+    Splits text into runs of visible text, each with the markup codes before it.
+    :param text: Text with tick or pipe markup
+    :return: The runs, ending with a run with no text if the text ends with codes
+    """
+    runs, style, visible = [], [], []
+    position = 0
+
+    def end_run():
+        if visible or style:
+            runs.append(Run("".join(visible), "".join(style)))
+            visible.clear()
+            style.clear()
+
+    for match in _MARKUP.finditer(text):
+        if match.start() > position:
+            visible.append(text[position:match.start()])
+        position = match.end()
+        if match.group("escape"):
+            visible.append("|")
+        elif match.group("special"):
+            visible.append(_SPECIALS[match.group("special")[1]])
+        else:
+            if visible:
+                end_run()
+            style.append(match.group("code"))
+    visible.append(text[position:])
+    end_run()
+    return tuple(runs)
+
+
+def render(runs) -> str:
+    """Turns runs back into markup."""
+    return "".join(run.style + run.text.replace("|", "||") for run in runs)
+
+
+@lru_cache(maxsize=4096)
+def strip_markup(text: str) -> str:
+    """Returns text as it's shown, without any markup."""
+    return "".join(run.text for run in parse(text))
+
+
+@lru_cache(maxsize=4096)
+def visible_width(text: str) -> int:
+    """
+    Measures text as it's shown.
+    :param text: Text with markup
+    :return: How many characters wide its longest line is
+    """
+    return max(len(line) for line in strip_markup(text).split("\n"))
+
+
+def split_codes(style: str) -> list[str]:
+    """Splits a run's style into its markup codes."""
+    return [match.group() for match in _MARKUP.finditer(style)]
+
+
+def _active_style(active: list, style: str) -> list:
+    """Returns the codes still in effect after some more codes, dropping everything before the last reset."""
+    for code in split_codes(style):
+        if code in RESETS:
+            active = []
+        else:
+            active = active + [code]
+    return active
+
+
+class _LineBuilder:
+    """Builds lines of markup, closing each line's colors and opening them again on the next."""
+
+    def __init__(self):
+        self.lines = []
+        self.parts = []
+        self.width = 0
+        self.active = []
+
+    def code(self, style: str):
+        self.parts.append(style)
+        self.active = _active_style(self.active, style)
+
+    def text(self, text: str):
+        self.parts.append(text.replace("|", "||"))
+        self.width += len(text)
+
+    def end_line(self):
+        if self.active:
+            self.parts.append(RESETS[0])
+        self.lines.append("".join(self.parts))
+        self.parts = ["".join(self.active)] if self.active else []
+        self.width = 0
+
+
+def wrap(text: str, width: int) -> list[str]:
+    """
+    Word wraps text by what's shown. Each line ends its colors, and the next starts them again.
+    :param text: Text with markup
+    :param width: The most characters to show on a line, at least 1
+    :return: The lines
+    """
+    if width < 1:
+        raise ValueError(f"Can't wrap text to a width of {width}.")
+    builder = _LineBuilder()
+    space = ""
+    for run in parse(text):
+        if run.style:
+            builder.code(run.style)
+        for piece in _SPACES.split(run.text):
+            if not piece:
+                continue
+            if piece == "\n":
+                builder.end_line()
+                space = ""
+            elif piece.isspace():
+                space += piece
+            else:
+                if builder.width and builder.width + len(space) + len(piece) > width:
+                    builder.end_line()
+                elif builder.width:
+                    builder.text(space)
+                space = ""
+                # Words longer than a whole line are split
+                while len(piece) > width - builder.width:
+                    if builder.width:
+                        builder.end_line()
+                        continue
+                    builder.text(piece[:width])
+                    piece = piece[width:]
+                builder.text(piece)
+    builder.end_line()
+    return builder.lines
+
+
+def truncate(text: str, width: int) -> str:
+    """
+    Cuts text down to a width by what's shown, keeping its markup.
+    :param text: Text with markup
+    :param width: The most characters to show
+    :return: The text, closed with a reset if it was cut while colored
+    """
+    if visible_width(text) <= width and "\n" not in strip_markup(text):
+        return text
+    builder = _LineBuilder()
+    for run in parse(text):
+        if run.style:
+            builder.code(run.style)
+        visible = run.text.split("\n", 1)[0][:width - builder.width]
+        builder.text(visible)
+        if builder.width >= width or len(visible) < len(run.text):
+            break
+    builder.end_line()
+    return builder.lines[0]
+
+
+def pad(text: str, width: int, align: str = "l") -> str:
+    """
+    Pads text with spaces to a width by what's shown. Colors are ended before the padding.
+    :param text: Text with markup
+    :param width: The width to pad to
+    :param align: "l", "r" or "c" to put the text on the left, right or center
+    :return: The padded text
+    """
+    missing = width - visible_width(text)
+    if _active_style([], "".join(run.style for run in parse(text))):
+        text += RESETS[0]
+    if missing <= 0:
+        return text
+    if align == "r":
+        return " " * missing + text
+    if align == "c":
+        return " " * (missing // 2) + text + " " * (missing - missing // 2)
+    return text + " " * missing
+
+
+def table(rows, aligns: str = "", gap: int = 1, indent: int = 0) -> str:
+    """
+    Lines up rows of cells in columns by what's shown.
+    :param rows: Lists of cells with markup. Shorter rows are filled out with empty cells.
+    :param aligns: "l", "r" or "c" for each column, with columns past the end aligned left
+    :param gap: Spaces between columns
+    :param indent: Spaces before each row
+    :return: The table, one row per line
+    """
+    rows = [[str(cell) for cell in row] for row in rows]
+    columns = max((len(row) for row in rows), default=0)
+    widths = [max((visible_width(row[column]) for row in rows if column < len(row)), default=0)
+              for column in range(columns)]
+    lines = []
+    for row in rows:
+        cells = [pad(row[column] if column < len(row) else "", widths[column],
+                     aligns[column] if column < len(aligns) else "l") for column in range(columns)]
+        lines.append((" " * indent + (" " * gap).join(cells)).rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,87 @@
+"""
+API serializers
+
+Printer - October 2026
+
+Turns characters and roster entries into plain data for the API. Markup is stripped, so the community site gets the
+text as it's shown in game. The attributes read here are loaded for a whole page at once by the views, so
+serializing a page doesn't query the database again.
+"""
+
+from rest_framework import serializers
+
+from utils.tick_text import strip_markup
+
+# The character attributes shown on public profiles. Names are left out, since strangers only see each other's intros.
+PROFILE_ATTRIBUTES = ("race", "tier", "intro")
+# The account attribute holding its roster
+ROSTER_ATTRIBUTE = "roster"
+
+
+def loaded_attributes(obj) -> dict:
+    """
+    Returns the attributes the views loaded onto an object, by key.
+    :param obj: A character or account from one of the API's pages
+    """
+    return getattr(obj, "api_values", {})
+
+
+def _plain(text) -> str | None:
+    return strip_markup(str(text)) if text else None
+
+
+class RosterEntrySerializer(serializers.Serializer):
+    """One character in an account's roster, from its `RosterCharacterData`."""
+
+    name = serializers.SerializerMethodField()
+    tier = serializers.IntegerField()
+    archetype = serializers.SerializerMethodField()
+    modifier = serializers.SerializerMethodField()
+
+    def get_name(self, entry) -> str:
+        return _plain(entry.name.strip())
+
+    def get_archetype(self, entry) -> str | None:
+        return _plain(entry.archetype)
+
+    def get_modifier(self, entry) -> str | None:
+        return _plain(entry.modifier)
+
+
+class RosterSerializer(serializers.Serializer):
+    """An account and the characters in its roster."""
+
+    id = serializers.IntegerField()
+    username = serializers.CharField()
+    characters = serializers.SerializerMethodField()
+
+    def get_characters(self, account) -> list:
+        roster = loaded_attributes(account).get(ROSTER_ATTRIBUTE) or {}
+        return RosterEntrySerializer(roster.values(), many=True).data
+
+
+class CharacterProfileSerializer(serializers.Serializer):
+    """A character's public profile, showing only what a stranger would see."""
+
+    id = serializers.IntegerField()
+    race = serializers.SerializerMethodField()
+    tier = serializers.SerializerMethodField()
+    archetype = serializers.SerializerMethodField()
+    intro = serializers.SerializerMethodField()
+
+    def get_race(self, character) -> str | None:
+        race = loaded_attributes(character).get("race")
+        return race.name.capitalize() if race else None
+
+    def get_tier(self, character) -> int | None:
+        return loaded_attributes(character).get("tier")
+
+    def get_archetype(self, character) -> str | None:
+        values = loaded_attributes(character)
+        try:
+            return _plain(values["race"].archetype(values["tier"], use_color=False))
+        except (KeyError, AttributeError, ValueError):
+            return None
+
+    def get_intro(self, character) -> str | None:
+        return _plain(loaded_attributes(character).get("intro"))
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from constants.character import Race
+from containers.RosterCharacterData import RosterCharacterData
+from typeclasses.characters import Character
+
+
+def _data_queries(captured) -> list[str]:
+    """Returns the queries a request made for its data, leaving out the web session's."""
+    return [query["sql"] for query in captured.captured_queries
+            if "django_session" not in query["sql"] and "SAVEPOINT" not in query["sql"]]
+
+
+class GameApiTests(EvenniaTest):
+    """This tests the game API's profiles, rosters and response caching"""
+
+    character_typeclass = Character
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.char1.attributes.batch_add(("first_name", "Jane"), ("last_name", "Doe"), ("race", Race.HUMAN), ("tier", 1),
+                                        ("intro", "A tall woman"))
+        self.char2.attributes.batch_add(("first_name", "John"), ("last_name", "Roe"), ("race", Race.HUMAN), ("tier", 1))
+
+    def test_profiles(self):
+        """Tests that finished characters are listed with their profiles"""
+        create.create_object(Character, key="Unfinished").db.chargen_step = "node_chargen"
+        response = self.client.get("/api/game/characters/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+        profile = response.data["results"][0]
+        self.assertNotIn("name", profile)
+        self.assertNotIn("Jane", str(response.data))
+        self.assertEqual(profile["race"], "Human")
+        self.assertEqual(profile["tier"], 1)
+        self.assertEqual(profile["intro"], "A tall woman")
+        self.assertEqual(profile["archetype"], Race.HUMAN.archetype(1, use_color=False).replace("`x", ""))
+
+    def test_profile_queries(self):
+        """Tests that a page of profiles is a count, the page and its attributes, however many characters there are"""
+        with CaptureQueriesContext(connection) as before:
+            self.client.get("/api/game/characters/")
+        cache.clear()
+        third = create.create_object(Character, key="Third")
+        third.attributes.batch_add(("race", Race.HUMAN), ("tier", 1), ("intro", "A short woman"))
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get("/api/game/characters/")
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(_data_queries(after)), 3)
+        self.assertEqual(len(_data_queries(before)), 3)
+
+    def test_etag(self):
+        """Tests that responses are cached and answer If-None-Match with 304"""
+        response = self.client.get("/api/game/characters/")
+        etag = response["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/game/characters/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(_data_queries(queries), [])
+        cache.clear()
+        self.char1.db.intro = "A very tall woman"
+        self.assertNotEqual(self.client.get("/api/game/characters/")["ETag"], etag)
+
+    def test_rosters(self):
+        """Tests that rosters need a login and only show other accounts' to Builders"""
+        entry = RosterCharacterData()
+        entry.name, entry.tier = "Jane Doe", 1
+        entry.archetype, entry.modifier = Race.HUMAN.archetype(1), "`RStrong`x"
+        self.account.db.roster = {"janedoe": entry}
+        self.account2.db.roster = {}
+        self.assertEqual(self.client.get("/api/game/rosters/").status_code, 401)
+
+        self.account.permissions.remove("Developer")
+        self.client.force_login(self.account)
+        response = self.client.get("/api/game/rosters/")
+        self.assertEqual([roster["id"] for roster in response.data["results"]], [self.account.id])
+        self.assertEqual(response.data["results"][0]["characters"][0]["modifier"], "Strong")
+
+        cache.clear()
+        self.account.permissions.add("Builder")
+        response = self.client.get("/api/game/rosters/")
+        self.assertEqual([roster["id"] for roster in response.data["results"]], [self.account.id, self.account2.id])
@@ -0,0 +1,16 @@
+"""
+This routes the game's own API. The main web/urls.py includes these routes under `api/game/`.
+
+"""
+
+from rest_framework import routers
+
+from web.api.views import CharacterProfileViewSet, RosterViewSet
+
+app_name = "game_api"
+
+router = routers.SimpleRouter()
+router.register("characters", CharacterProfileViewSet, basename="character")
+router.register("rosters", RosterViewSet, basename="roster")
+
+urlpatterns = router.urls
@@ -0,0 +1,152 @@
+"""
+API views
+
+Printer - October 2026
+
+Read-only endpoints for the community site:
+
+    characters/         public character profiles
+    characters/<id>/    one character's profile
+    rosters/            the characters on each account's roster. Accounts only see their own unless they're Builders.
+
+Each page is read with one query for the page and one for all of its attributes. Responses are cached for
+`API_CACHE_TTL` seconds and carry an ETag, so polling with `If-None-Match` gets an empty 304 while nothing has changed.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils.cache import parse_etags
+from evennia.accounts.models import AccountDB
+from evennia.typeclasses.attributes import Attribute
+from rest_framework import status
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import ReadOnlyModelViewSet
+
+from typeclasses.characters import Character
+from web.api.serializers import (
+    PROFILE_ATTRIBUTES,
+    ROSTER_ATTRIBUTE,
+    CharacterProfileSerializer,
+    RosterSerializer,
+)
+
+_CACHE_PREFIX = "web.api:"
+
+
+def load_attributes(objects, keys):
+    """
+    Loads the uncategorized attributes with the given keys for many objects with one query, into their `api_values`.
+    :param objects: Characters or accounts
+    :param keys: The attribute keys to load
+    :return: The objects
+    """
+    # The idmapper shares objects between requests, and Django won't prefetch onto an object that already has a
+    # prefetch, so the last one is dropped first
+    for obj in objects:
+        obj.__dict__.pop("api_attributes", None)
+    prefetch_related_objects(objects, Prefetch(
+        "db_attributes",
+        queryset=Attribute.objects.filter(db_key__in=keys, db_category__isnull=True),
+        to_attr="api_attributes",
+    ))
+    for obj in objects:
+        obj.api_values = {attribute.db_key: attribute.value for attribute in obj.__dict__.pop("api_attributes")}
+    return objects
+
+
+def etag_for(data) -> str:
+    """
+    Makes an ETag from response data, so the same data always gets the same tag.
+    :param data: Serialized response data
+    :return: The quoted ETag
+    """
+    encoded = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    return f'"{hashlib.md5(encoded, usedforsecurity=False).hexdigest()}"'
+
+
+class CachedReadOnlyViewSet(ReadOnlyModelViewSet):
+    """A read-only viewset whose responses are cached for a short time and answer `If-None-Match`."""
+
+    # Whether each account gets its own responses, instead of everyone sharing them
+    cache_per_account = False
+    # The attributes the serializer reads, loaded for each page at once
+    attribute_keys = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(request, super().retrieve, *args, **kwargs)
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        return page if page is None else load_attributes(page, self.attribute_keys)
+
+    def get_object(self):
+        return load_attributes([super().get_object()], self.attribute_keys)[0]
+
+    def _cache_key(self, request) -> str:
+        key = _CACHE_PREFIX + request.build_absolute_uri()
+        if self.cache_per_account:
+            key += f"#{request.user.id}"
+        return key
+
+    def _cached(self, request, view, *args, **kwargs):
+        """Answers from the cache if it can, otherwise renders the view and caches its data and ETag."""
+        key = self._cache_key(request)
+        cached = cache.get(key)
+        if cached is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cached = (etag_for(response.data), response.data)
+            cache.set(key, cached, settings.API_CACHE_TTL)
+        etag, data = cached
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        scope = "private" if self.cache_per_account else "public"
+        response["Cache-Control"] = f"{scope}, max-age={settings.API_CACHE_TTL}"
+        return response
+
+
+class CharacterProfileViewSet(CachedReadOnlyViewSet):
+    """Public profiles of every finished character."""
+
+    serializer_class = CharacterProfileSerializer
+    permission_classes = [AllowAny]
+    attribute_keys = PROFILE_ATTRIBUTES
+
+    def get_queryset(self):
+        return (
+            Character.objects.all_family()
+            .filter(db_attributes__db_key="race", db_attributes__db_category__isnull=True)
+            .exclude(db_attributes__db_key="chargen_step")
+            .order_by("id")
+        )
+
+
+class RosterViewSet(CachedReadOnlyViewSet):
+    """Account rosters, visible to their own account and to Builders."""
+
+    serializer_class = RosterSerializer
+    permission_classes = [IsAuthenticated]
+    cache_per_account = True
+    attribute_keys = (ROSTER_ATTRIBUTE,)
+
+    def get_queryset(self):
+        accounts = AccountDB.objects.filter(
+            db_attributes__db_key=ROSTER_ATTRIBUTE, db_attributes__db_category__isnull=True
+        )
+        if not self.request.user.check_permstring("Builder"):
+            accounts = accounts.filter(id=self.request.user.id)
+        return accounts.order_by("id")
@@ -0,0 +1,25 @@
+"""
+Tick color template filters
+
+Printer - October 2026
+
+Registered as the `tick_colors` template library in settings.
+
+    {% load tick_colors %}
+    {{ character.db.intro|ticks }}
+"""
+
+from django import template
+from django.utils.safestring import mark_safe
+
+from utils.tick_html import tick_to_html
+
+register = template.Library()
+
+
+@register.filter
+def ticks(value):
+    """Renders tick and pipe color markup as colored HTML."""
+    if value is None:
+        return ""
+    return mark_safe(tick_to_html(str(value)))
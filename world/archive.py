@@ -0,0 +1,278 @@
+"""
+Character and roster archives
+
+Printer - October 2026
+
+Exports every finished character and every account roster to newline-delimited JSON, one record per line, and imports
+them again. Archives ending in `.gz` are gzip compressed. Characters are read a chunk at a time by id, with one query
+for the chunk and one for its Attributes, and each record is written as soon as it's built, so exporting takes the same
+memory however many characters there are. Imports are read a line at a time and inserted in batches with the bulk
+helpers from `world.population`.
+
+    {"type": "character", "id": 12, "key": "JaneDoe", "account": "jane", "attributes": {"race": "HUMAN", ...}}
+    {"type": "roster", "account": "jane", "characters": [{"key": "janedoe", "name": "Jane Doe", "tier": 1, ...}]}
+
+Enum Attributes like `race` are written by member name. Imported characters are created offline, at the start location,
+and characters whose key is already taken are skipped. Rosters replace the roster of the account with the same name.
+
+    evennia export_characters backup.jsonl.gz
+    evennia import_characters backup.jsonl.gz
+"""
+
+import gzip
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from evennia.accounts.models import AccountDB
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.utils import create
+from evennia.utils.dbserialize import from_pickle
+
+from constants.character import Eyes, Hair, Race
+from containers.RosterCharacterData import RosterCharacterData
+from typeclasses.characters import Character
+from world.population import BATCH_SIZE, _bulk_create_typeclassed, _claim_characters, _set_account_attributes
+
+# Rows read per query while exporting
+CHUNK_SIZE = 2000
+# The Attributes exported for each character
+CHARACTER_ATTRIBUTES = (
+    "first_name", "last_name", "email", "they", "them", "their", "race", "tier", "modifier", "birth_year",
+    "birth_month", "birth_day", "apparent_age", "feet", "inches", "hair", "hairstyle", "eyes", "trait", "intro",
+    "codename1", "codename2",
+)
+_ENUM_ATTRIBUTES = {"race": Race, "hair": Hair, "eyes": Eyes}
+_ROSTER_FIELDS = ("name", "tier", "archetype", "modifier")
+
+
+class ArchiveSummary:
+    """Stores what was exported or imported."""
+
+    def __init__(self):
+        self.characters = 0
+        self.rosters = 0
+        self.skipped = 0
+
+    def __str__(self):
+        skipped = f", skipped {self.skipped} records" if self.skipped else ""
+        return f"{self.characters} characters and {self.rosters} rosters{skipped}"
+
+
+def _open(path: str, mode: str):
+    """Opens an archive for reading ("r") or writing ("w") as text, compressed if its name ends in `.gz`."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _chunks(queryset, chunk_size: int):
+    """
+    Reads rows a chunk at a time by id, so no more than one chunk is ever held in memory.
+    :param queryset: A `values()` queryset that includes "id"
+    :param chunk_size: Rows per query
+    :return: A generator of lists of rows
+    """
+    last_id = 0
+    while chunk := list(queryset.filter(id__gt=last_id).order_by("id")[:chunk_size]):
+        yield chunk
+        last_id = chunk[-1]["id"]
+
+
+def _attributes_of(model, ids: list[int], keys) -> dict:
+    """
+    Reads uncategorized Attributes of many objects or accounts with one query.
+    :param model: `ObjectDB` or `AccountDB`
+    :param ids: The owners' ids
+    :param keys: The Attribute keys to read
+    :return: A dict of owner ids to dicts of Attribute values by key
+    """
+    owner = f"{model._meta.model_name}__id"
+    rows = Attribute.objects.filter(**{f"{owner}__in": ids}, db_key__in=keys, db_category__isnull=True).values_list(
+        owner, "db_key", "db_value"
+    )
+    values = {owner_id: {} for owner_id in ids}
+    for owner_id, key, value in rows:
+        values[owner_id][key] = from_pickle(value)
+    return values
+
+
+def _encode(key: str, value):
+    return value.name if key in _ENUM_ATTRIBUTES and value is not None else value
+
+
+def _decode(key: str, value):
+    return _ENUM_ATTRIBUTES[key][value] if key in _ENUM_ATTRIBUTES and value is not None else value
+
+
+def iter_records(chunk_size: int = CHUNK_SIZE):
+    """
+    Builds the archive's records, characters first and then rosters.
+    :param chunk_size: Rows read per query
+    :return: A generator of records
+    """
+    # Finished characters are the ones with a race that aren't still in chargen. New characters start with a race of
+    # `None`, which is skipped below since pickled values can't be filtered in the database.
+    characters = (
+        Character.objects.all_family()
+        .filter(db_attributes__db_key="race", db_attributes__db_category__isnull=True)
+        .exclude(db_attributes__db_key="chargen_step")
+        .values("id", "db_key", username=F("db_account__username"))
+    )
+    for chunk in _chunks(characters, chunk_size):
+        attributes = _attributes_of(ObjectDB, [row["id"] for row in chunk], CHARACTER_ATTRIBUTES)
+        for row in chunk:
+            if attributes[row["id"]].get("race") is None:
+                continue
+            yield {
+                "type": "character",
+                "id": row["id"],
+                "key": row["db_key"],
+                "account": row["username"],
+                "attributes": {key: _encode(key, value) for key, value in attributes[row["id"]].items()},
+            }
+
+    accounts = AccountDB.objects.filter(
+        db_attributes__db_key="roster", db_attributes__db_category__isnull=True
+    ).values("id", "username")
+    for chunk in _chunks(accounts, chunk_size):
+        rosters = _attributes_of(AccountDB, [row["id"] for row in chunk], ("roster",))
+        for row in chunk:
+            roster = rosters[row["id"]].get("roster") or {}
+            yield {
+                "type": "roster",
+                "account": row["username"],
+                "characters": [{"key": key, **{field: getattr(entry, field) for field in _ROSTER_FIELDS}}
+                               for key, entry in roster.items()],
+            }
+
+
+def export_archive(path: str, chunk_size: int = CHUNK_SIZE) -> ArchiveSummary:
+    """
+    Writes every finished character and account roster to an archive.
+    :param path: Where to write it. Paths ending in `.gz` are compressed.
+    :param chunk_size: Rows read per query
+    :return: How many records were written
+    """
+    summary = ArchiveSummary()
+    with _open(path, "w") as archive:
+        for record in iter_records(chunk_size):
+            archive.write(json.dumps(record, separators=(",", ":")) + "\n")
+            if record["type"] == "character":
+                summary.characters += 1
+            else:
+                summary.rosters += 1
+    return summary
+
+
+class _Importer:
+    """Collects records and inserts them a batch at a time."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.summary = ArchiveSummary()
+        self.characters = []
+        self.rosters = []
+        self.home = ObjectDB.objects.get_id(settings.DEFAULT_HOME)
+        self.start = ObjectDB.objects.get_id(settings.START_LOCATION)
+
+    def add(self, record: dict):
+        if record["type"] == "character":
+            self.characters.append(record)
+            if len(self.characters) >= self.batch_size:
+                self.flush_characters()
+        elif record["type"] == "roster":
+            # Rosters list the account's characters, so those are inserted first
+            self.flush_characters()
+            self.rosters.append(record)
+            if len(self.rosters) >= self.batch_size:
+                self.flush_rosters()
+        else:
+            self.summary.skipped += 1
+
+    def flush(self):
+        self.flush_characters()
+        self.flush_rosters()
+
+    def flush_characters(self):
+        if not self.characters:
+            return
+        records, self.characters = self.characters, []
+        account_ids = dict(AccountDB.objects.filter(
+            username__in={record["account"] for record in records if record["account"]}
+        ).values_list("username", "id"))
+        taken = set(Character.objects.all_family().filter(
+            db_key__in=[record["key"] for record in records]
+        ).values_list("db_key", flat=True))
+
+        characters, attributes = [], []
+        for record in records:
+            if record["key"] in taken:
+                self.summary.skipped += 1
+                continue
+            taken.add(record["key"])
+            characters.append(ObjectDB(db_key=record["key"], db_account_id=account_ids.get(record["account"]),
+                                       db_home=self.home))
+            values = {key: _decode(key, value) for key, value in record["attributes"].items()}
+            values["prelogout_location"] = self.start
+            attributes.append(values)
+        if not characters:
+            return
+
+        template = create.create_object(settings.BASE_CHARACTER_TYPECLASS, key="Character Template", nohome=True,
+                                        permissions=[settings.PERMISSION_ACCOUNT_DEFAULT])
+        try:
+            _bulk_create_typeclassed(ObjectDB, template, characters, attributes, self.batch_size)
+        finally:
+            template.delete()
+        _claim_characters(characters, attributes, self.batch_size)
+        self.summary.characters += len(characters)
+
+    def flush_rosters(self):
+        if not self.rosters:
+            return
+        records, self.rosters = self.rosters, []
+        account_ids = dict(AccountDB.objects.filter(
+            username__in=[record["account"] for record in records]
+        ).values_list("username", "id"))
+        owned = {}
+        for char in Character.objects.all_family().filter(db_account__in=account_ids.values()):
+            owned.setdefault(char.db_account_id, {})[char.key.lower()] = char
+
+        rosters, playable = {}, {}
+        for record in records:
+            account_id = account_ids.get(record["account"])
+            if account_id is None:
+                self.summary.skipped += 1
+                continue
+            roster = {}
+            for character in record["characters"]:
+                entry = RosterCharacterData()
+                for field in _ROSTER_FIELDS:
+                    setattr(entry, field, character[field])
+                roster[character["key"]] = entry
+            rosters[account_id] = roster
+            characters = owned.get(account_id, {})
+            playable[account_id] = [characters[key] for key in roster if key in characters]
+        if rosters:
+            _set_account_attributes(list(rosters), {"roster": rosters, "_playable_characters": playable},
+                                    self.batch_size)
+        self.summary.rosters += len(rosters)
+
+
+def import_archive(path: str, batch_size: int = BATCH_SIZE) -> ArchiveSummary:
+    """
+    Loads an archive in one transaction.
+    :param path: The archive to read. Paths ending in `.gz` are read as compressed.
+    :param batch_size: How many rows to insert per query
+    :return: How many records were imported and skipped
+    """
+    with _open(path, "r") as archive, transaction.atomic():
+        importer = _Importer(batch_size)
+        for line in archive:
+            if line.strip():
+                importer.add(json.loads(line))
+        importer.flush()
+    return importer.summary
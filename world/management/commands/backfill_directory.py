@@ -0,0 +1,23 @@
+"""
+Management command for listing characters in the directory
+
+Printer - October 2026
+"""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from systems.directory.directory import BATCH_SIZE, backfill_directory
+
+
+class Command(BaseCommand):
+    help = "Mirrors every finished character's race, tier and birth date into the directory's Tags."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Characters listed at a time")
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        listed = backfill_directory(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Listed {listed} characters in {perf_counter() - start:.1f}s."))
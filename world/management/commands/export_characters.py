@@ -0,0 +1,27 @@
+"""
+Management command for exporting characters and rosters
+
+Printer - October 2026
+"""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from world.archive import CHUNK_SIZE, export_archive
+
+
+class Command(BaseCommand):
+    help = "Streams every finished character and account roster to newline-delimited JSON, gzipped if it ends in .gz."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to write, such as backup.jsonl.gz")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows read per query")
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        try:
+            summary = export_archive(options["path"], chunk_size=options["chunk_size"])
+        except OSError as err:
+            raise CommandError(err)
+        self.stdout.write(self.style.SUCCESS(f"Exported {summary} in {perf_counter() - start:.1f}s."))
@@ -0,0 +1,45 @@
+"""
+Management command for generating a synthetic world
+
+Printer - October 2026
+"""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from world.population import BATCH_SIZE, DEFAULT_PASSWORD, DEFAULT_PREFIX, generate_world
+
+
+class Command(BaseCommand):
+    help = "Generates rooms, exits, accounts, characters and channel subscriptions in bulk for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rooms", type=int, default=0, help="Number of rooms, laid out in a grid")
+        parser.add_argument("--accounts", type=int, default=0, help="Number of accounts")
+        parser.add_argument("--characters", type=int, default=0, help="Number of characters spread across accounts")
+        parser.add_argument("--channels", type=int, default=0, help="Number of channels besides the default ones")
+        parser.add_argument("--seed", type=int, default=None, help="Seed so the same arguments build the same world")
+        parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="Prefix for account and channel names")
+        parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Password for every generated account")
+        parser.add_argument("--in-rooms", action="store_true",
+                            help="Leave characters standing in rooms instead of storing them offline")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows inserted per query")
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        try:
+            summary = generate_world(
+                rooms=options["rooms"],
+                accounts=options["accounts"],
+                characters=options["characters"],
+                channels=options["channels"],
+                seed=options["seed"],
+                prefix=options["prefix"],
+                password=options["password"],
+                in_rooms=options["in_rooms"],
+                batch_size=options["batch_size"],
+            )
+        except (RuntimeError, ValueError) as err:
+            raise CommandError(err)
+        self.stdout.write(self.style.SUCCESS(f"Generated {summary} in {perf_counter() - start:.1f}s."))
@@ -0,0 +1,29 @@
+"""
+Management command for importing characters and rosters
+
+Printer - October 2026
+"""
+
+from json import JSONDecodeError
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from world.archive import import_archive
+from world.population import BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "Loads characters and account rosters from an archive written by export_characters."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archive to read, such as backup.jsonl.gz")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows inserted per query")
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        try:
+            summary = import_archive(options["path"], batch_size=options["batch_size"])
+        except (OSError, JSONDecodeError, KeyError) as err:
+            raise CommandError(f"Couldn't import {options['path']}: {err!r}")
+        self.stdout.write(self.style.SUCCESS(f"Imported {summary} in {perf_counter() - start:.1f}s."))
@@ -0,0 +1,448 @@
+"""
+Synthetic world and population generator
+
+Printer - October 2026
+
+Builds a world of rooms, exits, accounts, characters and channel subscriptions for load testing and benchmarks. Objects
+are inserted in bulk instead of through `create_object` and `create_account`, so a world with 100k objects builds in
+minutes. To keep the bulk rows identical to normally created ones, a template of each typeclass is created the usual way
+first, and its locks, cmdsets, permissions and default Attributes are copied onto the rows before the template is
+deleted.
+
+The `generate_world` management command wraps `generate_world` here:
+
+    evennia generate_world --rooms 10000 --accounts 5000 --characters 20000
+"""
+
+import random
+from math import ceil, sqrt
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from evennia.accounts.models import AccountDB
+from evennia.comms.models import ChannelDB
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.typeclasses.tags import Tag
+from evennia.utils import create
+from evennia.utils.dbserialize import to_pickle
+
+from constants.character import MAX_FEET, MAX_INCHES, MIN_FEET, MIN_INCHES, Eyes, Hair, Race
+from containers.RosterCharacterData import RosterCharacterData
+from systems.login.models import NameReservation
+from systems.login.reservations import codename_key, name_key
+from systems.timekeeping.game_clock import GAME_CLOCK
+
+DEFAULT_PREFIX = "loadtest"
+DEFAULT_PASSWORD = "loadtestpassword"
+BATCH_SIZE = 500
+
+# The locks `Account.at_post_create_character` gives a character for its owner
+_CHARACTER_OWNER_LOCKS = ("puppet:id({char}) or pid({account}) or perm(Developer) or pperm(Developer);"
+                          "delete:id({account}) or perm(Admin)")
+
+# Exit names in each grid direction, with their alias and the (x, y) step they take
+_DIRECTIONS = (
+    ("north", "n", 0, -1),
+    ("east", "e", 1, 0),
+    ("south", "s", 0, 1),
+    ("west", "w", -1, 0),
+)
+
+# Names are built from consonant-vowel syllables, so every combination of three is a distinct alphanumeric name
+_SYLLABLES = [consonant + vowel for consonant in "bdfghklmnprstvz" for vowel in "aeiou"]
+_CODENAME_ADJECTIVES = (
+    "Crimson", "Silver", "Iron", "Shadow", "Golden", "Night", "Storm", "Quantum", "Atomic", "Solar", "Lunar", "Arctic",
+    "Blazing", "Phantom", "Emerald", "Cobalt", "Savage", "Mighty", "Silent", "Electric",
+)
+_CODENAME_NOUNS = (
+    "Falcon", "Wolf", "Sentinel", "Specter", "Comet", "Titan", "Viper", "Knight", "Fury", "Hawk", "Tempest", "Wraith",
+    "Guardian", "Lynx", "Ranger", "Cyclone", "Phoenix", "Raven", "Blade", "Nova",
+)
+_PRONOUNS = (("they", "them", "their"), ("she", "her", "her"), ("he", "him", "his"))
+_HAIRSTYLES = ("", "short and messy", "long and straight", "tied back in a ponytail", "cropped close", "braided")
+_TRAITS = ("", "a jagged scar across the cheek", "a nervous smile", "piercing eyes", "a confident stride")
+_INTROS = ("A newcomer", "A tall stranger", "A wiry figure", "A broad-shouldered figure", "A quiet onlooker")
+# Relative odds of each race, with humans being the most common by far
+_RACE_WEIGHTS = {
+    Race.HUMAN: 40, Race.METAHUMAN: 20, Race.MAGICKER: 12, Race.ALIEN: 10, Race.SYNTHETIC: 8, Race.AVALONIAN: 5,
+    Race.DIVER: 5,
+}
+
+
+class WorldSummary:
+    """Stores what `generate_world` created."""
+
+    def __init__(self):
+        self.rooms = []
+        self.exits = 0
+        self.accounts = []
+        self.characters = []
+        self.channels = []
+        self.subscriptions = 0
+
+    def __str__(self):
+        return (f"{len(self.rooms)} rooms, {self.exits} exits, {len(self.accounts)} accounts, "
+                f"{len(self.characters)} characters, {len(self.channels)} channels, {self.subscriptions} subscriptions")
+
+
+def _merge_locks(lock_storage: str, extra_locks: str) -> str:
+    """Adds lock definitions to a lock string, replacing any existing definitions for the same access types."""
+    locks = dict(lock.split(":", 1) for lock in lock_storage.split(";") if lock)
+    locks.update(lock.split(":", 1) for lock in extra_locks.split(";") if lock)
+    return ";".join(f"{access}:{definition}" for access, definition in locks.items())
+
+
+def _capture_template(template) -> tuple[dict, list[Attribute], list[int]]:
+    """
+    Reads everything a bulk-created copy of a template needs.
+    :param template: An account or object that was created normally
+    :return: A tuple of the model fields to copy, the template's Attributes and the ids of its Tags
+    """
+    fields = {"db_typeclass_path": template.db_typeclass_path, "db_lock_storage": template.db_lock_storage,
+              "db_cmdset_storage": template.db_cmdset_storage}
+    return fields, list(template.db_attributes.all()), list(template.db_tags.values_list("id", flat=True))
+
+
+def _bulk_create_typeclassed(model, template, instances: list, attributes: list[dict], batch_size: int) -> list:
+    """
+    Inserts typeclassed rows in bulk as copies of a template, along with their Attributes and Tags.
+    :param model: `ObjectDB` or `AccountDB`
+    :param template: A normally created instance to copy locks, cmdsets, permissions and default Attributes from
+    :param instances: Unsaved instances of `model`
+    :param attributes: The Attributes to set on each instance, which override the template's Attributes of the same key
+    :param batch_size: How many rows to insert per query
+    :return: `instances`, now with primary keys
+    """
+    fields, template_attributes, tag_ids = _capture_template(template)
+    for instance in instances:
+        for field, value in fields.items():
+            setattr(instance, field, value)
+    model.objects.bulk_create(instances, batch_size=batch_size)
+
+    model_name = model._meta.model_name
+    attribute_rows, attribute_owners = [], []
+    for instance, values in zip(instances, attributes):
+        for template_attribute in template_attributes:
+            key = template_attribute.db_key
+            attribute_rows.append(Attribute(
+                db_key=key,
+                db_value=to_pickle(values[key]) if key in values else template_attribute.db_value,
+                db_strvalue=template_attribute.db_strvalue,
+                db_category=template_attribute.db_category,
+                db_lock_storage=template_attribute.db_lock_storage,
+                db_model=model_name,
+                db_attrtype=template_attribute.db_attrtype,
+            ))
+            attribute_owners.append(instance.id)
+        template_keys = {attribute.db_key for attribute in template_attributes}
+        for key, value in values.items():
+            if key not in template_keys:
+                attribute_rows.append(Attribute(db_key=key, db_value=to_pickle(value), db_model=model_name))
+                attribute_owners.append(instance.id)
+    Attribute.objects.bulk_create(attribute_rows, batch_size=batch_size)
+
+    owner_field = f"{model_name}_id"
+    attribute_through = model.db_attributes.through
+    attribute_through.objects.bulk_create(
+        [attribute_through(**{owner_field: owner, "attribute_id": attribute.id})
+         for owner, attribute in zip(attribute_owners, attribute_rows)],
+        batch_size=batch_size,
+    )
+    tag_through = model.db_tags.through
+    tag_through.objects.bulk_create(
+        [tag_through(**{owner_field: instance.id, "tag_id": tag_id}) for instance in instances for tag_id in tag_ids],
+        batch_size=batch_size,
+    )
+    return instances
+
+
+def generate_rooms(count: int, rng: random.Random, batch_size: int = BATCH_SIZE) -> tuple[list, int]:
+    """
+    Creates rooms laid out in a square grid, with exits between each room and its neighbors.
+    :param count: How many rooms to create
+    :param rng: Random number generator to use for descriptions
+    :param batch_size: How many rows to insert per query
+    :return: A tuple of the rooms and how many exits were created
+    """
+    if not count:
+        return [], 0
+
+    width = ceil(sqrt(count))
+    room_template = create.create_object(settings.BASE_ROOM_TYPECLASS, key="Room Template", nohome=True)
+    exit_template = create.create_object(settings.BASE_EXIT_TYPECLASS, key="Exit Template", location=room_template,
+                                         destination=room_template, nohome=True)
+    try:
+        rooms = [ObjectDB(db_key=f"Metro City Block {num % width}-{num // width}") for num in range(count)]
+        descriptions = [{"desc": f"The streets here are {rng.choice(('quiet', 'busy', 'crowded', 'deserted'))}."}
+                        for _ in rooms]
+        _bulk_create_typeclassed(ObjectDB, room_template, rooms, descriptions, batch_size)
+
+        exits, aliases = [], []
+        for num, room in enumerate(rooms):
+            x, y = num % width, num // width
+            for direction, alias, step_x, step_y in _DIRECTIONS:
+                neighbor_x, neighbor_y = x + step_x, y + step_y
+                neighbor = neighbor_y * width + neighbor_x
+                if 0 <= neighbor_x < width and 0 <= neighbor_y and neighbor < count:
+                    exits.append(ObjectDB(db_key=direction, db_location=room, db_home=room,
+                                          db_destination=rooms[neighbor]))
+                    aliases.append(alias)
+        _bulk_create_typeclassed(ObjectDB, exit_template, exits, [{} for _ in exits], batch_size)
+    finally:
+        exit_template.delete()
+        room_template.delete()
+
+    alias_tags = {
+        alias: Tag.objects.get_or_create(db_key=alias, db_category=None, db_tagtype="alias", db_model="objectdb")[0].id
+        for _, alias, _, _ in _DIRECTIONS
+    }
+    tag_through = ObjectDB.db_tags.through
+    tag_through.objects.bulk_create(
+        [tag_through(objectdb_id=exit_obj.id, tag_id=alias_tags[alias]) for exit_obj, alias in zip(exits, aliases)],
+        batch_size=batch_size,
+    )
+    return rooms, len(exits)
+
+
+def generate_accounts(count: int, prefix: str = DEFAULT_PREFIX, password: str = DEFAULT_PASSWORD,
+                      batch_size: int = BATCH_SIZE) -> list:
+    """
+    Creates accounts named `<prefix><number>` that all share one password. The password is only hashed once.
+    :param count: How many accounts to create
+    :param prefix: Prefix for the account names
+    :param password: Password for every account
+    :param batch_size: How many rows to insert per query
+    :return: The accounts
+    """
+    if not count:
+        return []
+
+    template = create.create_account(f"{prefix}template", None, password, typeclass=settings.BASE_ACCOUNT_TYPECLASS,
+                                     permissions=[settings.PERMISSION_ACCOUNT_DEFAULT])
+    try:
+        accounts = [AccountDB(username=f"{prefix}{num}", password=template.password, email="") for num in range(count)]
+        _bulk_create_typeclassed(AccountDB, template, accounts, [{} for _ in accounts], batch_size)
+    finally:
+        template.delete()
+    return accounts
+
+
+def _random_names(count: int, rng: random.Random) -> list[tuple[str, str]]:
+    """Returns `count` distinct first and last name pairs."""
+    syllable_count = len(_SYLLABLES)
+    if count > syllable_count ** 3:
+        raise ValueError(f"Can't generate more than {syllable_count ** 3} distinct names.")
+    names = []
+    for code in rng.sample(range(syllable_count ** 3), count):
+        first = "".join(_SYLLABLES[code // syllable_count ** power % syllable_count] for power in range(3))
+        last = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3)))
+        names.append((first.capitalize(), last.capitalize()))
+    return names
+
+
+def _random_character_attributes(first_name: str, last_name: str, codenames: list[str], home,
+                                 rng: random.Random) -> dict:
+    """Returns the Attributes for a finished character with random but valid details."""
+    race = rng.choices(list(_RACE_WEIGHTS), weights=list(_RACE_WEIGHTS.values()))[0]
+    birth_year, birth_month, birth_day = rng.randint(1950, 2006), rng.randint(1, 12), rng.randint(1, 28)
+    they, them, their = rng.choice(_PRONOUNS)
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{first_name}.{last_name}@example.com".lower(),
+        "they": they, "them": them, "their": their,
+        "race": race,
+        "tier": rng.randint(*race.race_tier_range()),
+        "modifier": None,
+        "birth_year": birth_year, "birth_month": birth_month, "birth_day": birth_day,
+        "apparent_age": GAME_CLOCK.age(birth_year, birth_month, birth_day),
+        "feet": rng.randint(MIN_FEET, MAX_FEET), "inches": rng.randint(MIN_INCHES, MAX_INCHES),
+        "hair": rng.choice(list(Hair)),
+        "hairstyle": rng.choice(_HAIRSTYLES),
+        "eyes": rng.choice(list(Eyes)),
+        "trait": rng.choice(_TRAITS),
+        "intro": rng.choice(_INTROS),
+        "codename1": codenames[0] if codenames else "",
+        "codename2": codenames[1] if len(codenames) > 1 else "",
+        "prelogout_location": home,
+    }
+
+
+def generate_characters(count: int, accounts: list, rooms: list, rng: random.Random, in_rooms: bool = False,
+                        codename_chance: float = 0.3, batch_size: int = BATCH_SIZE) -> list:
+    """
+    Creates finished characters spread across accounts, with their names and codenames reserved and the account rosters
+    filled in. Each account gets at most `MAX_NR_CHARACTERS` characters.
+    :param count: How many characters to create
+    :param accounts: Accounts to own the characters
+    :param rooms: Rooms the characters last logged out in
+    :param rng: Random number generator for character details
+    :param in_rooms: If `True`, characters are left standing in their rooms instead of being stored offline
+    :param codename_chance: The chance that a character has a codename
+    :param batch_size: How many rows to insert per query
+    :return: The characters
+    """
+    if not count:
+        return []
+    if not accounts or not rooms:
+        raise ValueError("Characters need at least one account and one room.")
+    if count > len(accounts) * settings.MAX_NR_CHARACTERS:
+        raise ValueError(f"{len(accounts)} accounts can only hold {len(accounts) * settings.MAX_NR_CHARACTERS} "
+                         "characters.")
+
+    codename_pool = [f"{adjective} {noun}" for adjective in _CODENAME_ADJECTIVES for noun in _CODENAME_NOUNS]
+    rng.shuffle(codename_pool)
+
+    characters, attributes = [], []
+    for num, (first_name, last_name) in enumerate(_random_names(count, rng)):
+        home = rng.choice(rooms)
+        codenames = []
+        while codename_pool and len(codenames) < 2 and rng.random() < codename_chance:
+            codenames.append(codename_pool.pop())
+        characters.append(ObjectDB(db_key=f"{first_name}{last_name}", db_account=accounts[num % len(accounts)],
+                                   db_home=rooms[0], db_location=home if in_rooms else None))
+        attributes.append(_random_character_attributes(first_name, last_name, codenames, home, rng))
+
+    template = create.create_object(settings.BASE_CHARACTER_TYPECLASS, key="Character Template", nohome=True,
+                                    permissions=[settings.PERMISSION_ACCOUNT_DEFAULT])
+    try:
+        _bulk_create_typeclassed(ObjectDB, template, characters, attributes, batch_size)
+    finally:
+        template.delete()
+
+    _claim_characters(characters, attributes, batch_size)
+    _fill_rosters(accounts, characters, attributes, batch_size)
+    return characters
+
+
+def _claim_characters(characters: list, attributes: list[dict], batch_size: int):
+    """Gives bulk-created characters their owners' locks, and reserves their names and codenames."""
+    owned = [char for char in characters if char.db_account_id]
+    for char in owned:
+        char.db_lock_storage = _merge_locks(char.db_lock_storage,
+                                            _CHARACTER_OWNER_LOCKS.format(char=char.id, account=char.db_account_id))
+    ObjectDB.objects.bulk_update(owned, ["db_lock_storage"], batch_size=batch_size)
+
+    reservations = []
+    for char, values in zip(characters, attributes):
+        # Characters made by staff may not have a name to reserve
+        if values.get("first_name"):
+            reservations.append(NameReservation(db_key=name_key(values["first_name"], values.get("last_name") or ""),
+                                                db_object_id=char.id))
+        reservations.extend(NameReservation(db_key=codename_key(codename), db_object_id=char.id)
+                            for codename in (values.get("codename1"), values.get("codename2")) if codename)
+    NameReservation.objects.bulk_create(reservations, batch_size=batch_size, ignore_conflicts=True)
+
+
+def _fill_rosters(accounts: list, characters: list, attributes: list[dict], batch_size: int):
+    """Adds each character to its account's roster and playable characters."""
+    owned = {account.id: [] for account in accounts}
+    for char, values in zip(characters, attributes):
+        owned[char.db_account_id].append((char, values))
+
+    rosters, playable = {}, {}
+    for account_id, chars in owned.items():
+        roster = {}
+        for char, values in chars:
+            entry = RosterCharacterData()
+            entry.name = f"{values['first_name']} {values['last_name']}"
+            entry.tier = values["tier"]
+            entry.archetype = values["race"].archetype(values["tier"])
+            entry.modifier = values["modifier"]
+            roster[char.key.lower()] = entry
+        rosters[account_id] = roster
+        playable[account_id] = [char for char, _ in chars]
+
+    # Accounts only get `_playable_characters` once a character is added, so it's created where it's missing
+    _set_account_attributes(list(owned), {"roster": rosters, "_playable_characters": playable}, batch_size)
+
+
+def _set_account_attributes(account_ids: list[int], values_by_key: dict, batch_size: int):
+    """
+    Sets Attributes on many accounts at once, updating the ones that exist and creating the rest.
+    :param account_ids: The accounts to set them on
+    :param values_by_key: Maps each Attribute key to a dict of account ids to values
+    :param batch_size: How many rows to write per query
+    """
+    existing = Attribute.objects.filter(accountdb__in=account_ids, db_key__in=values_by_key).annotate(
+        account_id=F("accountdb__id")
+    )
+    updated, missing = [], {(account_id, key) for account_id in account_ids for key in values_by_key}
+    for attribute in existing:
+        attribute.db_value = to_pickle(values_by_key[attribute.db_key][attribute.account_id])
+        updated.append(attribute)
+        missing.discard((attribute.account_id, attribute.db_key))
+    Attribute.objects.bulk_update(updated, ["db_value"], batch_size=batch_size)
+
+    created = [(account_id, Attribute(db_key=key, db_value=to_pickle(values_by_key[key][account_id]),
+                                      db_model="accountdb"))
+               for account_id, key in missing]
+    Attribute.objects.bulk_create([attribute for _, attribute in created], batch_size=batch_size)
+    through = AccountDB.db_attributes.through
+    through.objects.bulk_create(
+        [through(accountdb_id=account_id, attribute_id=attribute.id) for account_id, attribute in created],
+        batch_size=batch_size,
+    )
+
+
+def generate_channels(count: int, accounts: list, rng: random.Random, prefix: str = DEFAULT_PREFIX,
+                      join_chance: float = 0.5, batch_size: int = BATCH_SIZE) -> tuple[list, int]:
+    """
+    Creates channels and subscribes the accounts. Every account joins the `DEFAULT_CHANNELS` that exist, and each new
+    channel is joined with a `join_chance` chance.
+    :param count: How many new channels to create
+    :param accounts: Accounts to subscribe
+    :param rng: Random number generator for picking subscriptions
+    :param prefix: Prefix for the channel names
+    :param join_chance: The chance an account joins each new channel
+    :param batch_size: How many rows to insert per query
+    :return: A tuple of the new channels and how many subscriptions were added
+    """
+    default_keys = [channel["key"] for channel in settings.DEFAULT_CHANNELS]
+    default_channels = list(ChannelDB.objects.filter(db_key__in=default_keys))
+    channels = [create.create_channel(f"{prefix}-{num}", typeclass=settings.BASE_CHANNEL_TYPECLASS)
+                for num in range(count)]
+
+    through = ChannelDB.db_account_subscriptions.through
+    subscriptions = []
+    for account in accounts:
+        joined = default_channels + [channel for channel in channels if rng.random() < join_chance]
+        subscriptions.extend(through(channeldb_id=channel.id, accountdb_id=account.id) for channel in joined)
+    through.objects.bulk_create(subscriptions, batch_size=batch_size, ignore_conflicts=True)
+
+    for channel in default_channels + channels:
+        channel.subscriptions._recache()
+    return channels, len(subscriptions)
+
+
+def generate_world(rooms: int = 0, accounts: int = 0, characters: int = 0, channels: int = 0, seed: int | None = None,
+                   prefix: str = DEFAULT_PREFIX, password: str = DEFAULT_PASSWORD, in_rooms: bool = False,
+                   batch_size: int = BATCH_SIZE) -> WorldSummary:
+    """
+    Generates a synthetic world in one transaction.
+    :param rooms: How many rooms to create
+    :param accounts: How many accounts to create
+    :param characters: How many characters to create across the accounts
+    :param channels: How many channels to create besides the default ones
+    :param seed: Seed for the random details, so the same arguments build the same world
+    :param prefix: Prefix for account and channel names
+    :param password: Password for every account
+    :param in_rooms: If `True`, characters are left standing in rooms instead of being stored offline
+    :param batch_size: How many rows to insert per query
+    :return: A summary of what was created
+    """
+    if not connection.features.can_return_rows_from_bulk_insert:
+        raise RuntimeError("The database backend must return primary keys from bulk inserts to generate a world.")
+
+    rng = random.Random(seed)
+    summary = WorldSummary()
+    with transaction.atomic():
+        summary.rooms, summary.exits = generate_rooms(rooms, rng, batch_size)
+        summary.accounts = generate_accounts(accounts, prefix, password, batch_size)
+        summary.characters = generate_characters(characters, summary.accounts, summary.rooms, rng, in_rooms,
+                                                 batch_size=batch_size)
+        summary.channels, summary.subscriptions = generate_channels(channels, summary.accounts, rng, prefix,
+                                                                    batch_size=batch_size)
+    return summary
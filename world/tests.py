@@ -0,0 +1,122 @@
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from evennia import create_object
+from evennia.accounts.models import AccountDB
+from evennia.objects.models import ObjectDB
+from evennia.utils.test_resources import EvenniaTest
+
+from constants.character import MAX_FEET, MIN_FEET, Race
+from systems.karma.karma import balance
+from systems.login.reservations import name_holder
+from world.archive import export_archive, import_archive
+from world.population import DEFAULT_PASSWORD, generate_world
+
+
+class GenerateWorldTests(EvenniaTest):
+    """This tests the bulk world generator in `world.population`"""
+
+    def setUp(self):
+        super().setUp()
+        self.summary = generate_world(rooms=9, accounts=3, characters=6, channels=2, seed=1)
+
+    def test_rooms_are_connected(self):
+        """Tests that the room grid is linked by exits with aliases"""
+        center = ObjectDB.objects.get(id=self.summary.rooms[4].id)
+        self.assertEqual(sorted(exit_obj.key for exit_obj in center.exits), ["east", "north", "south", "west"])
+        north = next(exit_obj for exit_obj in center.exits if exit_obj.key == "north")
+        self.assertEqual(north.destination.id, self.summary.rooms[1].id)
+        self.assertIn("n", north.aliases.all())
+        self.assertEqual(self.summary.exits, 24)
+
+    def test_accounts_have_rosters(self):
+        """Tests that generated accounts can log in and play their characters"""
+        account = AccountDB.objects.get(id=self.summary.accounts[0].id)
+        self.assertTrue(account.check_password(DEFAULT_PASSWORD))
+        self.assertEqual(len(account.characters.all()), 2)
+        for char in account.characters.all():
+            self.assertTrue(account.is_playable_name(char.key))
+            self.assertTrue(char.access(account, "puppet"))
+        self.assertEqual(balance(account), 0)
+
+    def test_characters_are_finished(self):
+        """Tests that generated characters have valid details and reserved names"""
+        char = ObjectDB.objects.get(id=self.summary.characters[0].id)
+        self.assertIsNone(char.db.chargen_step)
+        self.assertTrue(char.db.race.valid_race_tier(char.db.tier))
+        characters = ObjectDB.objects.filter(id__in=[character.id for character in self.summary.characters])
+        self.assertTrue(all(MIN_FEET <= character.db.feet <= MAX_FEET for character in characters))
+        self.assertEqual(char.key, f"{char.db.first_name}{char.db.last_name}")
+        self.assertIn("player", char.permissions.all())
+        self.assertEqual(name_holder(char.db.first_name, char.db.last_name), char.id)
+        self.assertIsNone(char.location)
+        self.assertIn(char.db.prelogout_location, self.summary.rooms)
+
+    def test_channel_subscriptions(self):
+        """Tests that accounts are subscribed to the generated channels"""
+        subscribers = sum(len(channel.subscriptions.all()) for channel in self.summary.channels)
+        self.assertEqual(subscribers, self.summary.subscriptions)
+
+
+class ArchiveTests(EvenniaTest):
+    """This tests exporting and importing characters and rosters in `world.archive`"""
+
+    def setUp(self):
+        super().setUp()
+        self.summary = generate_world(rooms=1, accounts=2, characters=3, seed=2)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = str(Path(directory.name) / "backup.jsonl.gz")
+
+    def test_export(self):
+        """Tests that every character and roster is written as one compressed line"""
+        # The test's own accounts are exported along with the generated ones, but its characters have no race
+        summary = export_archive(self.path, chunk_size=2)
+        self.assertEqual((summary.characters, summary.rosters), (3, 4))
+        with gzip.open(self.path, "rt") as archive:
+            records = [json.loads(line) for line in archive]
+        self.assertEqual([record["type"] for record in records], ["character"] * 3 + ["roster"] * 4)
+        last = self.summary.characters[1]
+        self.assertEqual(records[-1]["characters"], [
+            {"key": last.key.lower(), "name": f"{last.db.first_name} {last.db.last_name}", "tier": last.db.tier,
+             "archetype": last.db.race.archetype(last.db.tier), "modifier": None}
+        ])
+        char = ObjectDB.objects.get(id=records[2]["id"])
+        self.assertEqual(records[2]["attributes"]["race"], char.db.race.name)
+        self.assertEqual(records[2]["attributes"]["first_name"], char.db.first_name)
+
+    def test_round_trip(self):
+        """Tests that deleted characters come back with their details, names and rosters"""
+        export_archive(self.path)
+        originals = {char.key: (char.db.race, char.db.eyes, char.db_account_id) for char in self.summary.characters}
+        account = AccountDB.objects.get(id=self.summary.accounts[0].id)
+        roster = {key: entry.name for key, entry in account.db.roster.items()}
+        for char in self.summary.characters:
+            char.delete()
+        account.db.roster = {}
+
+        summary = import_archive(self.path, batch_size=2)
+        self.assertEqual((summary.characters, summary.rosters, summary.skipped), (3, 4, 0))
+        for key, (race, eyes, account_id) in originals.items():
+            char = ObjectDB.objects.get(db_key=key)
+            self.assertEqual((char.db.race, char.db.eyes, char.db_account_id), (race, eyes, account_id))
+            self.assertEqual(name_holder(char.db.first_name, char.db.last_name), char.id)
+        self.assertEqual({key: entry.name for key, entry in account.db.roster.items()}, roster)
+        self.assertEqual(sorted(char.key.lower() for char in account.characters.all()), sorted(roster))
+
+        self.assertEqual(import_archive(self.path).skipped, 3)
+
+    def test_round_trip_without_name(self):
+        """Tests that finished characters without names, like staff characters, can be imported"""
+        staffer = create_object(settings.BASE_CHARACTER_TYPECLASS, key="Staffer")
+        staffer.attributes.batch_add(("race", Race.HUMAN), ("tier", 1))
+        staffer.attributes.remove(["first_name", "last_name"])
+        export_archive(self.path)
+        staffer.delete()
+        self.assertEqual(import_archive(self.path).characters, 1)
+        staffer = ObjectDB.objects.get(db_key="Staffer")
+        self.assertEqual((staffer.db.race, staffer.db.tier), (Race.HUMAN, 1))
+        self.assertFalse(staffer.name_reservations.exists())